@@ -0,0 +1,94 @@
+"""Benchmark Quantity construction time and memory.
+
+Compares `units.Quantity`, whose interface is a shared per-type strategy,
+with a replica of the previous design, in which every quantity allocated
+its own interface object holding a weak reference back to the quantity.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import timeit
+import tracemalloc
+from dataclasses import dataclass, is_dataclass
+from typing import Any
+from weakref import ReferenceType, ref
+
+import astropy.units as u
+import numpy as np
+
+import units
+from units._quantity.fields import UnitField
+from units._quantity.interface.funcs import get_interface
+
+# ----------------------------------------------------------------------------
+# Replica of the per-instance interface design.
+
+
+@dataclass(frozen=False, slots=True)
+class LegacyInterface:
+    """Per-quantity interface, with a weak reference back to the quantity."""
+
+    quantity_ref: ReferenceType[Any]
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class LegacyValueField:
+    """Value field building a per-quantity interface."""
+
+    def __get__(self, obj: Any, obj_cls: Any) -> Any:
+        if obj is None:
+            if not is_dataclass(obj_cls) or "value" not in obj_cls.__dataclass_fields__:
+                raise AttributeError
+            return self
+        return obj.interface.value
+
+    def __set__(self, obj: Any, value: Any) -> None:
+        get_interface(value)  # the singledispatch lookup
+        object.__setattr__(obj, "interface", LegacyInterface(ref(obj), value))
+
+
+@dataclass(frozen=True)
+class LegacyQuantity:
+    """Quantity with a per-instance interface."""
+
+    value: Any = LegacyValueField()
+    unit: Any = UnitField()
+
+
+# ----------------------------------------------------------------------------
+
+
+def measure(cls: type, n: int, value: Any, unit: Any) -> tuple[float, float]:
+    """Return the construction time [us] and memory [bytes] per quantity."""
+    time = min(timeit.repeat(lambda: cls(value, unit), number=n, repeat=5)) / n
+
+    gc.collect()
+    tracemalloc.start()
+    keep = [cls(value, unit) for _ in range(n)]
+    memory = tracemalloc.get_traced_memory()[0] / n
+    tracemalloc.stop()
+    del keep
+
+    return time * 1e6, memory
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, default=100_000, help="Quantities to build.")
+    args = parser.parse_args(argv)
+
+    unit = units.Unit(u.km)
+    print(f"{'value':<12} {'design':<8} {'time [us]':>10} {'memory [B]':>11}")
+    for label, value in (("float", 1.0), ("ndarray", np.ones(3))):
+        for design, cls in (("shared", units.Quantity), ("legacy", LegacyQuantity)):
+            time, memory = measure(cls, args.n, value, unit)
+            print(f"{label:<12} {design:<8} {time:>10.3f} {memory:>11.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,71 @@
+"""Benchmark the graph size of conversions of Dask-backed Quantities.
+
+Compares the number of graph layers, and the compute time, after N chained
+conversions (and an addition) with an eager replica that multiplies the
+array at every hop, as `to_unit` did before conversions were deferred.
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any
+
+import dask
+import dask.array as da
+
+import units
+from units._unit.conversion import conversion_factor
+from units._unit.parse import parse_unit
+
+HOPS = ("m", "pc", "kpc", "km")
+
+
+def eager_to_unit(value: Any, unit: Any, target: str) -> tuple[Any, Any]:
+    """Replica of the eager conversion: one multiply per hop."""
+    target_unit = parse_unit(target)
+    return value * conversion_factor(unit, target_unit), target_unit
+
+
+def chained(n: int, size: int, chunks: int) -> dict[str, Any]:
+    """Return the results of ``n`` chained conversions, then an addition."""
+    x = da.ones(size, chunks=chunks)
+    y = da.ones(size, chunks=chunks)
+
+    q = units.Quantity(x, unit="km")
+    for i in range(n):
+        q = q.to_unit(HOPS[i % len(HOPS)])
+    deferred = (q + units.Quantity(y, unit="m")).value
+
+    value, unit = x, parse_unit("km")
+    for i in range(n):
+        value, unit = eager_to_unit(value, unit, HOPS[i % len(HOPS)])
+    eager = value + y * conversion_factor(parse_unit("m"), unit)
+
+    return {"deferred": deferred, "eager": eager}
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("-n", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--chunks", type=int, default=1_000_000)
+    args = parser.parse_args(argv)
+
+    print(f"{'hops':>5} {'design':<9} {'layers':>7} {'tasks':>7} {'compute [s]':>12}")
+    for n in args.n:
+        for design, value in chained(n, args.size, args.chunks).items():
+            graph = value.__dask_graph__()
+            start = time.perf_counter()
+            dask.compute(value, scheduler="threads")
+            elapsed = time.perf_counter() - start
+            print(
+                f"{n:>5} {design:<9} {len(graph.layers):>7} {len(graph):>7}"
+                f" {elapsed:>12.3f}"
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
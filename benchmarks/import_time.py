@@ -0,0 +1,55 @@
+"""Measure the time taken by ``import units``.
+
+Runs ``python -X importtime -c "import units"`` in fresh interpreters and
+reports the best cumulative import time of the ``units`` package, along with
+the slowest modules it pulls in. Pass ``--max-us`` to fail if the import is
+slower than a threshold, e.g. in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import subprocess
+import sys
+
+
+def importtime(statement: str = "import units") -> dict[str, int]:
+    """Return the cumulative import time [us] of each module, from one run."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times: dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of runs.")
+    parser.add_argument("--top", type=int, default=10, help="Modules to list.")
+    parser.add_argument("--max-us", type=int, help="Fail above this time [us].")
+    args = parser.parse_args(argv)
+
+    runs = [importtime() for _ in range(args.repeat)]
+    best = min(runs, key=lambda times: times["units"])
+
+    print(f"import units: {best['units']} us (best of {args.repeat})")
+    for name, cumulative in sorted(best.items(), key=lambda kv: -kv[1])[: args.top]:
+        print(f"  {cumulative:>10} us  {name}")
+
+    if args.max_us is not None and best["units"] > args.max_us:
+        print(f"FAILED: import units took more than {args.max_us} us")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
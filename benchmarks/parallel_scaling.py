@@ -0,0 +1,70 @@
+"""Benchmark the scaling of the multithreaded backend with the number of threads.
+
+Times a unit conversion into a preallocated output, and a cosine, of a
+large NumPy-backed Quantity, with the backend off and with 1 to N threads.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+import units
+from units._quantity import array_namespace
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def best_of(func: Callable[[], Any], repeat: int) -> float:
+    """Return the best wall time of ``repeat`` calls."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--size", type=int, default=100_000_000)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    q = units.Quantity(np.random.default_rng(0).random(args.size), unit="km")
+    angle = units.Quantity(q.value, unit="rad")
+    out = np.empty_like(q.value)
+    ops = {
+        "to_unit_value": lambda: q.to_unit_value("m", out=out),
+        "cos": lambda: array_namespace.cos(angle),
+    }
+
+    backend = units.parallel_backend
+    print(f"{'threads':>8} " + " ".join(f"{name:>14}" for name in ops))
+    serial = {name: best_of(op, args.repeat) for name, op in ops.items()}
+    print(f"{'off':>8} " + " ".join(f"{t:>13.3f}s" for t in serial.values()))
+
+    backend.enabled = True
+    workers = 1
+    while workers <= args.max_workers:
+        backend.max_workers = workers
+        row = []
+        for name, op in ops.items():
+            elapsed = best_of(op, args.repeat)
+            row.append(f"{elapsed:>7.3f}s x{serial[name] / elapsed:>4.1f}")
+        print(f"{workers:>8} " + " ".join(row))
+        workers *= 2
+    backend.enabled = False
+    backend.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
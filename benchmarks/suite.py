@@ -0,0 +1,330 @@
+"""Benchmark suite for the Quantity and Unit hot paths.
+
+Each benchmark times an operation with `units` and its raw equivalent (with
+NumPy, Dask or Astropy), for a range of array sizes, and reports the
+overhead ratio. The ratios are much less machine-dependent than the times,
+so they are what is stored in the baseline and checked against it::
+
+    python benchmarks/suite.py                   # run and print
+    python benchmarks/suite.py --save            # update the baseline
+    python benchmarks/suite.py --check           # fail on regressions
+    python benchmarks/suite.py --sizes 0 100000000 -k to_unit
+
+Size 0 means a Python scalar; benchmarks of array-only operations skip it.
+Benchmarks that don't depend on the size (e.g. unit algebra) run once, as
+"scalar".
+"""
+
+from __future__ import annotations
+
+import argparse
+import fnmatch
+import json
+import timeit
+import warnings
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import astropy.units as u
+import numpy as np
+
+import units
+from units._quantity import array_namespace
+
+BASELINE = Path(__file__).with_name("baseline.json")
+DEFAULT_SIZES = (0, 100, 10_000, 1_000_000)
+FULL_SIZES = (0, 100, 10_000, 1_000_000, 100_000_000)
+
+Setup = Callable[[int], tuple[Callable[[], Any], Callable[[], Any]]]
+
+
+@dataclass(frozen=True)
+class Benchmark:
+    """A benchmark: ``setup(size)`` returns the `units` and raw functions."""
+
+    name: str
+    setup: Setup
+    sized: bool = True
+    scalar: bool = True
+
+
+BENCHMARKS: dict[str, Benchmark] = {}
+
+
+def benchmark(
+    name: str, *, sized: bool = True, scalar: bool = True
+) -> Callable[[Setup], Setup]:
+    """Register a benchmark.
+
+    ``sized=False`` runs it once, as "scalar"; ``scalar=False`` skips size 0.
+    """
+
+    def decorator(setup: Setup) -> Setup:
+        BENCHMARKS[name] = Benchmark(name, setup, sized, scalar)
+        return setup
+
+    return decorator
+
+
+def values(size: int) -> Any:
+    """Get a value of ``size`` elements, or a scalar for size 0."""
+    return 1.5 if size == 0 else np.random.default_rng(0).random(size)
+
+
+# ============================================================================
+# Construction
+
+
+@benchmark("construct.numpy")
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x, unit = values(size), units.parse_unit("km")
+    return (lambda: units.Quantity(x, unit=unit)), (lambda: np.asarray(x))
+
+
+@benchmark("construct.array_api", scalar=False)
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")  # numpy.array_api is experimental
+        from numpy import array_api as xp
+
+    raw = values(size)
+    x, unit = xp.asarray(raw), units.parse_unit("km")
+    # The raw equivalent wraps the NumPy array in a new array-API array.
+    return (lambda: units.Quantity(x, unit=unit)), (lambda: xp.asarray(raw))
+
+
+@benchmark("construct.dask", scalar=False)
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    import dask.array as da
+
+    x = da.from_array(values(size), chunks=1_000_000)
+    unit = units.parse_unit("km")
+    return (lambda: units.Quantity(x, unit=unit)), (lambda: da.asarray(x))
+
+
+# ============================================================================
+# Conversion
+
+
+@benchmark("to_unit")
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x = values(size)
+    q, factor = units.Quantity(x, unit="km"), 1_000.0
+    return (lambda: q.to_unit("m").value), (lambda: x * factor)
+
+
+@benchmark("to_unit_value")
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x = values(size)
+    q, factor = units.Quantity(x, unit="km"), 1_000.0
+    return (lambda: q.to_unit_value("m")), (lambda: x * factor)
+
+
+# ============================================================================
+# Arithmetic
+
+
+@benchmark("add")
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x, y = values(size), values(size)
+    qx, qy = units.Quantity(x, unit="km"), units.Quantity(y, unit="m")
+    return (lambda: qx + qy), (lambda: x + y * 1e-3)
+
+
+@benchmark("multiply")
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x, y = values(size), values(size)
+    qx, qy = units.Quantity(x, unit="km"), units.Quantity(y, unit="s")
+    return (lambda: qx * qy), (lambda: x * y)
+
+
+# ============================================================================
+# Units, dimensions and unit systems
+
+
+@benchmark("unit.algebra", sized=False)
+def _(_size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    km, s, kg = (units.parse_unit(x) for x in ("km", "s", "kg"))
+    return (lambda: km / s * kg), (lambda: u.km / u.s * u.kg)
+
+
+@benchmark("dimension", sized=False)
+def _(_size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    return (lambda: units.Dimension("length")), (lambda: u.get_physical_type("length"))
+
+
+@benchmark("unitsystem", sized=False)
+def _(_size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    base = (u.kpc, u.Myr, u.Msun, u.rad)
+    wrapped = tuple(map(units.Unit, base))
+    return (lambda: units.unitsystem(*wrapped)), (lambda: tuple(map(u.Unit, base)))
+
+
+# ============================================================================
+# Angles and elementwise functions
+
+
+@benchmark("angle.wrap_at")
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x = values(size) * 720
+    angle = units.Angle(x, unit="deg")
+    wrap = units.Quantity(180.0, unit="deg")
+    return (lambda: angle.wrap_at(wrap).value), (
+        lambda: np.mod(x + 180.0, 360.0) - 180.0
+    )
+
+
+@benchmark("cos", scalar=False)
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x = values(size)
+    q = units.Quantity(x, unit="rad")
+    return (lambda: array_namespace.cos(q)), (lambda: np.cos(x))
+
+
+@benchmark("sin", scalar=False)
+def _(size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    x = values(size)
+    q = units.Quantity(x, unit="rad")
+    return (lambda: array_namespace.sin(q)), (lambda: np.sin(x))
+
+
+# ============================================================================
+# Import
+
+
+class _ImportTime:
+    """Callable reporting the best ``-X importtime`` time of a module."""
+
+    def __init__(self, module: str) -> None:
+        self.module = module
+
+    def __call__(self) -> float:
+        from import_time import importtime
+
+        return (
+            min(importtime(f"import {self.module}")[self.module] for _ in range(5))
+            / 1e6
+        )
+
+
+@benchmark("import", sized=False)
+def _(_size: int) -> tuple[Callable[[], Any], Callable[[], Any]]:
+    return _ImportTime("units"), _ImportTime("numpy")
+
+
+# ============================================================================
+
+
+def best_time(func: Callable[[], Any], repeat: int = 3) -> float:
+    """Return the best time [s] of a call."""
+    if isinstance(func, _ImportTime):  # measured in fresh interpreters
+        return func()
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number
+
+
+def size_label(size: int) -> str:
+    """Get the label of a size: "scalar" or the number of elements."""
+    return "scalar" if size == 0 else str(size)
+
+
+def run(
+    benchmarks: list[Benchmark], sizes: tuple[int, ...]
+) -> dict[str, dict[str, dict[str, float]]]:
+    """Run the benchmarks, printing and returning the results."""
+    results: dict[str, dict[str, dict[str, float]]] = {}
+    print(
+        f"{'benchmark':<22} {'size':>10} {'units [s]':>11} {'raw [s]':>11}"
+        f" {'ratio':>8}"
+    )
+    for bench in benchmarks:
+        for size in sizes if bench.sized else (0,):
+            if size == 0 and bench.sized and not bench.scalar:
+                continue
+            func, raw = bench.setup(size)
+            t_units, t_raw = best_time(func), best_time(raw)
+            ratio = t_units / t_raw
+            label = size_label(size)
+            results.setdefault(bench.name, {})[label] = {
+                "units": t_units,
+                "raw": t_raw,
+                "ratio": ratio,
+            }
+            print(
+                f"{bench.name:<22} {label:>10} {t_units:>11.3e} {t_raw:>11.3e}"
+                f" {ratio:>8.2f}"
+            )
+    return results
+
+
+def check(
+    results: dict[str, dict[str, dict[str, float]]],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[str]:
+    """Get the regressions: ratios more than ``threshold`` above the baseline."""
+    regressions = []
+    for name, by_size in results.items():
+        for label, result in by_size.items():
+            expected = baseline["ratios"].get(name, {}).get(label)
+            if expected is not None and result["ratio"] > expected * (1 + threshold):
+                regressions.append(
+                    f"{name} [{label}]: ratio {result['ratio']:.2f}, baseline"
+                    f" {expected:.2f} + {threshold:.0%}"
+                )
+    return regressions
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Run the benchmark suite."""
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("-k", dest="pattern", default="*", help="Name glob.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument(
+        "--full", action="store_true", help=f"Use the sizes {FULL_SIZES}."
+    )
+    parser.add_argument("--baseline", type=Path, default=BASELINE)
+    parser.add_argument("--save", action="store_true", help="Save as the baseline.")
+    parser.add_argument("--check", action="store_true", help="Check the baseline.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        help="Allowed relative increase of a ratio (default: the baseline's).",
+    )
+    args = parser.parse_args(argv)
+
+    selected = [b for n, b in BENCHMARKS.items() if fnmatch.fnmatch(n, args.pattern)]
+    results = run(selected, FULL_SIZES if args.full else tuple(args.sizes))
+
+    status = 0
+    if args.check:
+        baseline = json.loads(args.baseline.read_text())
+        threshold = baseline["threshold"] if args.threshold is None else args.threshold
+        regressions = check(results, baseline, threshold)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        status = 1 if regressions else 0
+
+    if args.save:  # update the baseline with these results
+        baseline = (
+            json.loads(args.baseline.read_text())
+            if args.baseline.exists()
+            else {"threshold": 0.5, "ratios": {}}
+        )
+        if args.threshold is not None:
+            baseline["threshold"] = args.threshold
+        for name, by_size in results.items():
+            baseline["ratios"].setdefault(name, {}).update(
+                {label: round(r["ratio"], 3) for label, r in by_size.items()}
+            )
+        args.baseline.write_text(json.dumps(baseline, indent=2) + "\n")
+    return status
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -38,6 +38,23 @@ def tests(session: nox.Session) -> None:
     session.run("pytest", *session.posargs)
 
 
+@nox.session
+def importtime(session: nox.Session) -> None:
+    """Benchmark ``import units``. Pass "--max-us N" to set a threshold."""
+    session.install(".")
+    session.run("python", "benchmarks/import_time.py", *session.posargs)
+
+
+@nox.session
+def benchmarks(session: nox.Session) -> None:
+    """Run the benchmark suite and check it against the stored baseline.
+
+    Pass "--save" to update the baseline, "--full" for sizes up to 10^8.
+    """
+    session.install(".[dask]")
+    session.run("python", "benchmarks/suite.py", "--check", *session.posargs)
+
+
 @nox.session(reuse_venv=True)
 def docs(session: nox.Session) -> None:
     """Build the docs. Pass "--serve" to serve. Pass "-b linkcheck" to check links."""
@@ -5,13 +5,104 @@ units: Units 2.0
 
 from __future__ import annotations
 
-from . import _dimension, _quantity, _unit
-from ._dimension import *
-from ._quantity import *
-from ._unit import *
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from ._version import version as __version__
 
-__all__ = ["__version__"]
-__all__ += _dimension.__all__
-__all__ += _unit.__all__
-__all__ += _quantity.__all__
+if TYPE_CHECKING:
+    from ._dimension import *
+    from ._quantity import *
+    from ._unit import *
+
+# The public names are loaded from their subpackage on first access (PEP 562),
+# so that ``import units`` does not import astropy, numpy or the array
+# interfaces. Later subpackages shadow earlier ones, as with star-imports.
+_LAZY_ATTRS: dict[str, str] = {
+    **dict.fromkeys(
+        (
+            "Dimension",
+            "DimensionSystem",
+            "dimensionless",
+            "length",
+            "mass",
+            "speed",
+            "time",
+            "angle",
+            "dimensionless_system",
+            "ltma_system",
+            "ltmav_system",
+        ),
+        "_dimension",
+    ),
+    **dict.fromkeys(
+        (
+            "Unit",
+            "unit_algebra_cache",
+            "conversion_factor",
+            "conversion_cache",
+            "parse_unit",
+            "parse_units",
+            "unit_parse_cache",
+            "AbstractUnitSystem",
+            "UNITSYSTEMS_REGISTRY",
+            "unitsystem",
+            "unitsystem_cache",
+            "DimensionlessUnitSystem",
+            "LTMAUnitSystem",
+            "LTMAVUnitSystem",
+            "dimensionless",
+            "galactic",
+            "solarsystem",
+        ),
+        "_unit",
+    ),
+    **dict.fromkeys(
+        (
+            "array_namespace",
+            "AbstractQuantity",
+            "Quantity",
+            "AbstractAngle",
+            "Angle",
+            "Longitude",
+            "Latitude",
+            "result_unit",
+            "register_result_unit",
+            "result_unit_cache",
+            "ValueField",
+            "UnitField",
+            "LazyQuantity",
+            "ColumnarQuantity",
+            "save",
+            "load",
+            "open_memmap",
+            "convert_stream",
+            "aconvert_stream",
+            "parallel_backend",
+            "SharedQuantity",
+            "SharedQuantityHandle",
+            "shared_quantity",
+            "shared_map",
+        ),
+        "_quantity",
+    ),
+}
+
+# The names are the keys of _LAZY_ATTRS, so that the two can't diverge.
+__all__ = ["__version__", *_LAZY_ATTRS]  # noqa: PLE0604
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_ATTRS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
+
+    value = getattr(import_module(f"{__name__}.{module}"), name)
+    globals()[name] = value  # cache, so __getattr__ isn't called again
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -5,11 +5,13 @@ from __future__ import annotations
 __all__ = ["Dimension"]
 
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import cached_property
 from typing import final
 
-from astropy.units import PhysicalType, get_physical_type
+from astropy.units import PhysicalType, UnitBase, get_physical_type
 
+from units import diagnostics
 from units.api import Dimension as DimensionAPI
 from units.api._wrapper import Wrapper
 
@@ -19,33 +21,68 @@ _DIMENSIONS_CACHE: dict[str, Dimension] = {}
 
 
 @final
-@dataclass(frozen=True)
+@dataclass(frozen=True, eq=False)
 class Dimension(DimensionAPI, Wrapper[PhysicalType]):
     """A dimension.
 
+    Dimensions are interned: there is one instance per name, so equality is
+    an identity check. The astropy physical type is resolved on first use.
+
     .. todo::
 
         Remove the ``Wrapper`` when merge into Astropy.
     """
 
     name: str
+    _hash: int = field(init=False, repr=False)
 
     def __new__(cls, name: str | PhysicalType | Dimension, /) -> Dimension:
         # Dimension is a singleton based on the name, so we cache it.
-        name_ = name if isinstance(name, str) else get_dimension_name(name)
-        if name_ in _DIMENSIONS_CACHE:
+        if isinstance(name, str):
+            name_ = name
+        elif isinstance(name, Dimension):
+            return name
+        else:
+            name_ = get_dimension_name(name)
+        try:
             return _DIMENSIONS_CACHE[name_]
-        return super().__new__(cls)
+        except KeyError:
+            pass
+
+        if diagnostics.active:
+            diagnostics.count("created", "Dimension")
+        self = super().__new__(cls)
+        object.__setattr__(self, "name", name_)
+        object.__setattr__(self, "_hash", hash(name_))
+        return _DIMENSIONS_CACHE.setdefault(name_, self)
 
     def __init__(self, name: str | PhysicalType | Dimension, /) -> None:
-        object.__setattr__(  # TODO: this with `converter` arg to `field`
-            self, "name", name if isinstance(name, str) else get_dimension_name(name)
-        )
-        object.__setattr__(self, "_wrapped", get_physical_type(self.name))
+        # Everything is set in ``__new__``, so that interned instances are
+        # not re-initialized.
+        pass
 
-    @property
+    def __reduce__(self) -> tuple[type[Dimension], tuple[str]]:
+        return (type(self), (self.name,))
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Dimension):
+            return NotImplemented
+        return self.name == other.name
+
+    @cached_property
     def _wrapped_(self) -> PhysicalType:
-        return self._wrapped
+        return get_physical_type(self.name)
+
+    @property
+    def si_unit(self) -> UnitBase:
+        """The SI unit of the dimension, e.g. ``m / s`` for speed."""
+        # Astropy has no public accessor for the unit of a physical type.
+        return self._wrapped_._unit  # type: ignore[no-any-return]
 
 
 @get_dimension_name.register
@@ -1,10 +1,29 @@
 """Quantity module."""
 
-from . import angle, array_namespace, base, core, fields, up
+from . import (
+    angle,
+    array_namespace,
+    base,
+    columnar,
+    core,
+    fields,
+    lazy,
+    npy,
+    parallel,
+    shared,
+    stream,
+    up,
+)
 from .angle import *
 from .base import *
+from .columnar import *
 from .core import *
 from .fields import *
+from .lazy import *
+from .npy import *
+from .parallel import *
+from .shared import *
+from .stream import *
 from .up import *
 
 __all__ = ["array_namespace"]
@@ -13,3 +32,9 @@ __all__ += core.__all__
 __all__ += angle.__all__
 __all__ += up.__all__
 __all__ += fields.__all__
+__all__ += lazy.__all__
+__all__ += columnar.__all__
+__all__ += npy.__all__
+__all__ += stream.__all__
+__all__ += parallel.__all__
+__all__ += shared.__all__
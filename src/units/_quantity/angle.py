@@ -7,13 +7,14 @@ from typing import cast, final
 
 import astropy.units as u
 
-from units._dimension.core import Dimension
 from units._unit.core import Unit
 
 from .base import AbstractQuantity, Array
 from .core import Quantity
 from .fields import UnitField, ValueField
 
+_radian = Unit(u.rad)
+
 
 @dataclass(frozen=True)
 class AbstractAngle(AbstractQuantity[Array]):
@@ -24,10 +25,10 @@ class AbstractAngle(AbstractQuantity[Array]):
     def __post_init__(self) -> None:
         super().__post_init__()
 
-        if self.unit.dimensions != Dimension("angle"):
+        if not self.unit.is_equivalent(_radian):
             msg = f"Angle must have angular units, not {self.unit}"
             raise ValueError(msg)
-        if self.wrap_angle.unit.dimensions != Dimension("angle"):
+        if not self.wrap_angle.unit.is_equivalent(_radian):
             msg = f"wrap angle must have angular units, not {self.wrap_angle.unit}"
             raise ValueError(msg)
 
@@ -67,7 +68,7 @@ default_wrap_angle = Quantity[float](360, unit=Unit(u.deg))
 
 
 @final
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True)
 class Angle(AbstractAngle[Array]):
     """Angle."""
 
@@ -77,7 +78,7 @@ class Angle(AbstractAngle[Array]):
 
 
 @final
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True)
 class Longitude(AbstractAngle[Array]):
     """Longitude."""
 
@@ -87,7 +88,7 @@ class Longitude(AbstractAngle[Array]):
 
 
 @final
-@dataclass(frozen=True, slots=True)
+@dataclass(frozen=True)
 class Latitude(AbstractAngle[Array]):
     """Latitude."""
 
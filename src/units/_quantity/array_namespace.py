@@ -2,11 +2,12 @@ from __future__ import annotations
 
 __all__ = ["get_wrapped_namespace", "cos", "sin"]
 
-from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
+import numpy as np
 from astropy.units import rad as _apy_rad
 
+from units._quantity.parallel import parallel_backend
 from units._quantity.up import result_unit
 from units._unit.core import Unit
 
@@ -52,17 +53,25 @@ def get_wrapped_namespace(
 _rad = Unit(_apy_rad)
 
 
+def _elementwise(name: str, value: Any, xp: ArrayAPINamespace, /) -> Any:
+    """Apply an elementwise function, in parallel if large enough."""
+    result = parallel_backend.apply(getattr(np, name), value)
+    return getattr(xp, name)(value) if result is None else result
+
+
 def cos(x: Any, /, *, _xp: ArrayAPINamespace | None = None) -> Any:
     """Cosine."""
+    from units._quantity.ufuncs import _wrap
+
     xp = get_wrapped_namespace(x) if _xp is None else _xp
-    return replace(
-        x, value=xp.cos(x.to_unit_value(_rad)), unit=result_unit("cos", x.unit)
-    )
+    value = _elementwise("cos", x.to_unit_value(_rad), xp)
+    return _wrap(x, value, result_unit("cos", x.unit))
 
 
 def sin(x: Any, /, *, _xp: ArrayAPINamespace | None = None) -> Any:
     """Sine."""
+    from units._quantity.ufuncs import _wrap
+
     xp = get_wrapped_namespace(x) if _xp is None else _xp
-    return replace(
-        x, value=xp.sin(x.to_unit_value(_rad)), unit=result_unit("sin", x.unit)
-    )
+    value = _elementwise("sin", x.to_unit_value(_rad), xp)
+    return _wrap(x, value, result_unit("sin", x.unit))
@@ -3,14 +3,16 @@ from __future__ import annotations
 __all__ = ["AbstractQuantity"]
 
 from abc import ABCMeta
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar
+from dataclasses import dataclass, fields
+from functools import partial
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, cast
 
-import numpy as np
 from array_api import Array as ArrayAPI, ArrayAPINamespace
 from mypy_extensions import trait
 
-from units._unit.core import Unit
+from units import diagnostics
+from units._quantity.interface.funcs import lookup_interface
+from units._unit.parse import parse_unit
 
 from . import array_namespace
 
@@ -20,15 +22,29 @@ if TYPE_CHECKING:
     from typing_extensions import Self
 
     from units._quantity.interface import AbstractQuantityInterface
+    from units._quantity.lazy import LazyQuantity
+    from units._unit.core import Unit
     from units.api import Quantity as QuantityAPI
 
 
 Array = TypeVar("Array", bound=ArrayAPI)
 
+_INTERNAL_ATTRS = frozenset(("_value", "_pending", "_unit", "interface"))
+
+_SHAPE_ATTRS = frozenset(("shape", "ndim", "size"))
+"""Attributes of the value that scaling doesn't change."""
+
 
 #####################################################################
 
 
+def _reconstruct(
+    cls: type[AbstractQuantity[Array]], value: Any, unit: Unit, kwargs: dict[str, Any]
+) -> AbstractQuantity[Array]:
+    """Rebuild a pickled Quantity."""
+    return cls(value, unit=unit, **kwargs)  # type: ignore[call-arg]
+
+
 @trait
 class NumPyMixin(Protocol):  # TODO: proper type hints
     """Mixin for NumPy NEP13,18-style overloading."""
@@ -36,13 +52,9 @@ class NumPyMixin(Protocol):  # TODO: proper type hints
     def __array_ufunc__(
         self: ArrayAPI, ufunc: Any, method: Any, *inputs: Any, **kwargs: Any
     ) -> Any:
-        if method != "__call__":
-            # TODO: dispatch to something other than `xp`
-            return NotImplemented
+        from units._quantity.ufuncs import array_ufunc
 
-        xp = self.__array_namespace__()
-        func = getattr(xp, ufunc.__name__)
-        return func(*inputs, **kwargs, _xp=np)  # TODO: allow general xp
+        return array_ufunc(self, ufunc, method, *inputs, **kwargs)
 
     def __array_function__(
         self: ArrayAPI,
@@ -51,9 +63,9 @@ class NumPyMixin(Protocol):  # TODO: proper type hints
         args: tuple[Any, ...],
         kwargs: dict[str, Any],
     ) -> Any:
-        xp = self.__array_namespace__()
-        func = getattr(xp, func.__name__)
-        return func(*args, **kwargs, _xp=np)  # TODO: allow general xp
+        from units._quantity.functions import array_function
+
+        return array_function(func, args, kwargs)
 
 
 # ======================================================================
@@ -94,33 +106,109 @@ class AbstractQuantity(
     unit: Unit
 
     def __post_init__(self) -> None:
-        self.interface: AbstractQuantityInterface[Array]
-        return  # just for super.
+        if diagnostics.active:
+            diagnostics.count("created", type(self).__name__)
+
+    @property
+    def interface(self) -> AbstractQuantityInterface[Array]:
+        """Interface to the value, shared by all values of its type."""
+        # Look at the unscaled value, so that a deferred view isn't applied.
+        pending = self.__dict__.get("_pending")
+        return lookup_interface(self._value if pending is None else pending.value)
 
     # --- Wrapper API ---
 
     @property
-    def _wrapped_(self: Self) -> AbstractQuantityInterface[Array]:
+    def _wrapped_(self: Self) -> Array:
         """Wrapped."""
-        return self.interface
+        return self.value
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(self.interface, name)
+        # Only called for missing attributes. If the internal ones are
+        # missing, the quantity is not (yet) initialized.
+        if name in _INTERNAL_ATTRS:
+            raise AttributeError(name)
+        # The metadata of a deferred view is that of its unscaled value, so
+        # reading it doesn't apply the factor.
+        pending = self.__dict__.get("_pending")
+        if pending is not None and name in _SHAPE_ATTRS:
+            return getattr(pending.value, name)
+        if pending is not None and name == "dtype":
+            xp = self.interface.__wrapped_array_namespace__()
+            return xp.result_type(pending.value.dtype, pending.factor)
+        # The interface's quantity methods are bound to the quantity, e.g.
+        # ``to_dask_array``. Everything else is forwarded to the value.
+        interface = self.interface
+        if name in interface.quantity_methods:
+            return partial(getattr(interface, name), self)
+        return getattr(self.value, name)
+
+    # --- Pickling ---
+
+    def __reduce_ex__(self, protocol: Any) -> tuple[Any, ...]:
+        # The value is pickled by itself, so with protocol 5 arrays that
+        # support it (e.g. NumPy's) are sent out-of-band as a `PickleBuffer`,
+        # without copying. A deferred view is pickled unscaled, with its
+        # factor. The unit is pickled as its string.
+        pending = self.__dict__.get("_pending")
+        value = self.value if pending is None else pending
+        kwargs = {
+            f.name: getattr(self, f.name)
+            for f in fields(self)
+            if f.init and f.name not in ("value", "unit")
+        }
+        return (_reconstruct, (type(self), value, self.unit, kwargs))
 
     # ==========================================================================
     # Quantity API
 
-    def to_unit(self, unit: Unit | str) -> AbstractQuantity[Array]:
-        """Convert to a new unit."""
-        return self.interface.to_unit(
-            Unit(unit) if not isinstance(unit, Unit) else unit
-        )
+    def to_unit(
+        self, unit: Unit | str, *, copy: bool = True, out: Array | None = None
+    ) -> AbstractQuantity[Array]:
+        """Convert to a new unit.
+
+        Unless ``out`` is given, the result is a view that records the
+        conversion factor and applies it when its value is first read.
+        Successive conversions compose into a single factor.
+
+        Parameters
+        ----------
+        unit : Unit or str
+            The unit to convert to.
+        copy : bool, optional keyword-only
+            If `False`, the value is not copied when no conversion is needed.
+        out : Array, optional keyword-only
+            Buffer to write the converted value into.
+
+        """
+        return self.interface.to_unit(self, parse_unit(unit), copy=copy, out=out)
+
+    def to_unit_value(self, unit: Unit | str, *, out: Array | None = None) -> Array:
+        """Convert to a unit and return the value.
+
+        Parameters
+        ----------
+        unit : Unit or str
+            The unit to convert to.
+        out : Array, optional keyword-only
+            Buffer to write the converted value into. If not given and no
+            conversion is needed, the value itself is returned.
+
+        """
+        return self.interface.to_unit_value(self, parse_unit(unit), out=out)
+
+    def lazy(self) -> LazyQuantity[Array]:
+        """Start a lazy expression.
+
+        Arithmetic on the result builds an expression, with the units
+        resolved immediately, that is evaluated in one pass by
+        ``.compute()``.
+        """
+        from units._quantity.fields import deferred_value
+        from units._quantity.lazy import LazyQuantity, Leaf, _scale
 
-    def to_unit_value(self, unit: Unit | str) -> Array:
-        """Convert to a unit and return the value."""
-        return self.interface.to_unit_value(
-            Unit(unit) if not isinstance(unit, Unit) else unit
-        )
+        value, factor = deferred_value(self)  # fold a pending factor
+        return LazyQuantity(_scale(Leaf(value), factor), self.unit)
 
     # ==========================================================================
     # Array API
@@ -134,16 +222,33 @@ class AbstractQuantity(
     # --- Arithmetic ---
 
     def __add__(self, other: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
-        return self.interface + other
+        return self.interface.add(self, other)
 
     def __sub__(self, other: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
-        return self.interface - other
+        return self.interface.subtract(self, other)
 
     def __mul__(self, other: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
-        return self.interface * other
+        return self.interface.multiply(self, other)
 
     def __truediv__(self, other: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
-        return self.interface / other
+        return self.interface.divide(self, other)
 
     def __pow__(self, other: Number) -> AbstractQuantity[Array]:
-        return self.interface**other
+        return self.interface.power(self, other)
+
+    # --- In-place arithmetic ---
+    # The value's buffer is reused when the interface supports it, the unit
+    # doesn't change and the quantity owns the value. Otherwise the result
+    # is a new quantity.
+
+    def __iadd__(self, other: AbstractQuantity[Array]) -> Self:
+        return cast("Self", self.interface.iadd(self, other))
+
+    def __isub__(self, other: AbstractQuantity[Array]) -> Self:
+        return cast("Self", self.interface.isubtract(self, other))
+
+    def __imul__(self, other: AbstractQuantity[Array]) -> Self:
+        return cast("Self", self.interface.imultiply(self, other))
+
+    def __itruediv__(self, other: AbstractQuantity[Array]) -> Self:
+        return cast("Self", self.interface.idivide(self, other))
@@ -0,0 +1,162 @@
+"""Quantities with a unit per column."""
+
+from __future__ import annotations
+
+__all__ = ["ColumnarQuantity"]
+
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from units._unit.conversion import conversion_factor
+from units._unit.parse import parse_unit
+from units._unit.system.base import AbstractUnitSystem
+
+from .core import Quantity
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from units._unit.core import Unit
+
+Frame = TypeVar("Frame")
+
+
+def _scale_columns(frame: Any, factors: Mapping[Any, float], /) -> Any:
+    """Multiply columns of a (pandas) DataFrame by their factors."""
+    out = frame.copy(deep=False)
+    for column, factor in factors.items():
+        out[column] = frame[column] * factor
+    return out
+
+
+@dataclass(frozen=True)
+class ColumnarQuantity(Generic[Frame]):
+    """A DataFrame with a unit per column.
+
+    Works with pandas and Dask DataFrames. Columns without a unit are carried
+    along unconverted.
+
+    Parameters
+    ----------
+    value : DataFrame
+        The data.
+    units : Mapping[column, Unit | str]
+        The unit of each column with one.
+
+    Examples
+    --------
+    >>> import pandas as pd
+    >>> import units
+    >>> cat = units.ColumnarQuantity(
+    ...     pd.DataFrame({"x": [1.0, 2.0], "v": [10.0, 20.0]}),
+    ...     {"x": "pc", "v": "km / s"},
+    ... )
+    >>> cat.to_unit({"x": "kpc"}).units["x"]
+    Unit("kpc")
+
+    """
+
+    value: Frame
+    units: Mapping[Any, Unit] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        units = {column: parse_unit(unit) for column, unit in self.units.items()}
+        missing = set(units).difference(self.columns)
+        if missing:
+            msg = f"units given for columns not in the frame: {sorted(missing)}"
+            raise ValueError(msg)
+        object.__setattr__(self, "units", MappingProxyType(units))
+
+    @property
+    def columns(self) -> Any:
+        """The columns of the frame."""
+        return self.value.columns  # type: ignore[attr-defined]
+
+    # --- Projection and selection ---
+
+    def __getitem__(self, key: Any) -> Any:
+        """Get a column, a projection or a row selection.
+
+        A column name gives a `~units.Quantity` of that column (a Dask
+        Series, or for pandas the column's NumPy array). A list of
+        names gives a `ColumnarQuantity` of those columns. Anything else,
+        e.g. a boolean mask, selects rows and keeps all the units.
+        """
+        frame: Any = self.value
+        if isinstance(key, list):
+            units = {k: self.units[k] for k in key if k in self.units}
+            return replace(self, value=frame[key], units=units)
+        if not hasattr(key, "__len__") or isinstance(key, str):
+            # A column
+            column = frame[key]
+            if key not in self.units:
+                return column
+            if not hasattr(column, "map_partitions"):  # pandas
+                column = column.to_numpy()
+            return Quantity(column, unit=self.units[key])
+        return replace(self, value=frame[key], units=self.units)
+
+    # --- Conversion ---
+
+    def _factors(
+        self, target: Mapping[Any, Unit | str] | AbstractUnitSystem, /
+    ) -> tuple[dict[Any, float], dict[Any, Unit]]:
+        """Get the conversion factor (if not 1) and new unit of each column."""
+        if isinstance(target, AbstractUnitSystem):
+            targets = {column: target[unit] for column, unit in self.units.items()}
+        else:
+            targets = {column: parse_unit(unit) for column, unit in target.items()}
+            missing = set(targets).difference(self.units)
+            if missing:
+                msg = f"columns without units: {sorted(missing)}"
+                raise ValueError(msg)
+
+        factors = {}
+        for column, unit in targets.items():
+            factor = conversion_factor(self.units[column], unit)
+            if factor != 1:
+                factors[column] = factor
+        return factors, {**self.units, **targets}
+
+    def _scaled(self, factors: Mapping[Any, float], /) -> Frame:
+        frame: Any = self.value
+        if not factors:
+            return frame
+        if hasattr(frame, "map_partitions"):  # Dask, one pass per partition
+            meta = _scale_columns(frame._meta, factors)
+            return frame.map_partitions(  # type: ignore[no-any-return]
+                _scale_columns, factors, meta=meta
+            )
+        return _scale_columns(frame, factors)  # type: ignore[no-any-return]
+
+    def to_unit(
+        self, target: Mapping[Any, Unit | str] | AbstractUnitSystem
+    ) -> ColumnarQuantity[Frame]:
+        """Convert columns to new units.
+
+        All columns are converted in a single pass over the data (per
+        partition, for Dask), and not at all if no conversion is needed.
+
+        Parameters
+        ----------
+        target : Mapping[column, Unit | str] or AbstractUnitSystem
+            The unit of each column to convert, or a unit system to convert
+            all the columns with units to.
+
+        Returns
+        -------
+        ColumnarQuantity
+            The converted quantity.
+
+        """
+        factors, units = self._factors(target)
+        if not factors and units == dict(self.units):
+            return self
+        return replace(self, value=self._scaled(factors), units=units)
+
+    def to_unit_value(
+        self, target: Mapping[Any, Unit | str] | AbstractUnitSystem
+    ) -> Frame:
+        """Convert columns to new units and return the frame."""
+        return self._scaled(self._factors(target)[0])
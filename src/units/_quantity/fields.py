@@ -4,18 +4,17 @@ __all__ = ["ValueField", "UnitField"]
 
 from dataclasses import dataclass, is_dataclass
 from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast, overload
-from weakref import ref
 
 from array_api import Array as ArrayAPI
-from astropy.units import Unit as APYUnit
 
-from units._quantity.interface.funcs import get_interface
-from units._unit.core import Unit
+from units import diagnostics
+from units._quantity.interface.funcs import lookup_interface
+from units._unit.parse import parse_unit
 
 if TYPE_CHECKING:
     from typing_extensions import Self
 
-    from units._quantity.interface.base import AbstractQuantityInterface
+    from units._unit.core import Unit
 
     from .base import AbstractQuantity
 
@@ -24,11 +23,36 @@ Array = TypeVar("Array", bound=ArrayAPI)
 #####################################################################
 
 
+@dataclass(frozen=True, slots=True)
+class Deferred(Generic[Array]):
+    """A value with a pending conversion factor.
+
+    Passing this as the value of a quantity makes a view of ``value`` that
+    is only scaled by ``factor`` when the quantity's value is first read.
+    """
+
+    value: Array
+    factor: float
+
+
+def deferred_value(obj: AbstractQuantity[Array], /) -> tuple[Array, float]:
+    """Get the unscaled value of a quantity and its pending factor.
+
+    The factor is 1 if the quantity is not a deferred view, or has already
+    been read.
+    """
+    pending = obj.__dict__.get("_pending")
+    if pending is None:
+        return obj.value, 1.0
+    return pending.value, pending.factor
+
+
 @dataclass(frozen=True, slots=True)
 class ValueField(Generic[Array]):
     """Value field descriptor.
 
-    Builds the Interface object.
+    Checks that the value has an interface, and applies the factor of a
+    `Deferred` value when it is first read.
     """
 
     @overload
@@ -51,13 +75,31 @@ class ValueField(Generic[Array]):
             return self
 
         # Get from instance
-        return obj.interface.value
+        attrs = obj.__dict__
+        pending = attrs.get("_pending")
+        if pending is None:
+            # The value is handed out, so it can't be written in place.
+            attrs.pop("_owns_value", None)
+            return cast("Array", obj._value)
+
+        # Apply the pending factor. ``_value`` is set before ``_pending`` is
+        # removed, so a concurrent read sees one or the other.
+        interface = lookup_interface(pending.value)
+        if diagnostics.active:
+            value = diagnostics.scale(interface, pending.value, pending.factor)
+        else:
+            value = interface.scale(pending.value, pending.factor)
+        attrs["_value"] = value
+        attrs.pop("_pending", None)
+        return cast("Array", value)
 
     def __set__(self, obj: AbstractQuantity[Array], value: Array) -> None:
-        interface: type[AbstractQuantityInterface[Array]] = get_interface(value)
-        object.__setattr__(
-            obj, "interface", interface(ref(obj), value)  # pylint: disable=not-callable
-        )
+        if isinstance(value, Deferred):
+            lookup_interface(value.value)  # raises a TypeError if no interface
+            object.__setattr__(obj, "_pending", value)
+            return
+        lookup_interface(value)  # raises a TypeError if there is no interface
+        object.__setattr__(obj, "_value", value)
 
 
 @dataclass(frozen=True)
@@ -81,9 +123,7 @@ class UnitField:
                 raise AttributeError
             return self
 
-        return cast(Unit, obj._unit)
+        return cast("Unit", obj._unit)
 
     def __set__(self, obj: AbstractQuantity[Array], unit: Unit | str) -> None:
-        if not isinstance(unit, Unit):
-            unit = Unit(APYUnit(unit))
-        object.__setattr__(obj, "_unit", unit)
+        object.__setattr__(obj, "_unit", parse_unit(unit))
@@ -0,0 +1,185 @@
+"""NumPy function support for Quantities.
+
+Supported functions convert their Quantity arguments to the unit of the
+first one, run on the plain values and attach the result unit. Other
+functions are not overridden, so NumPy raises a `TypeError` for them.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+import inspect
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from units._quantity.up import dimensionless
+from units.api import Quantity as QuantityAPI
+
+from .ufuncs import _wrap, _wrap_out
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from units._quantity.base import AbstractQuantity
+    from units._unit.core import Unit
+
+
+def _first_quantity(x: Any, /) -> AbstractQuantity[Any] | None:
+    if isinstance(x, QuantityAPI):
+        return x  # type: ignore[return-value]
+    if isinstance(x, list | tuple):
+        return next((q for q in x if isinstance(q, QuantityAPI)), None)  # type: ignore[return-value]
+    return None
+
+
+def _plain(x: Any, unit: Unit, /) -> Any:
+    """Convert Quantities, also in lists and tuples, to values in ``unit``.
+
+    Plain values are assumed to already be in ``unit``.
+    """
+    if isinstance(x, QuantityAPI):
+        return x.to_unit_value(unit)
+    if isinstance(x, list | tuple):
+        return type(x)(_plain(y, unit) for y in x)
+    return x
+
+
+def _apply(
+    func: Callable[..., Any],
+    args: tuple[Any, ...],
+    kwargs: dict[str, Any],
+    /,
+    *,
+    power: int = 1,
+    unitless: bool = False,
+    require_dimensionless: bool = False,
+) -> Any:
+    template = _first_quantity(args[0]) if args else None
+    if template is None:
+        return NotImplemented
+    unit = template.unit
+    if require_dimensionless and not unit.is_equivalent(dimensionless):
+        msg = f"{func.__name__} requires a dimensionless Quantity."
+        raise ValueError(msg)
+    if require_dimensionless:
+        unit = dimensionless
+
+    out = kwargs.pop("out", None)
+    kwargs = {k: _plain(v, unit) for k, v in kwargs.items()}
+    if out is not None:
+        kwargs["out"] = out.value if isinstance(out, QuantityAPI) else out
+    result = func(*(_plain(arg, unit) for arg in args), **kwargs)
+
+    result_unit = None if unitless else unit**power if power != 1 else unit
+    if out is None:
+        return _wrap(template, result, result_unit)
+    return _wrap_out(template, result, result_unit, out)
+
+
+def _average(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any], /
+) -> Any:
+    # The weights can have any unit, since it cancels. With ``returned``,
+    # the sum of the weights is also returned, in their unit.
+    params = (bound := inspect.signature(func).bind(*args, **kwargs)).arguments
+    a, weights = params["a"], params.get("weights")
+    params["a"] = a.value if isinstance(a, QuantityAPI) else a
+    if isinstance(weights, QuantityAPI):
+        params["weights"] = weights.value
+    result = func(*bound.args, **bound.kwargs)
+
+    def wrap(template: Any, value: Any) -> Any:
+        if not isinstance(template, QuantityAPI):
+            return value
+        return _wrap(template, value, template.unit)
+
+    if params.get("returned", False):
+        average, total = result
+        return wrap(a, average), wrap(weights, total)
+    return wrap(a, result)
+
+
+_square = partial(_apply, power=2)
+_unitless = partial(_apply, unitless=True)
+_dimensionless = partial(_apply, require_dimensionless=True)
+
+ARRAY_FUNCTIONS: dict[Callable[..., Any], Callable[..., Any]] = {
+    **dict.fromkeys(
+        (
+            np.sum,
+            np.nansum,
+            np.cumsum,
+            np.nancumsum,
+            np.mean,
+            np.nanmean,
+            np.median,
+            np.nanmedian,
+            np.std,
+            np.nanstd,
+            np.min,
+            np.max,
+            np.amin,
+            np.amax,
+            np.nanmin,
+            np.nanmax,
+            np.ptp,
+            np.percentile,
+            np.nanpercentile,
+            np.quantile,
+            np.nanquantile,
+            np.round,
+            np.around,
+            np.clip,
+            np.diff,
+            np.sort,
+            np.concatenate,
+            np.stack,
+            np.hstack,
+            np.vstack,
+            np.copy,
+            np.reshape,
+            np.ravel,
+            np.transpose,
+            np.squeeze,
+            np.broadcast_to,
+            np.linalg.norm,
+        ),
+        _apply,
+    ),
+    np.average: _average,
+    **dict.fromkeys((np.var, np.nanvar), _square),
+    **dict.fromkeys(
+        (
+            np.argmin,
+            np.argmax,
+            np.argsort,
+            np.nonzero,
+            np.count_nonzero,
+            np.shape,
+            np.ndim,
+            np.size,
+            np.isclose,
+            np.allclose,
+            np.array_equal,
+        ),
+        _unitless,
+    ),
+    **dict.fromkeys((np.prod, np.cumprod, np.nanprod, np.nancumprod), _dimensionless),
+}
+"""Handlers of the supported NumPy functions."""
+
+
+def array_function(
+    func: Callable[..., Any], args: tuple[Any, ...], kwargs: dict[str, Any], /
+) -> Any:
+    """Apply a NumPy function to Quantities.
+
+    Returns `NotImplemented` for unsupported functions.
+    """
+    handler = ARRAY_FUNCTIONS.get(func)
+    if handler is None:
+        return NotImplemented
+    return handler(func, args, kwargs)
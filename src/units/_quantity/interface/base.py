@@ -2,21 +2,23 @@ from __future__ import annotations
 
 __all__ = ["AbstractQuantityInterface"]
 
+import warnings
 from abc import ABCMeta, abstractmethod
 from dataclasses import dataclass, replace
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
-from weakref import ReferenceType  # noqa: TCH003
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar, cast
 
 from array_api import Array as ArrayAPI, ArrayAPINamespace
 
-from units._quantity import array_namespace
-from units._quantity.base import AbstractQuantity, NumPyMixin
-from units._quantity.interface.funcs import get_interface
+from units import diagnostics
+from units._quantity.fields import Deferred, deferred_value
+from units._quantity.interface.funcs import _INTERFACE_CACHE, get_interface
+from units._unit.conversion import conversion_factor
 from units.api import Quantity as QuantityAPI
 
 if TYPE_CHECKING:
     from numbers import Number
 
+    from units._quantity.base import AbstractQuantity
     from units._unit.core import Unit
 
 Array = TypeVar("Array", bound=ArrayAPI)
@@ -25,7 +27,7 @@ T = TypeVar("T")
 
 @dataclass(frozen=True)
 class Registrant(Generic[T]):
-    """Registrant."""
+    """Registrant, returning the registered interface class."""
 
     value: type[T]
 
@@ -33,12 +35,47 @@ class Registrant(Generic[T]):
         return self.value
 
 
-@dataclass(frozen=False, slots=True)
-class AbstractQuantityInterface(NumPyMixin, Generic[Array], metaclass=ABCMeta):
-    """Interface for Quantity <-> Array."""
-
-    quantity_ref: ReferenceType[AbstractQuantity[Array]]
-    value: Array
+_DEPRECATED_METHODS = {
+    "__add__": "add",
+    "__sub__": "subtract",
+    "__mul__": "multiply",
+    "__truediv__": "divide",
+    "__pow__": "power",
+}
+"""The arithmetic methods of interfaces that were bound to a quantity."""
+
+
+@dataclass(frozen=True, slots=True)
+class AbstractQuantityInterface(Generic[Array], metaclass=ABCMeta):
+    """Interface for Quantity <-> Array.
+
+    An interface is a stateless strategy for one family of array types.
+    There is a single shared instance per interface class, and every method
+    takes the quantity it acts on, so quantities don't carry an interface
+    object of their own.
+
+    Subclasses register themselves for their array types with the
+    ``register`` class keyword. Functions registered directly with
+    `~units._quantity.interface.funcs.get_interface` return the interface
+    class, as before, and `lookup_interface` shares one instance of it.
+    Interfaces no longer have ``quantity`` and ``value`` fields, so the
+    arithmetic dunders (``__add__``, ...) are replaced by methods taking the
+    quantity (``add``, ...).
+
+    Attributes
+    ----------
+    quantity_methods : frozenset[str]
+        The methods that are also available on quantities with this
+        interface, bound to the quantity, e.g. ``to_dask_array``. Other
+        attributes of a quantity are looked up on its value.
+    eager : bool
+        Whether `scale` computes its result in memory, rather than lazily.
+        Only then does `units.diagnostics` count the allocated bytes.
+
+    """
+
+    quantity_methods: ClassVar[frozenset[str]] = frozenset()
+    eager: ClassVar[bool] = False
 
     # ------------------
     # Class construction
@@ -47,10 +84,20 @@ class AbstractQuantityInterface(NumPyMixin, Generic[Array], metaclass=ABCMeta):
         # TODO: raises "TypeError: super(type, obj): obj must be an instance or
         # subtype of type" super().__init_subclass__()
 
+        for old, new in _DEPRECATED_METHODS.items():
+            if old in vars(cls):
+                msg = (
+                    f"{cls.__name__}.{old} is not used: interfaces are shared, "
+                    f"so override {new}(quantity, other) instead."
+                )
+                warnings.warn(msg, DeprecationWarning, stacklevel=2)
+
         # Register the interface
         registers = register if isinstance(register, tuple) else (register,)
+        registrant = Registrant(cls)
         for typ in registers:
-            get_interface.register(typ, Registrant(cls))
+            get_interface.register(typ, registrant)
+        _INTERFACE_CACHE.clear()  # the resolution for known types may change
 
     # ------------------
 
@@ -59,98 +106,153 @@ class AbstractQuantityInterface(NumPyMixin, Generic[Array], metaclass=ABCMeta):
         self, *, api_version: str | None = None
     ) -> ArrayAPINamespace: ...
 
-    @property
-    def quantity(self) -> AbstractQuantity[Array]:
-        """Quantity."""
-        out = self.quantity_ref()
+    # --- Quantity API ---
+
+    def scale(self, value: Array, factor: float, *, out: Array | None = None) -> Array:
+        """Multiply a value by a conversion factor, optionally into ``out``."""
         if out is None:
-            msg = "Quantity has been deleted."
-            raise ReferenceError(msg)
+            return cast(Array, value * factor)
+        out[...] = value * factor  # type: ignore[index]
         return out
 
-    # --- Quantity API ---
-
-    @property
-    def unit(self) -> Unit:
-        """Unit of the quantity."""
-        return self.quantity.unit
+    def to_unit(
+        self,
+        quantity: AbstractQuantity[Array],
+        unit: Unit,
+        *,
+        copy: bool = True,
+        out: Array | None = None,
+    ) -> AbstractQuantity[Array]:
+        """Convert to a new unit.
 
-    def to_unit(self, unit: Unit) -> AbstractQuantity[Array]:
-        """Convert to a new unit."""
-        # TODO: self.value * self.unit.to(unit) doesn't work for temperatures
+        With ``copy=False`` the value is not copied if no conversion is
+        needed. With ``out`` the converted value is written into that buffer.
+        Otherwise the result is a deferred view, scaled when first read.
+        """
+        # TODO: value * factor doesn't work for temperatures
         #       This is for illustration purposes only.
-        return replace(
-            self.quantity,
-            value=self.value * self.unit.wrapped.to(unit.wrapped),
-            unit=unit,
-        )
-
-    def to_unit_value(self, unit: Unit) -> Array:
-        """Convert to a unit and return the value."""
-        # TODO: self.value * self.unit.to(unit) doesn't work for temperatures
+        factor = conversion_factor(quantity.unit, unit)
+        if out is None and factor == 1 and not copy:
+            if quantity.unit is unit:
+                return quantity
+            return replace(quantity, value=quantity.value, unit=unit)
+
+        value, pending = deferred_value(quantity)
+        if out is not None:
+            if diagnostics.active:
+                value = diagnostics.scale(self, value, pending * factor, out=out)
+            else:
+                value = self.scale(value, pending * factor, out=out)
+            return replace(quantity, value=value, unit=unit)
+        return replace(quantity, value=Deferred(value, pending * factor), unit=unit)
+
+    def to_unit_value(
+        self,
+        quantity: AbstractQuantity[Array],
+        unit: Unit,
+        *,
+        out: Array | None = None,
+    ) -> Array:
+        """Convert to a unit and return the value.
+
+        If no conversion is needed and ``out`` is not given, the value itself
+        is returned, not a copy.
+        """
+        # TODO: value * factor doesn't work for temperatures
         #       This is for illustration purposes only.
-        return cast(Array, self.value * self.unit.wrapped.to(unit.wrapped))
-
-    # --- Array API ---
-
-    def __array_namespace__(self, api_version: str | None = None) -> ArrayAPINamespace:
-        return array_namespace
-
-    # --- Wrapper API ---
-
-    @property
-    def _wrapped_(self) -> Array:
-        """Wrapped."""
-        return self.value
-
-    def __getattr__(self, name: str) -> Any:
-        return getattr(self._wrapped_, name)
+        value, pending = deferred_value(quantity)
+        factor = pending * conversion_factor(quantity.unit, unit)
+        if out is None and factor == 1:
+            return value
+        if diagnostics.active:
+            return diagnostics.scale(self, value, factor, out=out)
+        return self.scale(value, factor, out=out)
 
     # --- Arithmetic ---
     # TODO: altneratively, this could be supported in the `xp` functions?
 
-    def __add__(self, other: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
+    def add(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Add ``other`` to the quantity."""
         return replace(
-            self.quantity,
-            value=self.value + other.to_unit_value(self.unit),
-            unit=self.unit,
+            quantity,
+            value=quantity.value + other.to_unit_value(quantity.unit),
+            unit=quantity.unit,
         )
 
-    def __sub__(self, other: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
+    def subtract(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Subtract ``other`` from the quantity."""
         return replace(
-            self.quantity,
-            value=self.value - other.to_unit_value(self.unit),
-            unit=self.unit,
+            quantity,
+            value=quantity.value - other.to_unit_value(quantity.unit),
+            unit=quantity.unit,
         )
 
-    def __mul__(
-        self, other: Array | AbstractQuantity[Array]
+    def multiply(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
     ) -> AbstractQuantity[Array]:
+        """Multiply the quantity by ``other``."""
         if not isinstance(other, QuantityAPI):
-            return replace(self.quantity, value=self.value * other, unit=self.unit)
+            return replace(quantity, value=quantity.value * other, unit=quantity.unit)
         return replace(
-            self.quantity,
-            value=self.value * other.value,
-            unit=cast("Unit", self.unit * other.unit),
+            quantity,
+            value=quantity.value * other.value,
+            unit=cast("Unit", quantity.unit * other.unit),
         )
 
-    def __truediv__(
-        self, other: Array | AbstractQuantity[Array]
+    def divide(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
     ) -> AbstractQuantity[Array]:
+        """Divide the quantity by ``other``."""
         if not isinstance(other, QuantityAPI):
-            return replace(self.quantity, value=self.value / other, unit=self.unit)
+            return replace(quantity, value=quantity.value / other, unit=quantity.unit)
         return replace(
-            self.quantity,
-            value=self.value / other.value,
-            unit=cast("Unit", self.unit / other.unit),
+            quantity,
+            value=quantity.value / other.value,
+            unit=cast("Unit", quantity.unit / other.unit),
         )
 
-    def __pow__(self, other: Number) -> AbstractQuantity[Array]:
-        return replace(self.quantity, value=self.value**other, unit=self.unit**other)
+    def power(
+        self, quantity: AbstractQuantity[Array], other: Number
+    ) -> AbstractQuantity[Array]:
+        """Raise the quantity to the power ``other``."""
+        return replace(quantity, value=quantity.value**other, unit=quantity.unit**other)
 
+    # --- In-place arithmetic ---
+    # By default these don't reuse the value's buffer. Interfaces for mutable
+    # arrays override them.
 
-@get_interface.register(AbstractQuantityInterface)
-def _get_interface_qi(
-    obj: AbstractQuantityInterface[Any], /
-) -> type[AbstractQuantityInterface[Any]]:
-    return obj.__class__  # allows user overrides of the type.
+    def iadd(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Add ``other`` to the quantity, in place if possible."""
+        return self.add(quantity, other)
+
+    def isubtract(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Subtract ``other`` from the quantity, in place if possible."""
+        return self.subtract(quantity, other)
+
+    def imultiply(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
+    ) -> AbstractQuantity[Array]:
+        """Multiply the quantity by ``other``, in place if possible."""
+        return self.multiply(quantity, other)
+
+    def idivide(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
+    ) -> AbstractQuantity[Array]:
+        """Divide the quantity by ``other``, in place if possible."""
+        return self.divide(quantity, other)
@@ -2,17 +2,22 @@
 
 __all__: list[str] = []
 
-
-from importlib.util import find_spec
+from units._quantity.interface.funcs import _LAZY_INTERFACES
 
 from . import numpy_interface
 from .numpy_interface import *
 
 __all__ += numpy_interface.__all__
 
-# Dask
-if find_spec("dask"):
-    from . import dask_interface
-    from .dask_interface import *
-
-    __all__ += dask_interface.__all__
+# Interfaces for optional libraries, and for `numpy.array_api`, which is slow
+# to import, are imported when an object from that library is first seen.
+# Keyed on the top-level package of the object's type.
+_LAZY_INTERFACES.update(
+    {
+        "numpy": f"{__name__}.numpy_array_api_interface",
+        "dask": f"{__name__}.dask_interface",
+        # Newer Dask DataFrames are defined in the separate ``dask_expr``.
+        "dask_expr": f"{__name__}.dask_interface",
+        "xarray": f"{__name__}.xarray",
+    }
+)
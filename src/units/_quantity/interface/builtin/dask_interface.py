@@ -3,31 +3,112 @@ from __future__ import annotations
 __all__: list[str] = []
 
 from dataclasses import replace
-from typing import TYPE_CHECKING, Any
+from functools import partial
+from typing import TYPE_CHECKING, Any, cast
 
 import dask.array as da  # pylint: disable=import-error
+import numpy as np
 from dask.array import Array  # pylint: disable=import-error
+from dask.array.core import elemwise  # pylint: disable=import-error
 from dask.dataframe import DataFrame, Series  # pylint: disable=import-error
 
+from units._quantity.fields import deferred_value
 from units._quantity.interface import AbstractQuantityInterface
+from units._unit.conversion import conversion_factor
+from units.api import Quantity as QuantityAPI
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from array_api import ArrayAPINamespace
 
     from units._quantity.base import AbstractQuantity
+    from units._quantity.columnar import ColumnarQuantity
+    from units._unit.core import Unit
+
+
+def _scaled_op(
+    a: Any, b: Any, /, *, ufunc: Callable[..., Any], fa: float, fb: float
+) -> Any:
+    """Apply ``ufunc`` to ``a * fa`` and ``b * fb``, on one block."""
+    return ufunc(a if fa == 1 else a * fa, b if fb == 1 else b * fb)
 
 
 class LegacyDaskArrayInterface(AbstractQuantityInterface[Array], register=Array):
-    """Interface for `dask.array.Array`."""
+    """Interface for `dask.array.Array`.
+
+    Conversions only record a scale factor (see `units.AbstractQuantity.to_unit`)
+    and elementwise arithmetic applies the operands' factors in the same
+    blockwise task as the operation, so each operation adds one layer to the
+    graph however many conversions led up to it. Nothing is computed.
+    """
+
+    quantity_methods = frozenset(("to_dask_dataframe",))
 
     def __wrapped_array_namespace__(
         self, *, api_version: Any = None
     ) -> ArrayAPINamespace:
         return da
 
-    def to_dask_dataframe(self) -> AbstractQuantity[DataFrame]:
+    def _fused(
+        self,
+        ufunc: Callable[..., Any],
+        quantity: AbstractQuantity[Array],
+        other: AbstractQuantity[Any],
+        unit: Unit,
+        *,
+        convert: bool,
+    ) -> AbstractQuantity[Array]:
+        # Apply the pending factors, and for ``convert`` the conversion of
+        # ``other`` to the quantity's unit, in a single blockwise layer.
+        a, fa = deferred_value(quantity)
+        b, fb = deferred_value(other)
+        if convert:
+            fb *= conversion_factor(other.unit, quantity.unit)
+        value = elemwise(partial(_scaled_op, ufunc=ufunc, fa=fa, fb=fb), a, b)
+        return replace(quantity, value=value, unit=unit)
+
+    def add(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Add ``other`` to the quantity."""
+        unit = quantity.unit + other.unit  # checks the units are compatible
+        return self._fused(np.add, quantity, other, unit, convert=True)
+
+    def subtract(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Subtract ``other`` from the quantity."""
+        unit = quantity.unit - other.unit  # checks the units are compatible
+        return self._fused(np.subtract, quantity, other, unit, convert=True)
+
+    def multiply(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
+    ) -> AbstractQuantity[Array]:
+        """Multiply the quantity by ``other``."""
+        if not isinstance(other, QuantityAPI):
+            return super().multiply(quantity, other)
+        unit = cast("Unit", quantity.unit * other.unit)
+        return self._fused(np.multiply, quantity, other, unit, convert=False)
+
+    def divide(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
+    ) -> AbstractQuantity[Array]:
+        """Divide the quantity by ``other``."""
+        if not isinstance(other, QuantityAPI):
+            return super().divide(quantity, other)
+        unit = cast("Unit", quantity.unit / other.unit)
+        return self._fused(np.divide, quantity, other, unit, convert=False)
+
+    def to_dask_dataframe(
+        self, quantity: AbstractQuantity[Array]
+    ) -> AbstractQuantity[DataFrame]:
         """Convert to a `dask.dataframe.DataFrame`."""
-        return replace(self.quantity, value=self.value.to_dask_dataframe())
+        return replace(quantity, value=quantity.value.to_dask_dataframe())
 
 
 class DaskDataFrameInterface(
@@ -35,11 +116,24 @@ class DaskDataFrameInterface(
 ):
     """Interface for `dask.dataframe.DataFrame`."""
 
+    quantity_methods = frozenset(("to_dask_array", "to_columnar"))
+
     def __wrapped_array_namespace__(
         self, *, api_version: Any = None
     ) -> ArrayAPINamespace:
         return da
 
-    def to_dask_array(self) -> AbstractQuantity[Array]:
+    def to_dask_array(
+        self, quantity: AbstractQuantity[DataFrame]
+    ) -> AbstractQuantity[Array]:
         """Convert to a `dask.array.Array`."""
-        return replace(self.quantity, value=self.value.to_dask_array())
+        return replace(quantity, value=quantity.value.to_dask_array())
+
+    def to_columnar(self, quantity: AbstractQuantity[DataFrame]) -> ColumnarQuantity:
+        """Convert to a `~units.ColumnarQuantity`, with a unit per column."""
+        from units._quantity.columnar import ColumnarQuantity
+
+        frame = quantity.value
+        if isinstance(frame, Series):
+            frame = frame.to_frame()
+        return ColumnarQuantity(frame, dict.fromkeys(frame.columns, quantity.unit))
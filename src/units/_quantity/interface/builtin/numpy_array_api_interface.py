@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+__all__: list[str] = []
+
+from typing import Any, TypeVar
+
+from array_api import Array as ArrayAPI, ArrayAPINamespace
+from numpy import array_api
+
+from units._quantity.interface.base import AbstractQuantityInterface
+
+Array = TypeVar("Array", bound=ArrayAPI)
+
+
+class NumPyQuantityInterface(
+    AbstractQuantityInterface[Array], register=array_api._array_object.Array
+):
+    """Interface for Array-API compatible numpy arrays."""
+
+    eager = True
+
+    def __wrapped_array_namespace__(
+        self, *, api_version: Any = None
+    ) -> ArrayAPINamespace:
+        return array_api
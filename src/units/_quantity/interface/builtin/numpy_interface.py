@@ -3,35 +3,135 @@ from __future__ import annotations
 __all__ = ["LegacyNumPyQuantityInterface"]
 
 from numbers import Number
-from typing import Any, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar, cast
 
 import numpy as np
 from array_api import Array as ArrayAPI, ArrayAPINamespace
-from array_api_compat import numpy as numpy_compat
-from numpy import array_api
 
 from units._quantity.interface.base import AbstractQuantityInterface
+from units._quantity.parallel import parallel_backend
+from units.api import Quantity as QuantityAPI
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from units._quantity.base import AbstractQuantity
 
 Array = TypeVar("Array", bound=ArrayAPI)
 
 
+def _can_write(value: Any, other: Any) -> bool:
+    """Check if ``value (op)= other`` can be done in ``value``'s buffer."""
+    return (
+        isinstance(value, np.ndarray)
+        and value.flags.writeable
+        and np.can_cast(np.result_type(value, other), value.dtype, "same_kind")
+        and np.broadcast_shapes(value.shape, np.shape(other)) == value.shape
+    )
+
+
+def _own(quantity: AbstractQuantity[Array]) -> AbstractQuantity[Array]:
+    """Mark a quantity as owning its value, if the value is a new array.
+
+    Only the results of in-place ops that couldn't be done in place are
+    marked, so the first in-place op copies the value and later ones reuse
+    the copy. Reading the value clears the mark, so arrays that were handed
+    out, e.g. to the caller or another quantity, are never written to.
+    """
+    value = quantity.__dict__.get("_value")
+    if type(value) is np.ndarray and value.base is None:
+        object.__setattr__(quantity, "_owns_value", True)
+    return quantity
+
+
 class LegacyNumPyQuantityInterface(
     AbstractQuantityInterface[Array], register=(Number, np.ndarray)
 ):
     """Interface for pre-Array-API numpy arrays."""
 
+    eager = True
+
     def __wrapped_array_namespace__(
         self, *, api_version: Any = None
     ) -> ArrayAPINamespace:
+        from array_api_compat import numpy as numpy_compat
+
         return numpy_compat
 
+    def scale(self, value: Array, factor: float, *, out: Array | None = None) -> Array:
+        """Multiply a value by a conversion factor, optionally into ``out``."""
+        result = parallel_backend.apply(np.multiply, value, factor, out=out)
+        if result is not None:
+            return cast(Array, result)
+        if out is None:
+            return cast(Array, value * factor)
+        return cast(Array, np.multiply(value, factor, out=out))
 
-class NumPyQuantityInterface(
-    AbstractQuantityInterface[Array], register=array_api._array_object.Array
-):
-    """Interface for Array-API compatible numpy arrays."""
+    # --- In-place arithmetic ---
 
-    def __wrapped_array_namespace__(
-        self, *, api_version: Any = None
-    ) -> ArrayAPINamespace:
-        return array_api
+    def _inplace(
+        self,
+        ufunc: Callable[..., Any],
+        quantity: AbstractQuantity[Array],
+        other: Any,
+        unit: Any,
+    ) -> AbstractQuantity[Array] | None:
+        # Apply ``ufunc`` in the value's buffer, if the quantity owns it and
+        # the unit doesn't change. Otherwise other references to the value
+        # would see it in the wrong unit.
+        attrs = quantity.__dict__
+        value = attrs.get("_value")
+        if (
+            unit is not quantity.unit
+            or not attrs.get("_owns_value", False)
+            or not _can_write(value, other)
+        ):
+            return None
+        ufunc(value, other, out=value)
+        return quantity
+
+    def iadd(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Add ``other`` to the quantity, in place if possible."""
+        out = self._inplace(
+            np.add, quantity, other.to_unit_value(quantity.unit), quantity.unit
+        )
+        return _own(self.add(quantity, other)) if out is None else out
+
+    def isubtract(
+        self, quantity: AbstractQuantity[Array], other: AbstractQuantity[Array]
+    ) -> AbstractQuantity[Array]:
+        """Subtract ``other`` from the quantity, in place if possible."""
+        out = self._inplace(
+            np.subtract, quantity, other.to_unit_value(quantity.unit), quantity.unit
+        )
+        return _own(self.subtract(quantity, other)) if out is None else out
+
+    def imultiply(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
+    ) -> AbstractQuantity[Array]:
+        """Multiply the quantity by ``other``, in place if possible."""
+        if isinstance(other, QuantityAPI):
+            out = self._inplace(
+                np.multiply, quantity, other.value, quantity.unit * other.unit
+            )
+        else:
+            out = self._inplace(np.multiply, quantity, other, quantity.unit)
+        return _own(self.multiply(quantity, other)) if out is None else out
+
+    def idivide(
+        self,
+        quantity: AbstractQuantity[Array],
+        other: Array | AbstractQuantity[Array],
+    ) -> AbstractQuantity[Array]:
+        """Divide the quantity by ``other``, in place if possible."""
+        if isinstance(other, QuantityAPI):
+            out = self._inplace(
+                np.divide, quantity, other.value, quantity.unit / other.unit
+            )
+        else:
+            out = self._inplace(np.divide, quantity, other, quantity.unit)
+        return _own(self.divide(quantity, other)) if out is None else out
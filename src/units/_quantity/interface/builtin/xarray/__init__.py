@@ -1 +1,15 @@
+"""xarray support.
+
+Importing this registers the ``.qty`` accessor of DataArrays and Datasets.
+It is imported by `units.xarray`, or when an xarray object is first wrapped
+in a Quantity, so xarray isn't imported by ``units`` unless it is in use.
+"""
+
 __all__: list[str] = []
+
+from . import accessor, interface
+from .accessor import *
+from .interface import *
+
+__all__ += accessor.__all__
+__all__ += interface.__all__
@@ -1,45 +1,150 @@
-# from dataclasses import dataclass
+"""The ``.qty`` accessor of xarray DataArrays and Datasets.
 
-# from xarray import register_dataarray_accessor
-# from xarray.core.dataarray import DataArray
+The unit of a variable is kept as a string in its ``attrs["units"]``, so it
+survives xarray operations that keep attributes and round-trips through
+netCDF and Zarr. The accessor is named ``qty``, not ``units``, so that it
+doesn't shadow reading that attribute as ``obj.units``.
+"""
 
-# __all__: list[str] = []
+from __future__ import annotations
 
+__all__ = ["DataArrayQuantityAccessor", "DatasetQuantityAccessor"]
 
-# @register_dataarray_accessor("units")
-# @dataclass
-# class PintDataArrayAccessor:
-#     """Access methods for DataArrays with units using Pint.
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
 
-#     Methods and attributes can be accessed through the `.pint` attribute.
-#     """
+from xarray import (  # pylint: disable=import-error
+    DataArray,
+    Dataset,
+    register_dataarray_accessor,
+    register_dataset_accessor,
+)
 
-#     da: DataArray
+from units._quantity.interface.funcs import lookup_interface
+from units._unit.conversion import conversion_factor
+from units._unit.parse import parse_unit
+from units._unit.system.base import AbstractUnitSystem
 
-#     # def quantify(self, units=None, unit_registry=None, **unit_kwargs):
-#     #     return self.da.pipe(conversion.strip_unit_attributes).pipe(
-#     #         conversion.attach_units, new_units
-#     #     )
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
-#     @property
-#     def value(self):
-#         """The magnitude of the data or the data itself if not a quantity."""
-#         data = self.da.data
-#         return getattr(data, "value", data)
+    from units._quantity.core import Quantity
+    from units._unit.core import Unit
 
-#     @property
-#     def unit(self):
-#         """The magnitude of the data or the data itself if not a quantity."""
-#         data = self.da.data
-#         return getattr(data, "unit", None)
 
-#     @unit.setter
-#     def unit(self, unit):
-#         self.da.data = conversion.array_attach_unit(self.da.data, unit)
+def _unit_of(obj: DataArray, /) -> Unit | None:
+    units = obj.attrs.get("units")
+    return None if units is None else parse_unit(units)
 
-#     def to_unit(self, unit):
-#         """Convert to a new unit."""
-#         return conversion.convert_units(self.da, unit)
 
-#     # def to_unit_value(self, unit):
-#     #     return conversion.convert_units(self.da, unit).data
+def _converted(obj: DataArray, unit: Unit, target: Unit, /) -> DataArray:
+    """Convert a DataArray, without copying if the factor is 1."""
+    factor = conversion_factor(unit, target)
+    if factor != 1:
+        data = obj.data  # the interface of a Dask array keeps it lazy
+        obj = obj.copy(deep=False, data=lookup_interface(data).scale(data, factor))
+    if target is unit:
+        return obj
+    return obj.assign_attrs(units=target.wrapped.to_string())
+
+
+@register_dataarray_accessor("qty")
+@dataclass(frozen=True)
+class DataArrayQuantityAccessor:
+    """Unit-aware methods of a DataArray, as ``DataArray.qty``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import xarray as xr
+    >>> import units.xarray
+    >>> x = xr.DataArray(np.arange(3.0), attrs={"units": "km"})
+    >>> x.qty.to_unit("m").values
+    array([   0., 1000., 2000.])
+
+    """
+
+    _obj: DataArray
+
+    @property
+    def unit(self) -> Unit | None:
+        """The unit, from ``attrs["units"]``. `None` if there is none."""
+        return _unit_of(self._obj)
+
+    def _require_unit(self) -> Unit:
+        unit = self.unit
+        if unit is None:
+            msg = "DataArray has no 'units' attribute."
+            raise ValueError(msg)
+        return unit
+
+    @property
+    def quantity(self) -> Quantity[Any]:
+        """The data as a `~units.Quantity`."""
+        from units._quantity.core import Quantity
+
+        return Quantity(self._obj.data, unit=self._require_unit())
+
+    def with_unit(self, unit: Unit | str) -> DataArray:
+        """Set the unit, without converting the data."""
+        return self._obj.assign_attrs(units=parse_unit(unit).wrapped.to_string())
+
+    def to_unit(self, unit: Unit | str) -> DataArray:
+        """Convert to a new unit.
+
+        Dask-backed data stays lazy and keeps its chunks. If no conversion is
+        needed the data is not copied.
+        """
+        return _converted(self._obj, self._require_unit(), parse_unit(unit))
+
+    def to_unit_value(self, unit: Unit | str) -> Any:
+        """Convert to a unit and return the data."""
+        return self.to_unit(unit).data
+
+
+@register_dataset_accessor("qty")
+@dataclass(frozen=True)
+class DatasetQuantityAccessor:
+    """Unit-aware methods of a Dataset, as ``Dataset.qty``."""
+
+    _obj: Dataset
+
+    @property
+    def units(self) -> dict[Any, Unit]:
+        """The unit of each data variable with a ``units`` attribute."""
+        units = {name: _unit_of(var) for name, var in self._obj.data_vars.items()}
+        return {name: unit for name, unit in units.items() if unit is not None}
+
+    def to_unit(self, target: Mapping[Any, Unit | str] | AbstractUnitSystem) -> Dataset:
+        """Convert data variables to new units.
+
+        Parameters
+        ----------
+        target : Mapping[name, Unit | str] or AbstractUnitSystem
+            The unit of each variable to convert, or a unit system to convert
+            all the variables with units to.
+
+        Returns
+        -------
+        Dataset
+            The converted dataset. Dask-backed variables stay lazy, and
+            variables already in the target unit are not copied.
+
+        """
+        units = self.units
+        if isinstance(target, AbstractUnitSystem):
+            targets = {name: target[unit] for name, unit in units.items()}
+        else:
+            targets = {name: parse_unit(unit) for name, unit in target.items()}
+            missing = set(targets).difference(units)
+            if missing:
+                msg = f"variables without units: {sorted(missing)}"
+                raise ValueError(msg)
+
+        ds = self._obj
+        converted = {
+            name: _converted(ds[name], units[name], unit)
+            for name, unit in targets.items()
+            if unit is not units[name] or conversion_factor(units[name], unit) != 1
+        }
+        return ds.assign(converted) if converted else ds
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+__all__ = ["XarrayQuantityInterface"]
+
+from typing import TYPE_CHECKING, Any
+
+from xarray import DataArray  # pylint: disable=import-error
+
+from units._quantity.interface.base import AbstractQuantityInterface
+from units._quantity.interface.funcs import lookup_interface
+
+if TYPE_CHECKING:
+    from array_api import ArrayAPINamespace
+
+
+class XarrayQuantityInterface(AbstractQuantityInterface[DataArray], register=DataArray):
+    """Interface for `xarray.DataArray`.
+
+    The wrapped data is handled by the interface of its own type, so e.g.
+    Dask-backed DataArrays stay lazy and keep their chunks.
+    """
+
+    def __wrapped_array_namespace__(
+        self, *, api_version: Any = None
+    ) -> ArrayAPINamespace:
+        # NumPy functions dispatch to DataArrays, and so to their data.
+        from array_api_compat import numpy as numpy_compat
+
+        return numpy_compat
+
+    def scale(
+        self, value: DataArray, factor: float, *, out: DataArray | None = None
+    ) -> DataArray:
+        """Multiply a value by a conversion factor, optionally into ``out``."""
+        data = value.data
+        if out is not None:
+            lookup_interface(data).scale(data, factor, out=out.data)
+            return out
+        scaled = lookup_interface(data).scale(data, factor)
+        return value.copy(deep=False, data=scaled)
@@ -3,14 +3,61 @@ from __future__ import annotations
 __all__ = ["get_interface"]
 
 from functools import singledispatch
+from importlib import import_module
 from typing import TYPE_CHECKING, Any
 
+from units import diagnostics
+
 if TYPE_CHECKING:
     from .base import AbstractQuantityInterface
 
+_LAZY_INTERFACES: dict[str, str] = {}
+"""Interface modules to import when an object from a package is first seen.
+
+Keyed on the top-level package of the object's type.
+"""
+
+_INTERFACE_CACHE: dict[type, AbstractQuantityInterface[Any]] = {}
+"""Type-keyed cache of the shared interfaces, used by `lookup_interface`."""
+
+_INSTANCES: dict[type, AbstractQuantityInterface[Any]] = {}
+"""The shared instance of each interface class."""
+
 
 @singledispatch
 def get_interface(obj: Any, /) -> type[AbstractQuantityInterface[Any]]:
-    """Get the interface of an object."""
+    """Get the interface class of an object.
+
+    Register a function returning the interface class for a type, or
+    subclass `~units._quantity.interface.AbstractQuantityInterface` with the
+    ``register`` class keyword.
+    """
+    # Interfaces for optional array libraries are registered on first use.
+    package = type(obj).__module__.partition(".")[0]
+    module = _LAZY_INTERFACES.pop(package, None)
+    if module is not None:
+        import_module(module)
+        return get_interface(obj)
+
     msg = f"Cannot get interface of {obj.__class__.__name__!r}"
     raise TypeError(msg)
+
+
+def lookup_interface(obj: Any, /) -> AbstractQuantityInterface[Any]:
+    """Get the shared interface of an object, cached on the object's type.
+
+    This is the fast path of `get_interface`, used on every Quantity
+    construction and operation.
+    """
+    try:
+        interface = _INTERFACE_CACHE[type(obj)]
+    except KeyError:
+        cls = get_interface(obj)
+        try:
+            interface = _INSTANCES[cls]
+        except KeyError:
+            interface = _INSTANCES.setdefault(cls, cls())
+        _INTERFACE_CACHE[type(obj)] = interface
+    if diagnostics.active:
+        diagnostics.count("dispatches", type(interface).__name__)
+    return interface
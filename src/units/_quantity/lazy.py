@@ -0,0 +1,271 @@
+"""Lazy Quantity arithmetic.
+
+Arithmetic on a `LazyQuantity` builds an expression tree instead of
+evaluating. Units are resolved, and conversion factors folded into
+constants, while the tree is built; `LazyQuantity.compute` then evaluates
+the values in one pass, writing into reused buffers, optionally chunk by
+chunk so that temporaries stay small.
+"""
+
+from __future__ import annotations
+
+__all__ = ["LazyQuantity"]
+
+import operator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+import numpy as np
+from array_api import Array as ArrayAPI
+
+from units._quantity.up import dimensionless
+from units._unit.conversion import conversion_factor
+from units._unit.parse import parse_unit
+from units.api import Quantity as QuantityAPI
+
+from .core import Quantity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from numbers import Number
+
+    from typing_extensions import Self
+
+    from units._unit.core import Unit
+
+Array = TypeVar("Array", bound=ArrayAPI)
+
+
+# ============================================================================
+# Expression tree
+
+
+@dataclass(frozen=True, slots=True)
+class Leaf:
+    """An array or scalar value."""
+
+    value: Any
+
+
+@dataclass(frozen=True, slots=True)
+class Const:
+    """A constant, e.g. a folded conversion factor."""
+
+    value: float
+
+
+@dataclass(frozen=True, slots=True)
+class Op:
+    """An elementwise operation."""
+
+    name: str
+    args: tuple[Node, ...]
+
+
+Node = Leaf | Const | Op
+
+_UFUNCS: dict[str, Callable[..., Any]] = {
+    "add": np.add,
+    "subtract": np.subtract,
+    "multiply": np.multiply,
+    "divide": np.divide,
+    "power": np.power,
+    "negative": np.negative,
+}
+
+_OPERATORS: dict[str, Callable[..., Any]] = {
+    "add": operator.add,
+    "subtract": operator.sub,
+    "multiply": operator.mul,
+    "divide": operator.truediv,
+    "power": operator.pow,
+    "negative": operator.neg,
+}
+
+
+def _scale(node: Node, factor: float, /) -> Node:
+    """Multiply a node by a constant, folding it into existing constants."""
+    if factor == 1:
+        return node
+    if isinstance(node, Const):
+        return Const(node.value * factor)
+    if isinstance(node, Op) and node.name == "multiply":
+        left, right = node.args
+        if isinstance(right, Const):
+            return _scale(left, right.value * factor)
+        if isinstance(left, Const):
+            return _scale(right, left.value * factor)
+    return Op("multiply", (node, Const(factor)))
+
+
+def _walk(node: Node, /) -> list[Leaf | Const]:
+    if isinstance(node, Op):
+        return [x for arg in node.args for x in _walk(arg)]
+    return [node]
+
+
+def _evaluate_plain(node: Node, /) -> Any:
+    if isinstance(node, Op):
+        return _OPERATORS[node.name](*(_evaluate_plain(arg) for arg in node.args))
+    return node.value
+
+
+def _sample(node: Node, /) -> Any:
+    """Evaluate a node on one element of each array, e.g. for its dtype.
+
+    The ufuncs choose the dtype of the result, e.g. ``divide`` of integers
+    gives floats. Scalars are kept, since NumPy also casts by their value.
+    """
+    if isinstance(node, Op):
+        with np.errstate(all="ignore"):
+            return _UFUNCS[node.name](*(_sample(arg) for arg in node.args))
+    value = node.value
+    return np.ones(1, dtype=value.dtype) if np.ndim(value) else value
+
+
+def _evaluate(
+    node: Node, select: Callable[[Any], Any], out: Any = None
+) -> tuple[Any, bool]:
+    """Evaluate a node with NumPy, reusing temporaries as output buffers.
+
+    Returns the result and whether it is a temporary that may be overwritten.
+    """
+    if not isinstance(node, Op):
+        value = select(node.value) if isinstance(node, Leaf) else node.value
+        if out is None:
+            return value, False
+        out[...] = value
+        return out, True
+
+    results = [_evaluate(arg, select) for arg in node.args]
+    args = [arg for arg, _ in results]
+    if out is None:
+        shape = np.broadcast_shapes(*(np.shape(arg) for arg in args))
+        dtype = np.result_type(_sample(node))
+        out = next(
+            (
+                arg
+                for arg, temporary in results
+                if temporary and arg.shape == shape and arg.dtype == dtype
+            ),
+            None,
+        )
+    return _UFUNCS[node.name](*args, out=out), True
+
+
+# ============================================================================
+
+
+@dataclass(frozen=True)
+class LazyQuantity(Generic[Array]):
+    """A Quantity expression, evaluated by `compute`.
+
+    Create one with `units.AbstractQuantity.lazy`.
+    """
+
+    expr: Node
+    unit: Unit
+
+    @classmethod
+    def _from(cls: type[Self], other: Any, /) -> Self:
+        if isinstance(other, cls):
+            return other
+        if isinstance(other, QuantityAPI):
+            return cls(Leaf(other.value), other.unit)
+        if isinstance(other, int | float):
+            return cls(Const(other), dimensionless)
+        return cls(Leaf(other), dimensionless)
+
+    # --- Arithmetic ---
+
+    def __add__(self, other: Any) -> LazyQuantity[Array]:
+        other = self._from(other)
+        unit = self.unit + other.unit  # checks the units are compatible
+        rhs = _scale(other.expr, conversion_factor(other.unit, self.unit))
+        return LazyQuantity(Op("add", (self.expr, rhs)), unit)
+
+    def __sub__(self, other: Any) -> LazyQuantity[Array]:
+        other = self._from(other)
+        unit = self.unit - other.unit  # checks the units are compatible
+        rhs = _scale(other.expr, conversion_factor(other.unit, self.unit))
+        return LazyQuantity(Op("subtract", (self.expr, rhs)), unit)
+
+    def __mul__(self, other: Any) -> LazyQuantity[Array]:
+        other = self._from(other)
+        if isinstance(other.expr, Const):
+            return LazyQuantity(_scale(self.expr, other.expr.value), self.unit)
+        if isinstance(self.expr, Const):
+            return LazyQuantity(_scale(other.expr, self.expr.value), other.unit)
+        return LazyQuantity(
+            Op("multiply", (self.expr, other.expr)), self.unit * other.unit
+        )
+
+    def __rmul__(self, other: Any) -> LazyQuantity[Array]:
+        return self._from(other) * self
+
+    def __truediv__(self, other: Any) -> LazyQuantity[Array]:
+        other = self._from(other)
+        if isinstance(other.expr, Const):
+            return LazyQuantity(_scale(self.expr, 1 / other.expr.value), self.unit)
+        return LazyQuantity(
+            Op("divide", (self.expr, other.expr)), self.unit / other.unit
+        )
+
+    def __rtruediv__(self, other: Any) -> LazyQuantity[Array]:
+        return self._from(other) / self
+
+    def __pow__(self, other: Number) -> LazyQuantity[Array]:
+        return LazyQuantity(Op("power", (self.expr, Const(other))), self.unit**other)  # type: ignore[arg-type]
+
+    def __neg__(self) -> LazyQuantity[Array]:
+        return LazyQuantity(Op("negative", (self.expr,)), self.unit)
+
+    # --- Evaluation ---
+
+    def to_unit(self, unit: Unit | str) -> LazyQuantity[Array]:
+        """Convert to a new unit, folding the factor into the expression."""
+        unit = parse_unit(unit)
+        return LazyQuantity(_scale(self.expr, conversion_factor(self.unit, unit)), unit)
+
+    def compute(
+        self, *, out: Any = None, chunksize: int | None = None
+    ) -> Quantity[Array]:
+        """Evaluate the expression.
+
+        Parameters
+        ----------
+        out : array, optional
+            Buffer to write the result into.
+        chunksize : int, optional
+            Evaluate this many rows (along the first axis) at a time, so that
+            temporaries are at most one chunk in size.
+
+        Returns
+        -------
+        `~units.Quantity`
+            The result.
+
+        """
+        nodes = _walk(self.expr)
+        values = [node.value for node in nodes]
+        if not all(
+            isinstance(x, np.ndarray | np.generic | int | float) for x in values
+        ):
+            # Not NumPy, so no buffer reuse: evaluate with the operators.
+            return Quantity(_evaluate_plain(self.expr), unit=self.unit)
+
+        shape = np.broadcast_shapes(*(np.shape(x) for x in values))
+        if out is None:
+            out = np.empty(shape, dtype=np.result_type(_sample(self.expr)))
+
+        if chunksize is None or not shape:
+            _evaluate(self.expr, lambda value: value, out)
+        else:
+            for start in range(0, shape[0], chunksize):
+                rows = slice(start, start + chunksize)
+                _evaluate(
+                    self.expr,
+                    lambda value, rows=rows: np.broadcast_to(value, shape)[rows],  # type: ignore[misc]
+                    out[rows],
+                )
+        return Quantity(out, unit=self.unit)
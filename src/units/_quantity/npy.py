@@ -0,0 +1,218 @@
+"""Save and load Quantities as ``.npy`` files.
+
+The files are ordinary ``.npy`` files, readable by `numpy.load`. The unit
+and its dimension are stored in a comment at the end of the header, e.g.::
+
+    {'descr': '<f8', 'fortran_order': False, 'shape': ()} # units: m; dimension: length
+
+Loading memory-maps the values by default, so only the pages that are used
+(e.g. by slicing or `~units.AbstractQuantity.to_unit_value`) are read.
+"""
+
+from __future__ import annotations
+
+__all__ = ["save", "load", "open_memmap"]
+
+import os
+import re
+import struct
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+import numpy as np
+from numpy.lib import format as npy_format
+
+from units._unit.parse import parse_unit
+
+from .core import Quantity
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+    from units._unit.core import Unit
+
+PathLike = str | os.PathLike[str]
+
+_MAGIC = b"\x93NUMPY"
+_ALIGNMENT = 64
+_UNIT_COMMENT = re.compile(
+    r"#\s*units:\s*(?P<unit>[^;]*?)\s*(?:;\s*dimension:\s*(?P<dimension>.*?))?\s*$"
+)
+
+
+def _dimension_name(unit: Unit, /) -> str:
+    """Get a name of the unit's dimension, the same in every process.
+
+    A physical type can have several names, e.g. "energy" and "torque".
+    `~units.Unit.dimensions` picks any one, so the first, alphabetically, is
+    stored instead.
+    """
+    return min(str(name) for name in unit.wrapped.physical_type)
+
+
+def _header(shape: tuple[int, ...], dtype: np.dtype[Any], unit: Unit, /) -> bytes:
+    """Make a ``.npy`` header with the unit in a trailing comment."""
+    d = {
+        "descr": npy_format.dtype_to_descr(dtype),
+        "fortran_order": False,
+        "shape": shape,
+    }
+    comment = f"units: {unit.wrapped.to_string()}; dimension: {_dimension_name(unit)}"
+    data = f"{d!r} # {comment}".encode("latin1")
+    for version, length_format in (((1, 0), "<H"), ((2, 0), "<I")):
+        prefix = len(_MAGIC) + 2 + struct.calcsize(length_format)
+        padding = -(prefix + len(data) + 1) % _ALIGNMENT
+        size = len(data) + padding + 1
+        if size < 2 ** (8 * struct.calcsize(length_format)):
+            return (
+                _MAGIC
+                + bytes(version)
+                + struct.pack(length_format, size)
+                + data
+                + b" " * padding
+                + b"\n"
+            )
+    msg = "header too large"  # pragma: no cover
+    raise ValueError(msg)  # pragma: no cover
+
+
+def _read_unit(fp: BinaryIO, /) -> Unit:
+    """Read the unit from the header comment of a ``.npy`` file."""
+    magic = fp.read(len(_MAGIC))
+    if magic != _MAGIC:
+        msg = "not a .npy file"
+        raise ValueError(msg)
+    major, _ = fp.read(2)
+    length_format = "<H" if major == 1 else "<I"
+    (size,) = struct.unpack(length_format, fp.read(struct.calcsize(length_format)))
+    header = fp.read(size).decode("latin1" if major < 3 else "utf8")
+
+    match = _UNIT_COMMENT.search(header.rstrip())
+    if match is None:
+        msg = "the .npy file has no unit"
+        raise ValueError(msg)
+    unit = parse_unit(match["unit"])
+    # Any of the names of the unit's physical type is a match.
+    dimension = match["dimension"]
+    if dimension is not None and dimension not in unit.wrapped.physical_type:
+        msg = (
+            f"the unit {match['unit']!r} does not have the stored dimension "
+            f"{match['dimension']!r}"
+        )
+        raise ValueError(msg)
+    return unit
+
+
+def save(file: PathLike | BinaryIO, quantity: Quantity[Any], /) -> None:
+    """Save a Quantity to a ``.npy`` file, with its unit.
+
+    Parameters
+    ----------
+    file : path-like or file
+        The file to write to.
+    quantity : Quantity
+        The Quantity to save. Its value must be convertible to a NumPy array,
+        without Python objects.
+
+    """
+    array = np.ascontiguousarray(quantity.value)
+    if array.dtype.hasobject:
+        msg = "cannot save Quantities of Python objects"
+        raise TypeError(msg)
+
+    header = _header(array.shape, array.dtype, quantity.unit)
+    if isinstance(file, str | os.PathLike):
+        with Path(file).open("wb") as fp:
+            fp.write(header)
+            array.tofile(fp)
+    else:
+        file.write(header)
+        file.write(memoryview(array).cast("B"))
+
+
+def load(file: PathLike, /, *, mmap_mode: str | None = "r") -> Quantity[Any]:
+    """Load a Quantity saved by `save`.
+
+    Parameters
+    ----------
+    file : path-like
+        The file to read.
+    mmap_mode : {"r", "r+", "c", None}, optional keyword-only
+        How to memory-map the values, see `numpy.load`. With `None` the
+        values are read into memory.
+
+    Returns
+    -------
+    Quantity
+        The Quantity, with a `numpy.memmap` value unless ``mmap_mode`` is
+        `None`.
+
+    """
+    with Path(file).open("rb") as fp:
+        unit = _read_unit(fp)
+    return Quantity(np.load(file, mmap_mode=mmap_mode), unit=unit)
+
+
+def open_memmap(
+    file: PathLike,
+    /,
+    mode: str = "r+",
+    *,
+    unit: Unit | str | None = None,
+    shape: tuple[int, ...] | None = None,
+    dtype: DTypeLike = float,
+) -> Quantity[np.memmap[Any, Any]]:
+    """Open, or create, a memory-mapped Quantity file.
+
+    Parameters
+    ----------
+    file : path-like
+        The file.
+    mode : {"r", "r+", "w+", "c"}, optional
+        The mode, see `numpy.memmap`. ``"w+"`` creates (or overwrites) the
+        file, and needs ``unit`` and ``shape``.
+    unit : Unit or str, optional keyword-only
+        The unit of a new file.
+    shape : tuple[int, ...], optional keyword-only
+        The shape of a new file.
+    dtype : dtype, optional keyword-only
+        The dtype of a new file.
+
+    Returns
+    -------
+    Quantity
+        The Quantity, with a `numpy.memmap` value.
+
+    Examples
+    --------
+    Convert a Quantity straight into a memory-mapped file:
+
+    >>> import numpy as np
+    >>> import units
+    >>> q = units.Quantity(np.arange(3.0), unit="km")
+    >>> out = units.open_memmap("out.npy", "w+", unit="m", shape=q.shape)
+    >>> _ = q.to_unit_value(out.unit, out=out.value)
+
+    """
+    if mode != "w+":
+        with Path(file).open("rb") as fp:
+            file_unit = _read_unit(fp)
+        value = npy_format.open_memmap(file, mode=mode)
+        return Quantity(value, unit=file_unit)
+
+    if unit is None or shape is None:
+        msg = "creating a file needs a unit and a shape"
+        raise ValueError(msg)
+    unit = parse_unit(unit)
+    dtype = np.dtype(dtype)
+    header = _header(tuple(shape), dtype, unit)
+    with Path(file).open("wb") as fp:
+        fp.write(header)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        if nbytes:
+            fp.seek(len(header) + nbytes - 1)
+            fp.write(b"\0")
+    value = np.memmap(
+        file, dtype=dtype, mode="r+", offset=len(header), shape=tuple(shape)
+    )
+    return Quantity(value, unit=unit)
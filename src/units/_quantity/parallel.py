@@ -0,0 +1,149 @@
+"""Opt-in multithreaded execution of large elementwise operations."""
+
+from __future__ import annotations
+
+__all__ = ["parallel_backend"]
+
+import itertools
+import os
+import threading
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+_worker = threading.local()
+"""Marks the threads of the pool, so that they don't submit to it."""
+
+
+def _mark_worker() -> None:
+    _worker.active = True
+
+
+class ParallelBackend:
+    """Split large elementwise NumPy operations over a thread pool.
+
+    NumPy releases the GIL in ufunc loops, so the chunks of a large array
+    are processed concurrently. Each thread writes its chunk into the
+    (preallocated) output, so nothing is concatenated afterwards.
+
+    It is used for unit conversions of NumPy values and the elementwise
+    functions of `units.array_namespace`. It is off by default.
+
+    Parameters
+    ----------
+    max_workers : int or None, optional
+        The number of threads. `None` uses the number of CPUs.
+    min_size : int, optional
+        The number of elements from which an operation is split.
+
+    Attributes
+    ----------
+    enabled : bool
+        Whether operations are split.
+
+    Examples
+    --------
+    >>> import units
+    >>> units.parallel_backend.enabled = True
+    >>> units.parallel_backend.max_workers = 4
+
+    """
+
+    def __init__(self, max_workers: int | None = None, min_size: int = 1 << 20) -> None:
+        self.enabled = False
+        self.min_size = min_size
+        self._max_workers = max_workers
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+    @property
+    def max_workers(self) -> int:
+        """The number of threads."""
+        return self._max_workers or os.cpu_count() or 1
+
+    @max_workers.setter
+    def max_workers(self, value: int | None) -> None:
+        if value is not None and value < 1:
+            msg = f"max_workers must be None or positive, not {value}."
+            raise ValueError(msg)
+        self.shutdown()
+        self._max_workers = value
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                from concurrent.futures import ThreadPoolExecutor
+
+                self._executor = ThreadPoolExecutor(
+                    self.max_workers,
+                    thread_name_prefix="units-parallel",
+                    initializer=_mark_worker,
+                )
+            return self._executor
+
+    def shutdown(self) -> None:
+        """Stop the threads. They are restarted when next needed."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+
+    def apply(
+        self, ufunc: np.ufunc, value: Any, *args: Any, out: Any = None
+    ) -> np.ndarray[Any, Any] | None:
+        """Apply a ufunc to a value in parallel chunks.
+
+        Parameters
+        ----------
+        ufunc : `numpy.ufunc`
+            The function, called as ``ufunc(chunk, *args, out=out_chunk)``.
+        value : Any
+            The array to split.
+        *args : Any
+            Other (scalar) arguments.
+        out : `numpy.ndarray`, optional keyword-only
+            The output. If not given it is allocated.
+
+        Returns
+        -------
+        `numpy.ndarray` or None
+            The output, or `None` if the operation isn't split: the backend
+            is disabled, the value is small or not a NumPy array, or this is
+            called from one of the backend's threads.
+
+        """
+        workers = self.max_workers
+        if (
+            not self.enabled
+            or workers == 1
+            or type(value) is not np.ndarray
+            or value.size < self.min_size
+            or getattr(_worker, "active", False)
+        ):
+            return None
+        if out is None:
+            dtype = ufunc(value.flat[:1], *args).dtype
+            out = np.empty(value.shape, dtype=dtype)
+        elif not isinstance(out, np.ndarray) or out.shape != value.shape:
+            return None
+
+        if value.flags.c_contiguous and out.flags.c_contiguous:
+            src, dst = value.reshape(-1), out.reshape(-1)
+        else:
+            src, dst = value, out  # split on the first axis
+        bounds = np.linspace(0, len(src), min(workers, len(src)) + 1).astype(int)
+        pool = self._pool()
+        futures = [
+            pool.submit(ufunc, src[start:stop], *args, out=dst[start:stop])
+            for start, stop in itertools.pairwise(bounds)
+        ]
+        for future in futures:
+            future.result()
+        return out
+
+
+parallel_backend = ParallelBackend()
+"""The backend for multithreaded elementwise operations."""
@@ -0,0 +1,315 @@
+"""Quantities in shared memory, for process pools."""
+
+from __future__ import annotations
+
+__all__ = [
+    "SharedQuantity",
+    "SharedQuantityHandle",
+    "shared_quantity",
+    "shared_map",
+]
+
+import ctypes
+import itertools
+import os
+import weakref
+from contextlib import suppress
+from dataclasses import dataclass
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from units._unit.parse import parse_unit
+
+from .base import AbstractQuantity
+from .core import Quantity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import Executor
+
+    from numpy.typing import DTypeLike
+    from typing_extensions import Self
+
+    from units._unit.core import Unit
+
+
+class _SharedBuffer:
+    """Exposes shared memory to NumPy.
+
+    Arrays made from this, and all their views, reference it, and so keep
+    the memory open: NumPy doesn't hold on to a buffer it is given, so the
+    memory could otherwise be unmapped under them.
+    """
+
+    def __init__(
+        self, memory: SharedMemory, shape: tuple[int, ...], dtype: np.dtype[Any]
+    ) -> None:
+        # The export blocks closing. It is released before the memory is.
+        self._export = ctypes.c_char.from_buffer(memory.buf)
+        self.memory = memory
+        self.__array_interface__ = {
+            "data": (ctypes.addressof(self._export), False),
+            "shape": shape,
+            "typestr": dtype.str,
+            "descr": dtype.descr,
+            "version": 3,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class SharedQuantityHandle:
+    """A small, picklable reference to a `SharedQuantity`.
+
+    Send this to another process and `attach` it there to get the quantity
+    without copying its value.
+    """
+
+    name: str
+    shape: tuple[int, ...]
+    dtype: str
+    unit: Unit
+
+    def attach(self) -> SharedQuantity:
+        """Attach to the shared memory, in this process."""
+        return SharedQuantity(self, SharedMemory(name=self.name), owner=False)
+
+
+class SharedQuantity:
+    """A NumPy-backed Quantity in shared memory.
+
+    Make one with `shared_quantity` (or `SharedQuantity.empty`), pass its
+    `handle` (or itself, which pickles as its handle) to other processes
+    and `~SharedQuantityHandle.attach` it there.
+
+    The memory lives until it is unlinked. Use it as a context manager, or
+    call `close` in every process and `unlink` once. Exiting the context
+    unlinks the memory if this is the process that created it.
+
+    Parameters
+    ----------
+    handle : SharedQuantityHandle
+        The handle.
+    memory : `multiprocessing.shared_memory.SharedMemory`
+        The shared memory block.
+    owner : bool, optional keyword-only
+        Whether this process created the memory.
+
+    """
+
+    def __init__(
+        self, handle: SharedQuantityHandle, memory: SharedMemory, *, owner: bool
+    ) -> None:
+        self.handle = handle
+        self.owner = owner
+        self._memory: SharedMemory | None = memory
+        buffer = _SharedBuffer(memory, handle.shape, np.dtype(handle.dtype))
+        self._buffer = weakref.ref(buffer)  # alive while any view of it is
+        self._quantity: Quantity[Any] | None = Quantity(
+            np.asarray(buffer), unit=handle.unit
+        )
+
+    @classmethod
+    def empty(
+        cls: type[Self],
+        shape: tuple[int, ...],
+        unit: Unit | str,
+        dtype: DTypeLike = float,
+    ) -> Self:
+        """Make an uninitialized SharedQuantity, e.g. for an output."""
+        dtype = np.dtype(dtype)
+        if dtype.hasobject:
+            msg = "cannot share Quantities of Python objects"
+            raise TypeError(msg)
+        shape = tuple(shape)
+        nbytes = int(np.prod(shape)) * dtype.itemsize
+        memory = SharedMemory(create=True, size=max(nbytes, 1))
+        handle = SharedQuantityHandle(memory.name, shape, dtype.str, parse_unit(unit))
+        return cls(handle, memory, owner=True)
+
+    @property
+    def quantity(self) -> Quantity[Any]:
+        """The Quantity, whose value is a view of the shared memory."""
+        if self._quantity is None:
+            msg = "the SharedQuantity is closed"
+            raise ValueError(msg)
+        return self._quantity
+
+    @property
+    def value(self) -> np.ndarray[Any, Any]:
+        """The value, a view of the shared memory."""
+        return self.quantity.value  # type: ignore[no-any-return]
+
+    @property
+    def unit(self) -> Unit:
+        """The unit."""
+        return self.handle.unit
+
+    def __repr__(self) -> str:
+        state = "closed" if self._memory is None else "open"
+        return f"<{type(self).__name__} {self.handle.name!r} ({state})>"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Pickled as the handle, and reattached when unpickled.
+        return (SharedQuantityHandle.attach, (self.handle,))
+
+    # --- Lifetime ---
+
+    def close(self) -> None:
+        """Detach from the shared memory, in this process.
+
+        All references to the value (and views of it) must be dropped first.
+        """
+        if self._memory is None:
+            return
+        self._quantity = None
+        buffer = self._buffer()
+        if buffer is not None:
+            self._quantity = Quantity(np.asarray(buffer), unit=self.handle.unit)
+            msg = "the value is still referenced, so the memory can't be closed"
+            raise BufferError(msg)
+        self._memory.close()
+        self._memory = None
+
+    def unlink(self) -> None:
+        """Free the shared memory. Call this once, in any process."""
+        if self._memory is not None:
+            self._memory.unlink()
+            return
+        memory = SharedMemory(name=self.handle.name)
+        try:
+            memory.unlink()
+        finally:
+            memory.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        try:  # free the memory, even if the value is still referenced
+            if self.owner:
+                self.unlink()
+        finally:
+            self.close()
+
+
+def shared_quantity(value: Any, /, unit: Unit | str | None = None) -> SharedQuantity:
+    """Copy a value, or Quantity, into shared memory.
+
+    Parameters
+    ----------
+    value : array-like or Quantity
+        The value. It is converted to a NumPy array.
+    unit : Unit or str, optional
+        The unit. Required if ``value`` is not a Quantity.
+
+    Returns
+    -------
+    SharedQuantity
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import units
+    >>> with units.shared_quantity(np.arange(3.0), "km") as shared:
+    ...     shared.quantity.to_unit_value("m")
+    array([   0., 1000., 2000.])
+
+    """
+    if isinstance(value, AbstractQuantity):
+        unit = value.unit if unit is None else parse_unit(unit)
+        value = value.to_unit_value(unit)
+    if unit is None:
+        msg = "a unit is required for values that aren't quantities"
+        raise ValueError(msg)
+    array = np.asarray(value)
+    shared = SharedQuantity.empty(array.shape, unit, dtype=array.dtype)
+    shared.value[...] = array
+    return shared
+
+
+def _run_chunk(
+    func: Callable[..., Any],
+    handles: tuple[SharedQuantityHandle, ...],
+    start: int,
+    stop: int,
+) -> Any:
+    """Apply ``func`` to a slice of shared quantities, in a worker."""
+    attached = [handle.attach() for handle in handles]
+    try:
+        return func(*(Quantity(s.value[start:stop], unit=s.unit) for s in attached))
+    finally:
+        for s in attached:
+            with suppress(BufferError):  # the result is a view, closed when collected
+                s.close()
+
+
+def shared_map(
+    func: Callable[..., Any],
+    /,
+    *shared: SharedQuantity,
+    executor: Executor | None = None,
+    chunks: int | None = None,
+) -> list[Any]:
+    """Apply a function to chunks of shared quantities in a process pool.
+
+    The quantities are split along their first axis and ``func`` is called
+    in the workers with the matching chunk of each, as Quantities viewing
+    the shared memory. Only the handles are sent to the workers, so
+    nothing is copied. Results can be returned (they are pickled), or
+    written into a shared output quantity passed as one of the arguments.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The function, which must be picklable, e.g. defined in a module.
+    *shared : SharedQuantity
+        The quantities, with the same length.
+    executor : `concurrent.futures.Executor`, optional keyword-only
+        The executor. If not given, a `~concurrent.futures.ProcessPoolExecutor`
+        is used for the call.
+    chunks : int, optional keyword-only
+        The number of chunks. Defaults to the number of CPUs.
+
+    Returns
+    -------
+    list
+        The result of each chunk, in order.
+
+    Examples
+    --------
+    Convert into a shared output, in parallel:
+
+    >>> def convert(x, out):  # doctest: +SKIP
+    ...     x.to_unit_value(out.unit, out=out.value)
+    >>> units.shared_map(convert, x, out)  # doctest: +SKIP
+
+    """
+    if not shared:
+        msg = "shared_map needs at least one SharedQuantity"
+        raise ValueError(msg)
+    lengths = {len(s.value) for s in shared}
+    if len(lengths) != 1:
+        msg = f"the quantities have different lengths: {sorted(lengths)}"
+        raise ValueError(msg)
+    (length,) = lengths
+
+    n = min(chunks or os.cpu_count() or 1, length) or 1
+    bounds = np.linspace(0, length, n + 1).astype(int).tolist()
+    handles = tuple(s.handle for s in shared)
+
+    def run(executor: Executor) -> list[Any]:
+        futures = [
+            executor.submit(_run_chunk, func, handles, start, stop)
+            for start, stop in itertools.pairwise(bounds)
+        ]
+        return [future.result() for future in futures]
+
+    if executor is not None:
+        return run(executor)
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor() as pool:
+        return run(pool)
@@ -0,0 +1,268 @@
+"""Streaming unit conversion of chunked data."""
+
+from __future__ import annotations
+
+__all__ = ["convert_stream", "aconvert_stream"]
+
+import asyncio
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+from units._quantity.fields import deferred_value
+from units._quantity.interface.funcs import lookup_interface
+from units._unit.conversion import conversion_factor
+from units._unit.parse import parse_unit
+
+from .base import AbstractQuantity
+from .core import Quantity
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+    from concurrent.futures import Executor
+
+    from units._unit.core import Unit
+
+_DONE = object()
+"""Sentinel for the end of a read-ahead stream."""
+
+_PUT_TIMEOUT = 0.1
+"""Seconds between checks for a closed stream, when the read-ahead is full."""
+
+
+@dataclass
+class _Converter:
+    """The conversion plan of a stream.
+
+    The conversion factors are computed once per source unit, so converting
+    a chunk is a dictionary lookup and a `scale` by the chunk's interface.
+    """
+
+    unit: Unit
+    from_unit: Unit | None
+    _factors: dict[Unit, float] = field(default_factory=dict, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.from_unit is not None:
+            self.factor(self.from_unit)
+
+    def factor(self, unit: Unit, /) -> float:
+        """Get the conversion factor from ``unit``."""
+        try:
+            return self._factors[unit]
+        except KeyError:
+            factor = self._factors[unit] = conversion_factor(unit, self.unit)
+            return factor
+
+    def __call__(self, chunk: Any, /) -> AbstractQuantity[Any]:
+        if isinstance(chunk, AbstractQuantity):
+            value, pending = deferred_value(chunk)
+            factor = pending * self.factor(chunk.unit)
+        elif self.from_unit is None:
+            msg = "chunks that aren't quantities need a `from_unit`"
+            raise ValueError(msg)
+        else:
+            value, factor = chunk, self._factors[self.from_unit]
+
+        if factor != 1:
+            value = lookup_interface(value).scale(value, factor)
+        if isinstance(chunk, AbstractQuantity):
+            return replace(chunk, value=value, unit=self.unit)
+        return Quantity(value, unit=self.unit)
+
+
+def _put(q: queue.Queue[Any], item: Any, stop: threading.Event, /) -> bool:
+    """Put an item on a bounded queue, unless the stream is closed."""
+    while not stop.is_set():
+        try:
+            q.put(item, timeout=_PUT_TIMEOUT)
+        except queue.Full:
+            continue
+        return True
+    return False
+
+
+def _read_ahead(chunks: Iterable[Any], size: int, /) -> Iterator[Any]:
+    """Read up to ``size`` chunks ahead in a background thread."""
+    q: queue.Queue[tuple[Any, BaseException | None]] = queue.Queue(maxsize=size)
+    stop = threading.Event()
+
+    def produce() -> None:
+        try:
+            for chunk in chunks:
+                if not _put(q, (chunk, None), stop):
+                    return
+        except BaseException as error:  # noqa: BLE001  # re-raised by the reader
+            _put(q, (_DONE, error), stop)
+        else:
+            _put(q, (_DONE, None), stop)
+
+    threading.Thread(target=produce, name="units-read-ahead", daemon=True).start()
+    try:
+        while True:
+            chunk, error = q.get()
+            if chunk is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+    finally:
+        stop.set()
+
+
+def convert_stream(
+    chunks: Iterable[Any],
+    unit: Unit | str,
+    /,
+    *,
+    from_unit: Unit | str | None = None,
+    prefetch: int = 0,
+    executor: Executor | None = None,
+) -> Iterator[AbstractQuantity[Any]]:
+    """Convert a stream of chunks to a unit.
+
+    Parameters
+    ----------
+    chunks : Iterable
+        The chunks: quantities, or arrays in ``from_unit``.
+    unit : Unit or str
+        The unit to convert to.
+    from_unit : Unit or str, optional keyword-only
+        The unit of chunks that aren't quantities.
+    prefetch : int, optional keyword-only
+        The maximum number of chunks taken from ``chunks`` ahead of the
+        consumer. With an ``executor`` these are converted concurrently,
+        otherwise they are read ahead in a background thread (useful if
+        reading involves I/O). The source is not read further until the
+        consumer catches up. ``0`` reads and converts a chunk only when it
+        is requested.
+    executor : `concurrent.futures.Executor`, optional keyword-only
+        Executor to convert chunks in, e.g. a thread pool.
+
+    Yields
+    ------
+    Quantity
+        The converted chunks, in order.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import units
+    >>> chunks = (np.arange(3.0) for _ in range(2))
+    >>> for q in units.convert_stream(chunks, "m", from_unit="km"):
+    ...     print(q.value)
+    [   0. 1000. 2000.]
+    [   0. 1000. 2000.]
+
+    """
+    if prefetch < 0:
+        msg = f"prefetch must be non-negative, not {prefetch}"
+        raise ValueError(msg)
+    convert = _Converter(
+        parse_unit(unit), None if from_unit is None else parse_unit(from_unit)
+    )
+    return _convert_stream(chunks, convert, prefetch, executor)
+
+
+def _convert_stream(
+    chunks: Iterable[Any],
+    convert: _Converter,
+    prefetch: int,
+    executor: Executor | None,
+    /,
+) -> Iterator[AbstractQuantity[Any]]:
+    if executor is None:
+        source = chunks if prefetch == 0 else _read_ahead(chunks, prefetch)
+        for chunk in source:
+            yield convert(chunk)
+        return
+
+    pending: deque[Any] = deque()
+    try:
+        for chunk in chunks:
+            pending.append(executor.submit(convert, chunk))
+            if len(pending) > prefetch:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _aread_ahead(chunks: AsyncIterable[Any], size: int, /) -> AsyncIterator[Any]:
+    """Read up to ``size`` chunks ahead in a background task."""
+    q: asyncio.Queue[tuple[Any, BaseException | None]] = asyncio.Queue(maxsize=size)
+
+    async def produce() -> None:
+        try:
+            async for chunk in chunks:
+                await q.put((chunk, None))
+        except Exception as error:  # noqa: BLE001  # re-raised by the reader
+            await q.put((_DONE, error))
+        else:
+            await q.put((_DONE, None))
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            chunk, error = await q.get()
+            if chunk is _DONE:
+                if error is not None:
+                    raise error
+                return
+            yield chunk
+    finally:
+        task.cancel()
+
+
+async def aconvert_stream(
+    chunks: AsyncIterable[Any],
+    unit: Unit | str,
+    /,
+    *,
+    from_unit: Unit | str | None = None,
+    prefetch: int = 0,
+    executor: Executor | None = None,
+) -> AsyncIterator[AbstractQuantity[Any]]:
+    """Convert an asynchronous stream of chunks to a unit.
+
+    The asynchronous version of `convert_stream`, with the same parameters.
+    Without an ``executor`` the chunks are converted in the event loop,
+    otherwise in the executor, with up to ``prefetch`` chunks converted
+    concurrently. Without an ``executor``, ``prefetch`` chunks are read
+    ahead in a background task.
+
+    Yields
+    ------
+    Quantity
+        The converted chunks, in order.
+
+    """
+    if prefetch < 0:
+        msg = f"prefetch must be non-negative, not {prefetch}"
+        raise ValueError(msg)
+    convert = _Converter(
+        parse_unit(unit), None if from_unit is None else parse_unit(from_unit)
+    )
+
+    if executor is None:
+        source = chunks if prefetch == 0 else _aread_ahead(chunks, prefetch)
+        async for chunk in source:
+            yield convert(chunk)
+        return
+
+    loop = asyncio.get_running_loop()
+    pending: deque[asyncio.Future[AbstractQuantity[Any]]] = deque()
+    try:
+        async for chunk in chunks:
+            pending.append(loop.run_in_executor(executor, convert, chunk))
+            if len(pending) > prefetch:
+                yield await pending.popleft()
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,427 @@
+"""NumPy ufunc support for Quantities.
+
+Each ufunc has a unit rule, which from the units of the inputs gives the
+unit each input must be converted to and the unit of the result. Units are
+resolved once per call, then the ufunc runs on the plain values, so e.g. a
+reduction over a large array costs the same as on the array itself.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+from dataclasses import replace
+from fractions import Fraction
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+from astropy.units import deg, rad
+
+from units._quantity.up import dimensionless
+from units._unit.conversion import conversion_factor
+from units._unit.core import Unit
+from units.api import Quantity as QuantityAPI
+
+from .core import Quantity
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+
+    from units._quantity.base import AbstractQuantity
+
+    Rule = Callable[[tuple[Unit | None, ...], tuple[Any, ...]], tuple[Any, Any]]
+
+_radian = Unit(rad)
+_degree = Unit(deg)
+
+
+# ============================================================================
+# Unit rules
+# A rule takes the units of the inputs (`None` for inputs that aren't
+# Quantities) and the inputs themselves, and returns the units to convert the
+# inputs to (`None` to leave an input as is) and the unit of the result
+# (`None` for results without a unit, e.g. booleans).
+
+
+def _reference(units: tuple[Unit | None, ...], /) -> Unit:
+    """Get the unit of the first Quantity input."""
+    return next((unit for unit in units if unit is not None), dimensionless)
+
+
+def _preserve(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (None,) * len(units), _reference(units)
+
+
+def _preserve2(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    unit = _reference(units)
+    return (None,), (unit, unit)
+
+
+def _same(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    unit = _reference(units)
+    return (unit,) * len(units), unit
+
+
+def _same_unitless(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    unit = _reference(units)
+    return (unit,) * len(units), None
+
+
+def _same_dimensionless(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    unit = _reference(units)
+    return (unit,) * len(units), dimensionless
+
+
+def _divmod(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    unit = _reference(units)
+    return (unit, unit), (dimensionless, unit)
+
+
+def _copysign(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (None, None), units[0] or dimensionless
+
+
+def _unitless(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (None,) * len(units), None
+
+
+def _dimensionless(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (dimensionless,) * len(units), dimensionless
+
+
+def _frexp(_units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (dimensionless,), (dimensionless, None)
+
+
+def _ldexp(_units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (dimensionless, None), dimensionless
+
+
+def _multiply(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    left, right = (unit or dimensionless for unit in units)
+    return (None, None), left * right
+
+
+def _divide(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    left, right = (unit or dimensionless for unit in units)
+    return (None, None), left / right
+
+
+def _reciprocal(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (None,), dimensionless / (units[0] or dimensionless)
+
+
+def _power_of(power: int | Fraction, /) -> Rule:
+    def rule(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+        return (None,), (units[0] or dimensionless) ** power
+
+    return rule
+
+
+def _power(units: tuple[Unit | None, ...], inputs: tuple[Any, ...]) -> Any:
+    base = units[0] or dimensionless
+    if base.is_equivalent(dimensionless):
+        return (dimensionless, dimensionless), dimensionless
+    exponent = inputs[1]
+    if isinstance(exponent, QuantityAPI):
+        exponent = exponent.to_unit_value(dimensionless)
+    if np.ndim(exponent) != 0:
+        msg = "the exponent of a Quantity with a unit must be a scalar."
+        raise ValueError(msg)
+    return (None, dimensionless), base ** float(exponent)
+
+
+def _trig(_units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (_radian,), dimensionless
+
+
+def _inverse_trig(_units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (dimensionless,), _radian
+
+
+def _arctan2(units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    unit = _reference(units)
+    return (unit, unit), _radian
+
+
+def _to_radian(_units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (_degree,), _radian
+
+
+def _to_degree(_units: tuple[Unit | None, ...], _: tuple[Any, ...]) -> Any:
+    return (_radian,), _degree
+
+
+_RULES_BY_NAME: dict[Rule, tuple[str, ...]] = {
+    _preserve: (
+        "absolute",
+        "fabs",
+        "negative",
+        "positive",
+        "conjugate",
+        "rint",
+        "floor",
+        "ceil",
+        "trunc",
+        "spacing",
+    ),
+    _preserve2: ("modf",),
+    _same: (
+        "add",
+        "subtract",
+        "maximum",
+        "minimum",
+        "fmax",
+        "fmin",
+        "hypot",
+        "remainder",
+        "fmod",
+        "nextafter",
+    ),
+    _same_unitless: (
+        "equal",
+        "not_equal",
+        "less",
+        "less_equal",
+        "greater",
+        "greater_equal",
+    ),
+    _same_dimensionless: ("floor_divide",),
+    _divmod: ("divmod",),
+    _copysign: ("copysign",),
+    _unitless: (
+        "isfinite",
+        "isinf",
+        "isnan",
+        "isnat",
+        "signbit",
+        "sign",
+        "logical_and",
+        "logical_or",
+        "logical_xor",
+        "logical_not",
+    ),
+    _dimensionless: (
+        "exp",
+        "exp2",
+        "expm1",
+        "log",
+        "log2",
+        "log10",
+        "log1p",
+        "logaddexp",
+        "logaddexp2",
+        "sinh",
+        "cosh",
+        "tanh",
+        "arcsinh",
+        "arccosh",
+        "arctanh",
+        "heaviside",
+        "bitwise_and",
+        "bitwise_or",
+        "bitwise_xor",
+        "bitwise_not",
+        "bitwise_count",
+        "invert",
+        "left_shift",
+        "right_shift",
+        "gcd",
+        "lcm",
+    ),
+    _frexp: ("frexp",),
+    _ldexp: ("ldexp",),
+    _multiply: ("multiply", "matmul", "vecdot", "matvec", "vecmat"),
+    _divide: ("divide", "true_divide"),
+    _reciprocal: ("reciprocal",),
+    _power_of(2): ("square",),
+    _power_of(Fraction(1, 2)): ("sqrt",),
+    _power_of(Fraction(1, 3)): ("cbrt",),
+    _power: ("power", "float_power"),
+    _trig: ("sin", "cos", "tan"),
+    _inverse_trig: ("arcsin", "arccos", "arctan"),
+    _arctan2: ("arctan2",),
+    _to_radian: ("deg2rad", "radians"),
+    _to_degree: ("rad2deg", "degrees"),
+}
+
+UFUNC_RULES: dict[np.ufunc, Rule] = {
+    ufunc: rule
+    for rule, names in _RULES_BY_NAME.items()
+    for name in names
+    if isinstance(ufunc := getattr(np, name, None), np.ufunc)
+}
+"""The unit rule of each supported ufunc."""
+
+
+# ============================================================================
+# Dispatch
+
+
+def _convert(x: Any, unit: Unit | None, /) -> Any:
+    """Get the plain value of an input, converted to ``unit``."""
+    if isinstance(x, QuantityAPI):
+        return x.value if unit is None else x.to_unit_value(unit)
+    if unit is None:
+        return x
+    factor = conversion_factor(dimensionless, unit)  # raises if not unitless
+    return x if factor == 1 else x * factor
+
+
+def _wrap(template: AbstractQuantity[Any], value: Any, unit: Unit | None, /) -> Any:
+    """Make a Quantity like ``template``, or a plain value if no ``unit``."""
+    if unit is None:
+        return value
+    if type(template) is not Quantity and not unit.is_equivalent(template.unit):
+        # Subclasses, e.g. angles, may not be valid with other units.
+        return Quantity(value, unit=unit)
+    return replace(template, value=value, unit=unit)
+
+
+def _wrap_out(
+    template: AbstractQuantity[Any],
+    value: Any,
+    unit: Unit | None,
+    out: Any,
+    /,
+    *,
+    where: Any = True,
+) -> Any:
+    """Wrap a result that was written into ``out``.
+
+    A Quantity ``out`` keeps its unit: the result, written (where ``where``
+    is true) in ``unit``, is converted to it in place.
+    """
+    if not isinstance(out, QuantityAPI):
+        return _wrap(template, value, unit)
+    if unit is not out.unit:
+        factor = conversion_factor(unit or dimensionless, out.unit)
+        if factor != 1:
+            np.multiply(out.value, factor, out=out.value, where=where)
+    return out
+
+
+def _resolve(ufunc: np.ufunc, inputs: Sequence[Any], /) -> tuple[list[Any], Any]:
+    """Get the converted plain inputs and the result unit(s)."""
+    try:
+        rule = UFUNC_RULES[ufunc]
+    except KeyError:
+        msg = f"ufunc {ufunc.__name__!r} is not supported for Quantities."
+        raise TypeError(msg) from None
+    units = tuple(x.unit if isinstance(x, QuantityAPI) else None for x in inputs)
+    targets, result = rule(units, tuple(inputs))
+    return [_convert(x, t) for x, t in zip(inputs, targets, strict=True)], result
+
+
+def _plain_out(kwargs: dict[str, Any], /) -> tuple[Any, ...] | None:
+    """Replace Quantities in ``out`` with their values, returning the original."""
+    out = kwargs.get("out")
+    if out is None:
+        return None
+    kwargs["out"] = tuple(x.value if isinstance(x, QuantityAPI) else x for x in out)
+    return tuple(out)
+
+
+def array_ufunc(
+    template: AbstractQuantity[Any],
+    ufunc: np.ufunc,
+    method: str,
+    *inputs: Any,
+    **kwargs: Any,
+) -> Any:
+    """Apply a ufunc method to Quantities.
+
+    Parameters
+    ----------
+    template : AbstractQuantity
+        The Quantity whose type the results take, if the unit allows it.
+    ufunc : `numpy.ufunc`
+        The ufunc.
+    method : str
+        ``"__call__"``, ``"outer"``, ``"reduce"``, ``"accumulate"``,
+        ``"reduceat"`` or ``"at"``.
+    *inputs, **kwargs
+        The arguments of the ufunc method. ``out`` may hold Quantities or
+        plain arrays; ``where`` and other options are passed through.
+
+    Returns
+    -------
+    Any
+        The result(s), as Quantities if they have a unit.
+
+    """
+    if method in ("__call__", "outer"):
+        values, result = _resolve(ufunc, inputs)
+        out = _plain_out(kwargs)
+        output = getattr(ufunc, method)(*values, **kwargs)
+        where = kwargs.get("where", True)
+        if ufunc.nout == 1:
+            return (
+                _wrap(template, output, result)
+                if out is None
+                else _wrap_out(template, output, result, out[0], where=where)
+            )
+        outs = out or (None,) * ufunc.nout
+        return tuple(
+            _wrap(template, value, unit)
+            if o is None
+            else _wrap_out(template, value, unit, o, where=where)
+            for value, unit, o in zip(output, result, outs, strict=True)
+        )
+
+    if method in ("reduce", "accumulate", "reduceat"):
+        return _reduce(template, ufunc, method, *inputs, **kwargs)
+
+    if method == "at":
+        return _at(ufunc, *inputs)
+
+    return NotImplemented
+
+
+def _reduce(
+    template: AbstractQuantity[Any],
+    ufunc: np.ufunc,
+    method: str,
+    array: Any,
+    *args: Any,
+    **kwargs: Any,
+) -> Any:
+    if ufunc.nin != 2:
+        msg = f"{method} only supported for binary functions"
+        raise ValueError(msg)
+
+    # The result unit must be that of the input, since it is combined with
+    # itself, e.g. ``add.reduce``. Multiplication only works if dimensionless.
+    unit = array.unit if isinstance(array, QuantityAPI) else None
+    targets, result = UFUNC_RULES[ufunc]((unit, unit), (array, array))
+    if result is not None and result != (unit or dimensionless):
+        msg = f"{ufunc.__name__}.{method} changes the unit {unit}."
+        raise ValueError(msg)
+    value = _convert(array, targets[0])
+
+    if isinstance(kwargs.get("initial"), QuantityAPI):
+        kwargs["initial"] = kwargs["initial"].to_unit_value(targets[0] or unit)
+    out = _plain_out(kwargs)
+    output = getattr(ufunc, method)(value, *args, **kwargs)
+    if result is not None:
+        result = targets[0] or unit
+    return (
+        _wrap(template, output, result)
+        if out is None
+        else _wrap_out(template, output, result, out[0])
+    )
+
+
+def _at(ufunc: np.ufunc, array: Any, indices: Any, *others: Any) -> None:
+    if not isinstance(array, QuantityAPI):
+        msg = f"{ufunc.__name__}.at requires the first input to be a Quantity."
+        raise TypeError(msg)
+
+    # The values are modified in place, so the unit can't change. A pending
+    # conversion factor is applied first, so that the value is not copied.
+    _ = array.value
+    values, result = _resolve(ufunc, (array, *others))
+    if result is not array.unit or values[0] is not array.value:
+        msg = f"{ufunc.__name__}.at would change the unit {array.unit}."
+        raise ValueError(msg)
+    ufunc.at(values[0], indices, *values[1:])
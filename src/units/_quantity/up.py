@@ -1,18 +1,66 @@
-__all__ = ["result_unit"]
+__all__ = ["result_unit", "register_result_unit", "result_unit_cache"]
 
 from collections.abc import Callable
 
 from astropy.units import dimensionless_unscaled
 
+from units._dimension.builtin_dimensions import angle
 from units._dimension.core import Dimension
 from units._unit.core import Unit
+from units._utils import LRUCache
 
 dimensionless = Unit(dimensionless_unscaled)
 
+ResultUnitRule = Callable[[tuple[Unit, ...]], Unit]
+
+_RESULT_UNIT_RULES: dict[str, dict[tuple[Dimension | None, ...], ResultUnitRule]] = {}
+
+result_unit_cache: LRUCache[tuple[str, tuple[Unit, ...]], Unit] = LRUCache(maxsize=1024)
+"""Cache of result units, keyed on ``(op, units)``."""
+
+
+def register_result_unit(
+    op: str, *dimensions: Dimension | None
+) -> Callable[[ResultUnitRule], ResultUnitRule]:
+    """Register the rule giving the result unit of an operation.
+
+    Parameters
+    ----------
+    op : str
+        The operation, e.g. ``"cos"`` or ``"mylib.myfunc"``.
+    *dimensions : Dimension or None
+        The dimension of each operand the rule applies to. `None` matches
+        any dimension. Rules for exact dimensions take precedence.
+
+    Returns
+    -------
+    Callable
+        Decorator, registering a function that takes the tuple of operand
+        units and returns the result unit.
+
+    Examples
+    --------
+    >>> from units import length
+    >>> @register_result_unit("mylib.norm", length)
+    ... def _norm(units):
+    ...     return units[0]
+
+    """
+
+    def decorator(rule: ResultUnitRule) -> ResultUnitRule:
+        _RESULT_UNIT_RULES.setdefault(op, {})[dimensions] = rule
+        result_unit_cache.clear()  # cached results may have another rule now
+        return rule
+
+    return decorator
+
 
 def result_unit(op: str, *units: Unit) -> Unit:
     """Get the result unit of an operation.
 
+    The rule is looked up by the operation and the dimensions of the units,
+    and results are cached, so repeated calls are a dictionary lookup.
+
     Parameters
     ----------
     op : str
@@ -25,37 +73,52 @@ def result_unit(op: str, *units: Unit) -> Unit:
     `~astropy.units.Unit`
         The result unit.
 
+    Raises
+    ------
+    ValueError
+        If there is no rule for the operation and dimensions.
+
     """
-    return _RESULT_UNIT_OP[op](units)
+    return result_unit_cache.get_or_compute((op, units), _compute_result_unit)
 
 
-def _trig(units: tuple[Unit, ...]) -> Unit:
-    if len(units) != 1:
-        msg = "trig operation requires exactly one unit."
-        raise ValueError(msg)
-    if units[0].dimensions != Dimension("angle"):
-        msg = "trig operation requires a dimensionless unit."
+def _compute_result_unit(key: tuple[str, tuple[Unit, ...]], /) -> Unit:
+    op, units = key
+    rules = _RESULT_UNIT_RULES.get(op, {})
+    dimensions = tuple(unit.dimensions for unit in units)
+    rule = rules.get(dimensions)
+    if rule is None:
+        # Try the rules with wildcards, the most specific (fewest `None`s)
+        # first, then the earliest registered.
+        matches = [
+            signature
+            for signature in rules
+            if len(signature) == len(dimensions)
+            and all(
+                s is None or s == d for s, d in zip(signature, dimensions, strict=True)
+            )
+        ]
+        if matches:
+            rule = rules[min(matches, key=lambda sig: sig.count(None))]
+    if rule is None:
+        msg = f"{op} is not defined for operands with dimensions {dimensions}."
         raise ValueError(msg)
-    return dimensionless
+    return rule(units)
 
 
-def _sigmoid(units: tuple[Unit, ...]) -> Unit:
-    if len(units) != 1:
-        msg = "sigmoid operation requires exactly one unit."
-        raise ValueError(msg)
-    if units[0].dimensions != Dimension("dimensionless"):
-        msg = "sigmoid operation requires a dimensionless unit."
-        raise ValueError(msg)
+# ============================================================================
+# Built-in rules
+
+register_result_unit("add", None, None)(lambda units: units[0] + units[1])
+register_result_unit("subtract", None, None)(lambda units: units[0] - units[1])
+register_result_unit("multiply", None, None)(lambda units: units[0] * units[1])
+register_result_unit("divide", None, None)(lambda units: units[0] / units[1])
+
+
+def _dimensionless(_: tuple[Unit, ...]) -> Unit:
     return dimensionless
 
 
-_RESULT_UNIT_OP: dict[str, Callable[[tuple[Unit, ...]], Unit]] = {
-    "add": lambda units: units[0] + units[1],
-    "subtract": lambda units: units[0] - units[1],
-    "multiply": lambda units: units[0] * units[1],
-    "divide": lambda units: units[0] / units[1],
-    "cos": _trig,
-    "sin": _trig,
-    "numpy.cos": _trig,
-    "pytorch.sigmoid": _sigmoid,
-}
+for _op in ("cos", "sin", "numpy.cos"):
+    register_result_unit(_op, angle)(_dimensionless)
+register_result_unit("pytorch.sigmoid", dimensionless.dimensions)(_dimensionless)
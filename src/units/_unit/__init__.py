@@ -2,10 +2,25 @@
 
 from __future__ import annotations
 
-from . import core, system
+from typing import Any
+
+from . import conversion, core, parse, system
+from .conversion import *
 from .core import *
+from .parse import *
 from .system import *
 
 __all__ = []
 __all__ += core.__all__
+__all__ += conversion.__all__
+__all__ += parse.__all__
 __all__ += system.__all__
+__all__ += system.realizations.__all__
+
+
+def __getattr__(name: str) -> Any:
+    # The unit-system realizations are built on first access.
+    if name in system.realizations.__all__:
+        return getattr(system.realizations, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
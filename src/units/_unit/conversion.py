@@ -0,0 +1,57 @@
+"""Unit conversion factors."""
+
+from __future__ import annotations
+
+__all__ = ["conversion_factor", "conversion_cache"]
+
+from typing import TYPE_CHECKING
+
+from units import diagnostics
+from units._utils import LRUCache
+
+if TYPE_CHECKING:
+    from .core import Unit
+
+
+conversion_cache: LRUCache[tuple[Unit, Unit], float] = LRUCache(maxsize=1024)
+"""Cache of conversion factors, keyed on ``(from_unit, to_unit)``.
+
+Resize with ``conversion_cache.maxsize = n``, empty with
+``conversion_cache.clear()``, turn off with ``conversion_cache.enabled =
+False`` and inspect with ``conversion_cache.cache_info()``.
+"""
+
+
+def _compute_conversion_factor(units: tuple[Unit, Unit], /) -> float:
+    from_unit, to_unit = units[0].wrapped, units[1].wrapped
+    if diagnostics.active:
+        return float(diagnostics.astropy_call("UnitBase.to", from_unit.to, to_unit))
+    return float(from_unit.to(to_unit))
+
+
+def conversion_factor(from_unit: Unit, to_unit: Unit, /) -> float:
+    """Get the factor converting values in ``from_unit`` to ``to_unit``.
+
+    Parameters
+    ----------
+    from_unit, to_unit : `~units.Unit`
+        The units to convert between.
+
+    Returns
+    -------
+    float
+        The scale factor.
+
+    Raises
+    ------
+    `~astropy.units.UnitConversionError`
+        If the units are not convertible.
+
+    """
+    if diagnostics.active:
+        diagnostics.count("conversions", (from_unit, to_unit))
+    if from_unit is to_unit:
+        return 1.0
+    return conversion_cache.get_or_compute(
+        (from_unit, to_unit), _compute_conversion_factor
+    )
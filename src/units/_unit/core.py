@@ -1,27 +1,46 @@
 from __future__ import annotations
 
-__all__ = ["Unit"]
+__all__ = ["Unit", "unit_algebra_cache"]
 
-from dataclasses import dataclass, replace
+import operator
+from dataclasses import dataclass, field, replace
+from functools import cached_property
 from typing import TYPE_CHECKING, Any, TypeVar, cast, overload
+from weakref import WeakValueDictionary
 
 from astropy.units import UnitBase as APYUnit  # noqa: TCH002
 
+from units import diagnostics
 from units._dimension.core import Dimension
 from units._dimension.utils import get_dimension_name
+from units._utils import LRUCache
 from units.api._unit import Array as ArrayAPI
 
+from .decompose import DimensionVector, decompose
+
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     from units._quantity.core import Quantity
 
 
 Array = TypeVar("Array", bound=ArrayAPI)
 
+_DIMENSIONS_BY_VECTOR: dict[DimensionVector, Dimension] = {}
+
+_UNITS_CACHE: WeakValueDictionary[APYUnit, Unit] = WeakValueDictionary()
 
-@dataclass(frozen=True)
+unit_algebra_cache: LRUCache[tuple[str, Unit, Any], Unit] = LRUCache(maxsize=1024)
+"""Memo table of unit algebra results, keyed on ``(op, unit, other)``."""
+
+
+@dataclass(frozen=True, eq=False)
 class Unit:
     """Unit.
 
+    Units are interned: constructing a `Unit` from an astropy unit that is
+    already wrapped returns the existing instance.
+
     .. todo::
 
         Remove the ``Wrapper`` stuff when this is part of Astropy.
@@ -29,6 +48,69 @@ class Unit:
     """
 
     wrapped: APYUnit
+    scale: float = field(init=False, repr=False)
+    """Scale of the unit relative to the SI base units."""
+    dimension_vector: DimensionVector | None = field(init=False, repr=False)
+    """Integer exponents over the SI base units, `None` if not expressible."""
+    _hash: int = field(init=False, repr=False)
+
+    def __new__(cls, wrapped: APYUnit) -> Self:
+        # Unit is a flyweight based on the wrapped unit, so we cache it.
+        try:
+            return cast("Self", _UNITS_CACHE[wrapped])
+        except KeyError:
+            pass
+
+        self = super().__new__(cls)
+        if diagnostics.active:
+            diagnostics.count("created", "Unit")
+            scale, vector = diagnostics.astropy_call(
+                "UnitBase.decompose", decompose, wrapped
+            )
+        else:
+            scale, vector = decompose(wrapped)
+        object.__setattr__(self, "wrapped", wrapped)
+        object.__setattr__(self, "scale", scale)
+        object.__setattr__(self, "dimension_vector", vector)
+        object.__setattr__(self, "_hash", hash(wrapped))
+        return cast("Self", _UNITS_CACHE.setdefault(wrapped, self))
+
+    def __init__(self, wrapped: APYUnit) -> None:
+        # Everything is set in ``__new__``, so that interned instances are
+        # not re-initialized.
+        pass
+
+    def __reduce__(self) -> tuple[Any, tuple[Any]]:
+        # Pickled as the unit string, which is compact and is parsed (with
+        # caching) into the interned unit on load. Units whose string does
+        # not round-trip are pickled as the astropy unit.
+        token = self._token
+        if token is None:
+            return (type(self), (self.wrapped,))
+        from .parse import parse_unit
+
+        return (parse_unit, (token,))
+
+    @cached_property
+    def _token(self) -> str | None:
+        """The unit string, if it parses back to this unit."""
+        from .parse import parse_unit
+
+        token = self.wrapped.to_string()
+        try:
+            return token if parse_unit(token) is self else None
+        except ValueError:
+            return None
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if not isinstance(other, Unit):
+            return NotImplemented
+        return bool(self.wrapped == other.wrapped)
 
     @property
     def _wrapped_(self) -> APYUnit:
@@ -37,7 +119,21 @@ class Unit:
     @property
     def dimensions(self) -> Dimension:
         """Dimension of the unit."""
-        return Dimension(get_dimension_name(self._wrapped_))
+        vector = self.dimension_vector
+        if vector is None:
+            return Dimension(get_dimension_name(self._wrapped_))
+        try:
+            return _DIMENSIONS_BY_VECTOR[vector]
+        except KeyError:
+            dimension = Dimension(get_dimension_name(self._wrapped_))
+            _DIMENSIONS_BY_VECTOR[vector] = dimension
+            return dimension
+
+    def is_equivalent(self, other: Unit, /) -> bool:
+        """Check if ``other`` has the same dimensions as this unit."""
+        if self.dimension_vector is None or other.dimension_vector is None:
+            return bool(self.wrapped.is_equivalent(other.wrapped))
+        return self.dimension_vector == other.dimension_vector
 
     def __repr__(self) -> str:
         return f"{type(self).__name__}({repr(self.wrapped)[5:-1]})"
@@ -45,13 +141,13 @@ class Unit:
     # --- Addition ---
 
     def __add__(self, other: Unit) -> Unit:
-        if not other.wrapped.is_equivalent(self.wrapped):
+        if not self.is_equivalent(other):
             msg = f"Cannot add units {self} and {other}."
             raise ValueError(msg)
         return self
 
     def __sub__(self, other: Unit) -> Unit:
-        if not other.wrapped.is_equivalent(self.wrapped):
+        if not self.is_equivalent(other):
             msg = f"Cannot subtract units {self} and {other}."
             raise ValueError(msg)
         return self
@@ -67,7 +163,7 @@ class Unit:
 
     def __mul__(self, other: Unit | Array) -> Unit | Quantity[Array]:
         if isinstance(other, Unit):
-            return replace(self, wrapped=self.wrapped * other.wrapped)
+            return unit_algebra_cache.get_or_compute(("mul", self, other), _algebra)
 
         from units._quantity.core import Quantity
 
@@ -83,7 +179,7 @@ class Unit:
 
     def __truediv__(self, other: Unit | Array) -> Unit | Quantity[Array]:
         if isinstance(other, Unit):
-            return replace(self, wrapped=self.wrapped / other.wrapped)
+            return unit_algebra_cache.get_or_compute(("truediv", self, other), _algebra)
 
         from units._quantity.core import Quantity
 
@@ -92,4 +188,23 @@ class Unit:
     # --- Power ---
 
     def __pow__(self, other: Any) -> Unit:
-        return replace(self, wrapped=self.wrapped**other)
+        key = ("pow", self, other)
+        try:
+            hash(other)
+        except TypeError:  # e.g. an array exponent: not cached
+            return _algebra(key)
+        return unit_algebra_cache.get_or_compute(key, _algebra)
+
+
+def _algebra(key: tuple[str, Unit, Any], /) -> Unit:
+    # Computes ``op(unit, other)`` with astropy, for a cache miss.
+    op, unit, other = key
+    func = getattr(operator, op)
+    operand = other.wrapped if isinstance(other, Unit) else other
+    if diagnostics.active:
+        wrapped = diagnostics.astropy_call(
+            f"UnitBase.__{op}__", func, unit.wrapped, operand
+        )
+    else:
+        wrapped = func(unit.wrapped, operand)
+    return replace(unit, wrapped=wrapped)
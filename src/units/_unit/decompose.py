@@ -0,0 +1,115 @@
+"""Dimension exponent vectors.
+
+A unit's dimensions are encoded as a tuple of integer exponents over the SI
+base units, so equivalence checks are tuple comparisons rather than astropy
+round trips.
+"""
+
+from __future__ import annotations
+
+__all__: list[str] = []
+
+from fractions import Fraction
+from typing import TYPE_CHECKING
+
+from astropy.units import si
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from astropy.units import UnitBase
+
+
+DimensionVector = tuple[int, ...]
+
+BASE_UNITS: tuple[UnitBase, ...] = (
+    si.m,
+    si.kg,
+    si.s,
+    si.A,
+    si.K,
+    si.mol,
+    si.cd,
+    si.rad,
+)
+_BASE_INDEX: dict[UnitBase, int] = {base: i for i, base in enumerate(BASE_UNITS)}
+
+
+def decompose(unit: UnitBase, /) -> tuple[float, DimensionVector | None]:
+    """Decompose a unit into a scale and a dimension exponent vector.
+
+    Parameters
+    ----------
+    unit : `~astropy.units.UnitBase`
+        The unit to decompose.
+
+    Returns
+    -------
+    scale : float
+        The scale of the unit relative to the SI base units.
+    vector : tuple[int, ...] or None
+        The exponent of each of `BASE_UNITS`. `None` if the unit has a
+        non-integer exponent or a base outside `BASE_UNITS`, in which case
+        callers must fall back to astropy.
+
+    """
+    decomposed = unit.decompose()
+    vector = [0] * len(BASE_UNITS)
+    for base, power in zip(decomposed.bases, decomposed.powers, strict=True):
+        index = _BASE_INDEX.get(base)
+        if index is None or power != int(power):
+            return float(decomposed.scale), None
+        vector[index] += int(power)
+    return float(decomposed.scale), tuple(vector)
+
+
+def solve(
+    basis: Sequence[DimensionVector], target: DimensionVector, /
+) -> tuple[Fraction, ...] | None:
+    """Express a dimension vector as a combination of basis vectors.
+
+    Uses exact (rational) Gaussian elimination. Basis vectors that depend on
+    earlier ones are given exponent 0, so the solution is unique.
+
+    Parameters
+    ----------
+    basis : sequence of tuple[int, ...]
+        The dimension vectors of the basis units.
+    target : tuple[int, ...]
+        The dimension vector to decompose.
+
+    Returns
+    -------
+    tuple[Fraction, ...] or None
+        The exponent of each basis vector, or `None` if ``target`` is not in
+        their span.
+
+    """
+    # Augmented matrix, one row per base dimension: [basis columns | target].
+    rows = [
+        [Fraction(vec[i]) for vec in basis] + [Fraction(target[i])]
+        for i in range(len(target))
+    ]
+    pivots: list[int] = []  # column of each pivot, in row order
+    for col in range(len(basis)):
+        row = len(pivots)
+        pivot = next((r for r in range(row, len(rows)) if rows[r][col]), None)
+        if pivot is None:
+            continue  # depends on earlier columns
+        rows[row], rows[pivot] = rows[pivot], rows[row]
+        lead = rows[row][col]
+        rows[row] = [x / lead for x in rows[row]]
+        for r in range(len(rows)):
+            if r != row and rows[r][col]:
+                k = rows[r][col]
+                rows[r] = [x - k * y for x, y in zip(rows[r], rows[row], strict=True)]
+        pivots.append(col)
+
+    # Rows without a pivot must be consistent, i.e. 0 == 0.
+    if any(row[-1] for row in rows[len(pivots) :]):
+        return None
+
+    powers = [Fraction(0)] * len(basis)
+    for row, col in enumerate(pivots):
+        powers[col] = rows[row][-1]
+    return tuple(powers)
@@ -0,0 +1,100 @@
+"""Parse units from strings."""
+
+from __future__ import annotations
+
+__all__ = ["parse_unit", "parse_units", "unit_parse_cache"]
+
+from typing import TYPE_CHECKING
+
+import astropy.units as u
+from astropy.units import UnitBase as APYUnit
+
+from units import diagnostics
+from units._utils import LRUCache
+
+from .core import Unit
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+
+unit_parse_cache: LRUCache[str, Unit] = LRUCache(maxsize=4096)
+"""Cache of parsed unit strings."""
+
+
+def _parse(string: str, /) -> Unit:
+    if diagnostics.active:
+        return Unit(diagnostics.astropy_call("Unit", u.Unit, string))
+    return Unit(u.Unit(string))
+
+
+def parse_unit(unit: str | APYUnit | Unit, /) -> Unit:
+    """Get the `~units.Unit` for a unit or unit string.
+
+    Parameters
+    ----------
+    unit : str or `~astropy.units.UnitBase` or `~units.Unit`
+        The unit. Strings are parsed by astropy and cached.
+
+    Returns
+    -------
+    `~units.Unit`
+        The interned unit.
+
+    """
+    if isinstance(unit, Unit):
+        return unit
+    if isinstance(unit, str):
+        return unit_parse_cache.get_or_compute(unit, _parse)
+    if isinstance(unit, APYUnit):
+        return Unit(unit)
+    msg = f"Cannot parse {unit!r} as a unit."
+    raise TypeError(msg)
+
+
+def parse_units(units: Iterable[str | APYUnit | Unit], /) -> list[Unit]:
+    """Get the `~units.Unit` for each of many units or unit strings.
+
+    Each distinct string is parsed only once, e.g. when ingesting a schema
+    with thousands of columns sharing a handful of units.
+
+    Parameters
+    ----------
+    units : iterable of str or `~astropy.units.UnitBase` or `~units.Unit`
+        The units.
+
+    Returns
+    -------
+    list[`~units.Unit`]
+        The interned units, in order.
+
+    """
+    parsed: dict[str | APYUnit | Unit, Unit] = {}
+    out = []
+    for unit in units:
+        if unit not in parsed:
+            parsed[unit] = parse_unit(unit)
+        out.append(parsed[unit])
+    return out
+
+
+def _seed(*units: APYUnit) -> None:
+    # Pre-populate the cache under each unit's names and string form.
+    for unit in units:
+        wrapped = Unit(unit)
+        for key in (unit.to_string(), *getattr(unit, "names", ())):
+            unit_parse_cache[key] = wrapped
+
+
+# The units of the builtin unit-system realizations.
+_seed(
+    u.dimensionless_unscaled,
+    u.kpc,
+    u.Myr,
+    u.Msun,
+    u.radian,
+    u.km / u.s,
+    u.au,
+    u.yr,
+    u.deg,
+)
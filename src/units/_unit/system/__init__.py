@@ -29,15 +29,23 @@ SOFTWARE.
 
 from __future__ import annotations
 
+from typing import Any
+
 from . import base, builtin, core, realizations
 from .base import *
 from .builtin import *
 from .compare import *
 from .core import *
-from .realizations import *
 
+# The realizations are not star-imported, so they stay lazy.
 __all__ = []
 __all__ += base.__all__
 __all__ += core.__all__
 __all__ += builtin.__all__
-__all__ += realizations.__all__
+
+
+def __getattr__(name: str) -> Any:
+    if name in realizations.__all__:
+        return getattr(realizations, name)
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
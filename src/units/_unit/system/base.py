@@ -4,18 +4,29 @@ from __future__ import annotations
 
 __all__ = ["AbstractUnitSystem", "UNITSYSTEMS_REGISTRY"]
 
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from types import MappingProxyType
-from typing import ClassVar, get_args, get_type_hints
+from typing import TYPE_CHECKING, Any, ClassVar, TypeVar, get_args, get_type_hints
+
+from astropy.units import UnitConversionError, dimensionless_unscaled
 
 from units._dimension.core import Dimension
 from units._dimension.system import DimensionSystem
 from units._dimension.utils import get_dimension_name
 from units._unit.core import Unit
+from units._unit.decompose import DimensionVector, solve
 from units.api import UnitSystem as UnitSystemAPI
 
 from .utils import is_annotated
 
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from units.api import Quantity as QuantityAPI
+
+K = TypeVar("K")
+
 _UNITSYSTEMS_REGISTRY: dict[tuple[Dimension, ...], type[AbstractUnitSystem]] = {}
 UNITSYSTEMS_REGISTRY = MappingProxyType(_UNITSYSTEMS_REGISTRY)
 
@@ -28,6 +39,15 @@ class AbstractUnitSystem(UnitSystemAPI):
     _dimension_system: ClassVar[DimensionSystem]
 
     _registry: dict[Dimension, Unit] = field(init=False, repr=False)
+    _base_units: tuple[Unit, ...] = field(init=False, repr=False, compare=False)
+    _dimensions_: tuple[Dimension, ...] = field(init=False, repr=False, compare=False)
+    _dimension_set: frozenset[Dimension] = field(init=False, repr=False, compare=False)
+    _units_by_dimension: dict[Dimension, Unit] = field(
+        init=False, repr=False, compare=False
+    )
+    _units_by_vector: dict[DimensionVector, Unit] = field(
+        init=False, repr=False, compare=False
+    )
 
     def __init_subclass__(cls) -> None:
         # Register class with a tuple of it's dimensions.
@@ -85,13 +105,34 @@ class AbstractUnitSystem(UnitSystemAPI):
         _UNITSYSTEMS_REGISTRY[dimensions] = cls
 
     def __post_init__(self) -> None:
-        registry = {unit.dimensions: unit for unit in self.base_units}
+        base_units = tuple(getattr(self, k) for k in self._base_field_names)
+        object.__setattr__(self, "_base_units", base_units)
+
+        registry = {unit.dimensions: unit for unit in base_units}
         object.__setattr__(self, "_registry", registry)
+        object.__setattr__(self, "_dimensions_", tuple(registry))
+        object.__setattr__(self, "_dimension_set", frozenset(registry))
+
+        # The system's unit for each dimension (vector), filled in as derived
+        # dimensions are looked up. Base units are direct matches.
+        object.__setattr__(self, "_units_by_dimension", dict(registry))
+        units_by_vector: dict[DimensionVector, Unit] = {}
+        for unit in base_units:
+            if unit.dimension_vector is not None:
+                units_by_vector.setdefault(unit.dimension_vector, unit)
+        object.__setattr__(self, "_units_by_vector", units_by_vector)
+
+    def __reduce__(self) -> tuple[Any, tuple[Unit, ...]]:
+        # Rebuilt (and interned) by `unitsystem`, which also recreates the
+        # class of a dynamically made unit system.
+        from .core import unitsystem
+
+        return (unitsystem, self.base_units)
 
     @property
     def base_units(self) -> tuple[Unit, ...]:  # type: ignore[override]
         """List of core units."""
-        return tuple(getattr(self, k) for k in self._base_field_names)
+        return self._base_units
 
     @property
     def dimension_system(self) -> DimensionSystem:
@@ -101,4 +142,104 @@ class AbstractUnitSystem(UnitSystemAPI):
     @property
     def _dimensions(self) -> tuple[Dimension, ...]:
         """Dimensions of the unit system."""
-        return tuple(self._registry.keys())
+        return self._dimensions_
+
+    def __getitem__(self, key: Dimension | str | Unit) -> Unit:
+        """Get the unit of this system for a dimension.
+
+        Parameters
+        ----------
+        key : Dimension or str or Unit
+            The dimension, the name of a dimension, or a unit with that
+            dimension. Derived dimensions, e.g. ``"energy"``, are expressed
+            in the base units.
+
+        Returns
+        -------
+        Unit
+            The unit of this system.
+
+        """
+        if isinstance(key, Unit):
+            return self._unit_for(key)
+
+        dimension = Dimension(key)
+        try:
+            return self._units_by_dimension[dimension]
+        except KeyError:
+            pass
+        unit = self._unit_for(Unit(dimension.si_unit))
+        return self._units_by_dimension.setdefault(dimension, unit)
+
+    # ===============================================================
+    # Conversion
+
+    def _unit_for(self, unit: Unit, /) -> Unit:
+        """Get the unit of this system with the same dimensions as ``unit``.
+
+        A base unit with the same dimensions is used if there is one,
+        otherwise a product of powers of the base units, e.g. ``kpc / Myr``.
+        Results are cached per dimension.
+        """
+        vector = unit.dimension_vector
+        if vector is None:
+            msg = f"cannot decompose {unit} onto the units of {self}"
+            raise UnitConversionError(msg)
+        try:
+            return self._units_by_vector[vector]
+        except KeyError:
+            pass
+
+        bases = [b for b in self.base_units if b.dimension_vector is not None]
+        powers = solve([b.dimension_vector for b in bases], vector)  # type: ignore[misc]
+        if powers is None:
+            msg = f"{unit} is not expressible in the units of {self}"
+            raise UnitConversionError(msg)
+
+        result = Unit(dimensionless_unscaled)
+        for base, power in zip(bases, powers, strict=True):
+            if power:
+                result = result * base ** (
+                    int(power) if power.denominator == 1 else power
+                )
+        return self._units_by_vector.setdefault(vector, result)
+
+    def convert(
+        self,
+        quantities: Mapping[K, QuantityAPI] | Iterable[QuantityAPI],
+        /,
+        *,
+        value: bool = False,
+    ) -> dict[K, Any] | list[Any]:
+        """Convert many quantities to the units of this system.
+
+        The target unit and conversion factor are computed once per distinct
+        unit, not once per quantity.
+
+        Parameters
+        ----------
+        quantities : Mapping[Any, Quantity] or Iterable[Quantity]
+            The quantities to convert.
+        value : bool, optional keyword-only
+            If `True`, return the converted values instead of quantities.
+
+        Returns
+        -------
+        dict or list
+            The converted quantities (or values), a `dict` with the same keys
+            if ``quantities`` is a mapping, otherwise a `list`.
+
+        """
+        targets: dict[Unit, Unit] = {}
+
+        def convert(q: QuantityAPI) -> Any:
+            unit = q.unit
+            try:
+                target = targets[unit]
+            except KeyError:
+                target = targets[unit] = self._unit_for(unit)
+            return q.to_unit_value(target) if value else q.to_unit(target)
+
+        if isinstance(quantities, Mapping):
+            return {k: convert(q) for k, q in quantities.items()}
+        return [convert(q) for q in quantities]
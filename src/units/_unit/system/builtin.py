@@ -49,6 +49,9 @@ class DimensionlessUnitSystem(AbstractUnitSystem):
             msg = "DimensionlessUnitSystem must have a dimensionless unit"
             raise ValueError(msg)
 
+    def __reduce__(self) -> tuple[type[DimensionlessUnitSystem], tuple[()]]:
+        return (type(self), ())
+
     def __str__(self) -> str:
         return "UnitSystem(dimensionless)"
 
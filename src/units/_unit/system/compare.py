@@ -4,14 +4,20 @@ from __future__ import annotations
 
 __all__: list[str] = ["equivalent"]
 
+from typing import Any
+
+from units._utils import MultipleDispatch
+
 from .base import AbstractUnitSystem
 
 
-# TODO: make this singledispatch. Would prefer multiple dispatch.
-def equivalent(a: AbstractUnitSystem, b: AbstractUnitSystem, /) -> bool:
+@MultipleDispatch
+def equivalent(a: Any, b: Any, /) -> bool:
     """Check if two units are equivalent."""
-    if not isinstance(a, AbstractUnitSystem) or not isinstance(b, AbstractUnitSystem):  # type: ignore[redundant-expr]
-        msg = f"Expected `AbstractUnitSystem`, got {type(a)}, {type(b)}."  # type: ignore[unreachable]
-        raise TypeError(msg)
+    msg = f"Expected `AbstractUnitSystem`, got {type(a)}, {type(b)}."
+    raise TypeError(msg)
+
 
-    return set(a._dimensions) == set(b._dimensions)
+@equivalent.register(AbstractUnitSystem, AbstractUnitSystem)
+def _equivalent_unitsystems(a: AbstractUnitSystem, b: AbstractUnitSystem, /) -> bool:
+    return a is b or a._dimension_set == b._dimension_set
@@ -2,19 +2,29 @@
 
 from __future__ import annotations
 
-__all__ = ["unitsystem"]
+__all__ = ["unitsystem", "unitsystem_cache"]
 
 
 from dataclasses import make_dataclass
-from typing import cast
+from threading import Lock
+from typing import TYPE_CHECKING, Annotated, cast
 
 from astropy.units import UnitBase as APYUnit  # noqa: TCH002
 
 from units._dimension.utils import get_dimension_name
 from units._unit.core import Unit
+from units._utils import LRUCache
 
 from .base import UNITSYSTEMS_REGISTRY, AbstractUnitSystem
 
+if TYPE_CHECKING:
+    from units._dimension.core import Dimension
+
+unitsystem_cache: LRUCache[tuple[Unit, ...], AbstractUnitSystem] = LRUCache(maxsize=256)
+"""Cache of unit systems made by `unitsystem`, keyed on the units."""
+
+_CLASS_LOCK = Lock()  # so a class is only made once per dimension tuple
+
 
 def unitsystem(*units: AbstractUnitSystem | Unit | APYUnit) -> AbstractUnitSystem:
     """Create a new unit system from the given units.
@@ -43,25 +53,41 @@ def unitsystem(*units: AbstractUnitSystem | Unit | APYUnit) -> AbstractUnitSyste
         raise TypeError(msg)
 
     units = cast("tuple[Unit, ...]", units)
+    return unitsystem_cache.get_or_compute(units, _make_unitsystem)
+
 
+def _make_unitsystem(units: tuple[Unit, ...], /) -> AbstractUnitSystem:
+    return _unitsystem_class(tuple(x.dimensions for x in units))(*units)
+
+
+def _unitsystem_class(dimensions: tuple[Dimension, ...], /) -> type[AbstractUnitSystem]:
+    """Get the unit system class for the dimensions, making it if needed.
+
+    Classes register themselves in `UNITSYSTEMS_REGISTRY` when they are made,
+    so each combination of dimensions gets a single class.
+    """
     # Check if the unit system is already registered
-    base_dimensions = tuple(x.dimensions for x in units)
-    if base_dimensions in UNITSYSTEMS_REGISTRY:
-        return UNITSYSTEMS_REGISTRY[base_dimensions](*units)
-
-    # Otherwise, create a new unit system
-    # dimension names of all the units
-    dim_names = tuple(get_dimension_name(x) for x in units)
-    # name: physical types joined by underscores
-    cls_name = "".join(x.capitalize() for x in dim_names) + "UnitSystem"
-    # fields: name, unit
-    fields = [(n, Unit) for n in dim_names]
-    # make the dataclass
-    unitsystem_cls: type[AbstractUnitSystem] = make_dataclass(
-        cls_name,
-        fields,
-        bases=(AbstractUnitSystem,),
-        frozen=True,
-    )
-
-    return unitsystem_cls(*units)
+    if dimensions in UNITSYSTEMS_REGISTRY:
+        return UNITSYSTEMS_REGISTRY[dimensions]
+
+    with _CLASS_LOCK:
+        if dimensions in UNITSYSTEMS_REGISTRY:  # made by another thread
+            return UNITSYSTEMS_REGISTRY[dimensions]
+
+        # Otherwise, create a new unit system
+        # dimension names of all the units
+        dim_names = tuple(get_dimension_name(x) for x in dimensions)
+        # name: physical types joined by underscores
+        cls_name = "".join(x.capitalize() for x in dim_names) + "UnitSystem"
+        # fields: name, unit annotated with its dimension
+        fields = [
+            (n, Annotated[Unit, d]) for n, d in zip(dim_names, dimensions, strict=True)
+        ]
+        # make the dataclass, which registers it
+        return make_dataclass(
+            cls_name,
+            fields,
+            bases=(AbstractUnitSystem,),
+            namespace={"__module__": __name__},
+            frozen=True,
+        )
@@ -1,22 +1,53 @@
-"""Realizations of unit systems."""
+"""Realizations of unit systems.
+
+The realizations are built on first access (PEP 562), not on import.
+"""
 
 from __future__ import annotations
 
 __all__ = ["dimensionless", "galactic", "solarsystem"]
 
+from typing import TYPE_CHECKING
+
 import astropy.units as u
 
 from units._unit.core import Unit
 
 from .builtin import DimensionlessUnitSystem, LTMAUnitSystem, LTMAVUnitSystem
 
-# Dimensionless. This is a singleton.
-dimensionless = DimensionlessUnitSystem()
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from .base import AbstractUnitSystem
+
+
+def _galactic() -> LTMAVUnitSystem:
+    return LTMAVUnitSystem(
+        Unit(u.kpc), Unit(u.Myr), Unit(u.Msun), Unit(u.radian), Unit(u.km / u.s)
+    )
+
+
+def _solarsystem() -> LTMAUnitSystem:
+    return LTMAUnitSystem(Unit(u.au), Unit(u.yr), Unit(u.Msun), Unit(u.radian))
+
+
+_BUILDERS: dict[str, Callable[[], AbstractUnitSystem]] = {
+    # Dimensionless. This is a singleton.
+    "dimensionless": DimensionlessUnitSystem,
+    # Galactic unit system
+    "galactic": _galactic,
+    # Solar system units
+    "solarsystem": _solarsystem,
+}
+
 
-# Galactic unit system
-galactic = LTMAVUnitSystem(
-    Unit(u.kpc), Unit(u.Myr), Unit(u.Msun), Unit(u.radian), Unit(u.km / u.s)
-)
+def __getattr__(name: str) -> AbstractUnitSystem:
+    try:
+        builder = _BUILDERS[name]
+    except KeyError:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg) from None
 
-# Solar system units
-solarsystem = LTMAUnitSystem(Unit(u.au), Unit(u.Msun), Unit(u.yr), Unit(u.radian))
+    value = builder()
+    globals()[name] = value  # cache, so __getattr__ isn't called again
+    return value
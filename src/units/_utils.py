@@ -4,9 +4,16 @@ from __future__ import annotations
 
 __all__: list[str] = []
 
-from typing import Any, ClassVar, TypeVar
+from collections import OrderedDict
+from threading import Lock
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, NamedTuple, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable
 
 T = TypeVar("T")
+K = TypeVar("K", bound="Hashable")
+V = TypeVar("V")
 
 
 # ============================================================================
@@ -26,3 +33,173 @@ class SingletonMeta(type):
             instances[cls] = instance
 
         return instances[cls]
+
+
+# ============================================================================
+
+
+class CacheInfo(NamedTuple):
+    """Cache statistics, mirroring :func:`functools.lru_cache`."""
+
+    hits: int
+    misses: int
+    maxsize: int | None
+    currsize: int
+
+
+class LRUCache(Generic[K, V]):
+    """Bounded, thread-safe, least-recently-used cache.
+
+    Parameters
+    ----------
+    maxsize : int or None, optional
+        Maximum number of entries. `None` means unbounded. ``0`` disables
+        storage (every lookup is a miss).
+
+    """
+
+    def __init__(self, maxsize: int | None = 128) -> None:
+        self._data: OrderedDict[K, V] = OrderedDict()
+        self._lock = Lock()
+        self._maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.enabled = True
+
+    @property
+    def maxsize(self) -> int | None:
+        """Maximum number of entries."""
+        return self._maxsize
+
+    @maxsize.setter
+    def maxsize(self, value: int | None) -> None:
+        if value is not None and value < 0:
+            msg = f"maxsize must be None or non-negative, not {value}."
+            raise ValueError(msg)
+        with self._lock:
+            self._maxsize = value
+            self._evict()
+
+    def get_or_compute(self, key: K, func: Callable[[K], V], /) -> V:
+        """Return the cached value for ``key``, computing it on a miss.
+
+        ``func`` is called outside the lock, so it may itself use the cache.
+        Exceptions raised by ``func`` propagate and nothing is stored.
+        """
+        if not self.enabled:
+            return func(key)
+
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+            else:
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+
+        value = func(key)
+        self[key] = value
+        return value
+
+    def __setitem__(self, key: K, value: V) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._evict()
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def _evict(self) -> None:
+        # Must be called with the lock held.
+        if self._maxsize is None:
+            return
+        while len(self._data) > self._maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all entries and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the cache statistics."""
+        with self._lock:
+            return CacheInfo(self.hits, self.misses, self._maxsize, len(self._data))
+
+
+# ============================================================================
+
+
+class MultipleDispatch(Generic[V]):
+    """Dispatch a function on the types of all its positional arguments.
+
+    Like `functools.singledispatch`, but for every positional argument. The
+    registered implementation whose types are closest, by MRO, to those of
+    the arguments is used, and the choice is cached per tuple of types.
+
+    Examples
+    --------
+    >>> @MultipleDispatch
+    ... def combine(a, b):
+    ...     raise TypeError
+    >>> @combine.register(int, int)
+    ... def _(a, b):
+    ...     return a + b
+    >>> combine(1, 2)
+    3
+
+    """
+
+    def __init__(self, default: Callable[..., V], /) -> None:
+        self.default = default
+        self.registry: dict[tuple[type, ...], Callable[..., V]] = {}
+        self._dispatch_cache: dict[tuple[type, ...], Callable[..., V]] = {}
+        self.__doc__ = default.__doc__
+        self.__name__ = default.__name__
+        self.__wrapped__ = default
+
+    def register(self, *types: type) -> Callable[[Callable[..., V]], Callable[..., V]]:
+        """Register an implementation for the argument types."""
+
+        def decorator(func: Callable[..., V]) -> Callable[..., V]:
+            self.registry[types] = func
+            self._dispatch_cache.clear()
+            return func
+
+        return decorator
+
+    def dispatch(self, *types: type) -> Callable[..., V]:
+        """Get the implementation for the argument types."""
+        try:
+            return self._dispatch_cache[types]
+        except KeyError:
+            pass
+
+        best, best_distance = self.default, None
+        for signature, func in self.registry.items():
+            if len(signature) != len(types) or not all(
+                issubclass(t, s) for t, s in zip(types, signature, strict=True)
+            ):
+                continue
+            # Virtual subclasses, e.g. of ABCs, count as furthest away.
+            distance = sum(
+                t.__mro__.index(s) if s in t.__mro__ else len(t.__mro__)
+                for t, s in zip(types, signature, strict=True)
+            )
+            if best_distance is None or distance < best_distance:
+                best, best_distance = func, distance
+
+        self._dispatch_cache[types] = best
+        return best
+
+    def __call__(self, *args: Any, **kwargs: Any) -> V:
+        return self.dispatch(*map(type, args))(*args, **kwargs)
@@ -70,8 +70,8 @@ class UnitSystem(Protocol):
     def dimension_system(self) -> DimensionSystem:
         """Dimension system."""
 
-    # def __getitem__(self, key: str | Unit | Dimension) -> Unit:
-    #     ...
+    def __getitem__(self, key: str | Unit | Dimension) -> Unit:
+        """Get the unit of the system for a dimension."""
 
     def __len__(self) -> int:
         return len(self.base_units)
@@ -0,0 +1,191 @@
+"""Runtime diagnostics of the unit bookkeeping.
+
+Counts, and optionally times, what `units` does on top of the array math:
+
+- ``conversions``: conversion factors looked up, per ``"from -> to"`` pair.
+- ``dispatches``: interface lookups, per interface.
+- ``created``: Quantities, and new (not interned) Units and Dimensions.
+- ``astropy_calls``: calls into astropy, e.g. to parse or convert units.
+- ``bytes_allocated``: bytes of the arrays allocated by conversions. Only
+  eager (e.g. NumPy) results count: lazy ones, e.g. Dask, allocate nothing.
+- ``times`` (with ``timers=True``): seconds spent scaling values
+  (``"scale"``) and in astropy (``"astropy"``).
+
+Collection is off by default. Each instrumented point then only checks
+whether `active` is empty. Collection is scoped with `collect`, and covers
+all threads while the context is open.
+
+Examples
+--------
+>>> import numpy as np
+>>> import units
+>>> from units import diagnostics
+>>> q = units.Quantity(np.arange(3.0), unit="km")
+>>> with diagnostics.collect() as stats:
+...     _ = q.to_unit_value("m")
+>>> stats.as_dict()["conversions"]
+{'km -> m': 1}
+
+"""
+
+from __future__ import annotations
+
+__all__ = ["Diagnostics", "collect"]
+
+import time
+from collections import Counter
+from contextlib import contextmanager
+from threading import Lock
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+T = TypeVar("T")
+
+_LOCK = Lock()
+
+active: tuple[Diagnostics, ...] = ()
+"""The collections being recorded into. Empty when collection is off."""
+
+
+class Diagnostics:
+    """Counters, and optionally timers, of one collection.
+
+    Parameters
+    ----------
+    timers : bool, optional keyword-only
+        Whether to time the scaling of values and the calls into astropy.
+
+    """
+
+    def __init__(self, *, timers: bool = False) -> None:
+        """Make empty counters and timers."""
+        self.timers = timers
+        self.conversions: Counter[tuple[Any, Any]] = Counter()
+        self.dispatches: Counter[str] = Counter()
+        self.created: Counter[str] = Counter()
+        self.astropy_calls: Counter[str] = Counter()
+        self.bytes_allocated = 0
+        self.times: Counter[str] = Counter()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.as_dict()!r})"
+
+    def reset(self) -> None:
+        """Zero all the counters and timers."""
+        with _LOCK:
+            for counter in (
+                self.conversions,
+                self.dispatches,
+                self.created,
+                self.astropy_calls,
+                self.times,
+            ):
+                counter.clear()
+            self.bytes_allocated = 0
+
+    def as_dict(self) -> dict[str, Any]:
+        """Export the counters and timers, with string keys.
+
+        Returns
+        -------
+        dict[str, Any]
+            The ``conversions``, ``dispatches``, ``created`` and
+            ``astropy_calls`` counts, ``bytes_allocated`` and the ``times``
+            [s].
+
+        """
+        with _LOCK:
+            return {
+                "conversions": {
+                    f"{_unit_string(a)} -> {_unit_string(b)}": n
+                    for (a, b), n in self.conversions.items()
+                },
+                "dispatches": dict(self.dispatches),
+                "created": dict(self.created),
+                "astropy_calls": dict(self.astropy_calls),
+                "bytes_allocated": self.bytes_allocated,
+                "times": dict(self.times),
+            }
+
+
+def _unit_string(unit: Any, /) -> str:
+    return str(unit.wrapped.to_string())
+
+
+@contextmanager
+def collect(*, timers: bool = False) -> Iterator[Diagnostics]:
+    """Collect diagnostics within a context.
+
+    Contexts can be nested: each collection gets everything recorded while
+    it is open.
+
+    Parameters
+    ----------
+    timers : bool, optional keyword-only
+        Whether to also time the scaling of values and the calls into
+        astropy.
+
+    Yields
+    ------
+    Diagnostics
+        The collection. It can be read after the context is closed.
+
+    """
+    global active  # noqa: PLW0603
+    stats = Diagnostics(timers=timers)
+    with _LOCK:
+        active = (*active, stats)
+    try:
+        yield stats
+    finally:
+        with _LOCK:
+            active = tuple(d for d in active if d is not stats)
+
+
+# ============================================================================
+# Recording. These are only called when `active` is not empty.
+
+
+def count(counter: str, key: Hashable, /) -> None:
+    """Increment a counter of the active collections, e.g. ``created``."""
+    with _LOCK:
+        for stats in active:
+            getattr(stats, counter)[key] += 1
+
+
+def _timed(timer: str, func: Callable[..., T], /, *args: Any, **kwargs: Any) -> T:
+    """Call a function, timing it for the collections with timers."""
+    timed = [stats for stats in active if stats.timers]
+    if not timed:
+        return func(*args, **kwargs)
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        elapsed = time.perf_counter() - start
+        with _LOCK:
+            for stats in timed:
+                stats.times[timer] += elapsed
+
+
+def astropy_call(name: str, func: Callable[..., T], /, *args: Any) -> T:
+    """Call into astropy, counting (and timing) the call."""
+    count("astropy_calls", name)
+    return _timed("astropy", func, *args)
+
+
+def scale(interface: Any, value: Any, factor: float, *, out: Any = None) -> Any:
+    """Scale a value with its interface, recording the allocated bytes.
+
+    Only eager interfaces allocate: the bytes of lazy results, e.g. Dask
+    arrays, are not counted.
+    """
+    result = _timed("scale", interface.scale, value, factor, out=out)
+    if out is None and interface.eager:
+        nbytes = int(getattr(result, "nbytes", 0))
+        with _LOCK:
+            for stats in active:
+                stats.bytes_allocated += nbytes
+    return result
@@ -0,0 +1,23 @@
+"""xarray support.
+
+Importing this module registers the ``.qty`` accessor of xarray DataArrays
+and Datasets, which converts them using the unit in their
+``attrs["units"]``:
+
+>>> import numpy as np
+>>> import xarray as xr
+>>> import units.xarray
+>>> x = xr.DataArray(np.arange(3.0), attrs={"units": "km"})
+>>> x.qty.to_unit("m").attrs["units"]
+'m'
+
+"""
+
+from __future__ import annotations
+
+__all__ = ["DataArrayQuantityAccessor", "DatasetQuantityAccessor"]
+
+from units._quantity.interface.builtin.xarray.accessor import (
+    DataArrayQuantityAccessor,
+    DatasetQuantityAccessor,
+)
@@ -0,0 +1,166 @@
+"""Test unit conversion."""
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+import units
+from units._utils import LRUCache
+
+
+def test_conversion_factor_cached():
+    km, m = units.Unit(u.km), units.Unit(u.m)
+    units.conversion_cache.clear()
+
+    assert units.conversion_factor(km, m) == 1000.0
+    assert units.conversion_factor(km, m) == 1000.0
+
+    info = units.conversion_cache.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
+
+
+def test_conversion_factor_disabled():
+    km, m = units.Unit(u.km), units.Unit(u.m)
+    units.conversion_cache.clear()
+    units.conversion_cache.enabled = False
+    try:
+        assert units.conversion_factor(km, m) == 1000.0
+        assert units.conversion_cache.cache_info().currsize == 0
+    finally:
+        units.conversion_cache.enabled = True
+
+
+def test_conversion_factor_incompatible():
+    with pytest.raises(u.UnitConversionError):
+        units.conversion_factor(units.Unit(u.km), units.Unit(u.s))
+
+
+def test_to_unit_value():
+    q = units.Quantity(np.arange(3.0), unit=units.Unit(u.km))
+    np.testing.assert_array_equal(q.to_unit_value(units.Unit(u.m)), [0, 1e3, 2e3])
+
+
+def test_lru_cache_eviction():
+    cache = LRUCache[int, int](maxsize=2)
+    for i in range(3):
+        cache.get_or_compute(i, lambda k: k * 2)
+    assert 0 not in cache
+    assert len(cache) == 2
+
+    cache.maxsize = 1
+    assert 1 not in cache
+    assert 2 in cache
+
+
+def test_to_unit_str():
+    q = units.Quantity(np.arange(3.0), unit="km")
+    assert q.unit is units.Unit(u.km)
+    assert q.to_unit("m").unit is units.Unit(u.m)
+
+
+def test_to_unit_value_out():
+    q = units.Quantity(np.arange(3.0), unit="km")
+    out = np.empty(3)
+    assert q.to_unit_value("m", out=out) is out
+    np.testing.assert_array_equal(out, [0, 1e3, 2e3])
+
+    assert q.to_unit_value("km") is q.value
+
+
+def test_to_unit_copy():
+    q = units.Quantity(np.arange(3.0), unit="km")
+    assert q.to_unit("km", copy=False) is q
+    assert q.to_unit("km").value is not q.value
+
+    out = np.empty(3)
+    assert q.to_unit("m", out=out).value is out
+
+
+def test_inplace():
+    value = np.arange(3.0)
+    q = units.Quantity(value, unit="km")
+
+    # The first op copies: the caller's array is not modified.
+    q += units.Quantity(np.ones(3), unit="m")
+    np.testing.assert_array_equal(value, [0, 1, 2])
+
+    # Later ops reuse the copy, which the quantity owns, until it is read.
+    buffer = q.__dict__["_value"]
+    q *= 2
+    q -= units.Quantity(np.ones(3), unit="m")
+    assert q.__dict__["_value"] is buffer
+    np.testing.assert_allclose(q.value, [0.001, 2.001, 4.001])
+
+    read = q.value
+    q += units.Quantity(np.ones(3), unit="km")
+    assert q.__dict__["_value"] is not read
+    np.testing.assert_allclose(read, [0.001, 2.001, 4.001])
+
+
+def test_inplace_aliases():
+    value = np.arange(3.0)
+    a = units.Quantity(value, unit="km")
+    b = a
+    a *= units.Quantity(2.0, unit="s")
+    np.testing.assert_array_equal(b.value, [0, 1, 2])
+    assert b.unit is units.Unit(u.km)
+
+    # Ops changing the unit make a new quantity, even if the value is owned.
+    c = a
+    a /= units.Quantity(2.0, unit="s")
+    assert c is not a
+    np.testing.assert_array_equal(c.value, [0, 2, 4])
+    assert c.unit == units.Unit(u.km * u.s)
+
+    # A value shared with another quantity is copied.
+    d = units.Quantity(a.value, unit=a.unit)
+    a += units.Quantity(1.0, unit=a.unit)
+    np.testing.assert_array_equal(d.value, [0, 1, 2])
+    np.testing.assert_array_equal(a.value, [1, 2, 3])
+
+
+def test_inplace_fallback():
+    value = np.arange(3)  # integer, so can't hold the float result
+    q = units.Quantity(value, unit="km")
+    q += units.Quantity(np.ones(3), unit="m")
+    assert q.value is not value
+    np.testing.assert_array_equal(q.value, [0.001, 1.001, 2.001])
+
+
+def test_to_unit_deferred(monkeypatch):
+    interface = units.Quantity(np.arange(3.0), unit="km").interface
+    calls = []
+    scale = type(interface).scale
+    monkeypatch.setattr(
+        type(interface),
+        "scale",
+        lambda self, value, factor, **kw: calls.append(factor)
+        or scale(self, value, factor, **kw),
+    )
+
+    value = np.arange(3.0)
+    q = units.Quantity(value, unit="km").to_unit("m").to_unit("cm").to_unit("mm")
+    assert calls == []  # no data touched yet
+    assert q.unit is units.Unit(u.mm)
+
+    np.testing.assert_allclose(q.value, [0, 1e6, 2e6])
+    assert calls == [pytest.approx(1e6)]  # one pass, with the composed factor
+    assert q.value is q.value  # applied once
+    np.testing.assert_array_equal(value, [0, 1, 2])  # source unchanged
+
+
+def test_deferred_metadata():
+    # Reading the metadata doesn't apply the pending factor.
+    q = units.Quantity(np.arange(6).reshape(2, 3), unit="km").to_unit("m")
+    assert q.shape == (2, 3)
+    assert q.ndim == 2
+    assert q.size == 6
+    assert q.dtype == np.float64  # of the scaled value
+    assert "_pending" in q.__dict__
+    assert q.value.dtype == q.dtype
+
+
+def test_to_unit_value_deferred():
+    q = units.Quantity(np.arange(3.0), unit="km").to_unit("m")
+    np.testing.assert_allclose(q.to_unit_value("cm"), [0, 1e5, 2e5])
+    np.testing.assert_allclose(q.lazy().to_unit("km").compute().value, [0, 1, 2])
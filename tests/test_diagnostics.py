@@ -0,0 +1,55 @@
+"""Test the runtime diagnostics."""
+
+import numpy as np
+import pytest
+
+import units
+from units import diagnostics
+
+
+def test_disabled():
+    assert diagnostics.active == ()
+    units.Quantity(np.ones(3), unit="km").to_unit_value("m")  # nothing recorded
+
+
+def test_collect():
+    q = units.Quantity(np.arange(4.0), unit="km")
+    with diagnostics.collect(timers=True) as stats:
+        assert diagnostics.active == (stats,)
+        q.to_unit_value("m")
+        q.to_unit("pc").value  # noqa: B018  # a deferred view, scaled on read
+        units.Quantity(np.ones(2), unit="s")
+    assert diagnostics.active == ()
+
+    result = stats.as_dict()
+    assert result["conversions"] == {"km -> m": 1, "km -> pc": 1}
+    assert result["dispatches"]["LegacyNumPyQuantityInterface"] > 0
+    assert result["created"]["Quantity"] == 2  # the view and the new quantity
+    assert result["bytes_allocated"] == 2 * q.value.nbytes
+    assert result["times"]["scale"] > 0
+
+    stats.reset()
+    assert stats.as_dict()["bytes_allocated"] == 0
+
+
+def test_astropy_calls_and_nesting():
+    with diagnostics.collect() as outer:
+        with diagnostics.collect() as inner:
+            units.parse_unit("erg / (s cm2 Angstrom)")  # not yet parsed
+        units.parse_unit("km") * units.parse_unit("fortnight")
+
+    assert inner.as_dict()["astropy_calls"]["Unit"] == 1
+    calls = outer.as_dict()["astropy_calls"]
+    assert calls["Unit"] == 2
+    assert calls["UnitBase.__mul__"] == 1
+    assert outer.as_dict()["created"]["Unit"] >= 2
+    assert inner.as_dict()["times"] == {}  # no timers
+
+
+def test_lazy_bytes_not_counted():
+    da = pytest.importorskip("dask.array")
+    q = units.Quantity(da.ones(1_000, chunks=100), unit="km")
+    with diagnostics.collect() as stats:
+        q.to_unit_value("m")
+    assert stats.as_dict()["conversions"] == {"km -> m": 1}
+    assert stats.as_dict()["bytes_allocated"] == 0  # nothing computed
@@ -0,0 +1,54 @@
+"""Test the lazy import of the package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import units
+from units import _dimension, _quantity, _unit
+
+
+def test_import_is_lazy():
+    code = (
+        "import sys, units; "
+        "print(' '.join(m for m in ('astropy', 'numpy', 'dask') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],  # noqa: S603  # this interpreter, fixed code
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
+def test_lazy_attrs():
+    expected = {}
+    for module in (_dimension, _unit, _quantity):
+        expected.update(dict.fromkeys(module.__all__, module.__name__))
+    assert set(units.__all__) == {"__version__", *expected}
+    assert set(units.__all__) == {"__version__", *units._LAZY_ATTRS}
+
+    for name, module in expected.items():
+        assert getattr(units, name) is getattr(sys.modules[module], name)
+
+
+def test_missing_attr():
+    with pytest.raises(AttributeError, match="no_such_thing"):
+        _ = units.no_such_thing
+
+
+def test_lazy_interfaces():
+    code = (
+        "import dask.dataframe as dd, pandas as pd, sys, units; "
+        "q = units.Quantity(dd.from_pandas(pd.DataFrame({'a': [1.0]}), 1), 'm'); "
+        "print(type(q.interface).__name__)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],  # noqa: S603  # this interpreter, fixed code
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == "DaskDataFrameInterface"
@@ -0,0 +1,69 @@
+"""Test saving and loading Quantities as ``.npy`` files."""
+
+import io
+
+import numpy as np
+import pytest
+
+import units
+
+
+def test_roundtrip(tmp_path):
+    path = tmp_path / "q.npy"
+    q = units.Quantity(np.arange(5.0), unit="km / s")
+    units.save(path, q)
+
+    np.testing.assert_array_equal(np.load(path), q.value)  # a plain .npy file
+
+    result = units.load(path)
+    assert isinstance(result.value, np.memmap)
+    assert result.unit == q.unit
+    np.testing.assert_array_equal(result.value, q.value)
+
+    result = units.load(path, mmap_mode=None)
+    assert not isinstance(result.value, np.memmap)
+
+
+def test_file_object():
+    buf = io.BytesIO()
+    units.save(buf, units.Quantity(np.arange(3.0), unit="m"))
+    buf.seek(0)
+    np.testing.assert_array_equal(np.load(buf), [0, 1, 2])
+
+
+def test_convert_into_memmap(tmp_path):
+    path = tmp_path / "out.npy"
+    q = units.Quantity(np.arange(3.0), unit="km")
+    out = units.open_memmap(path, "w+", unit="m", shape=q.shape)
+    q.to_unit_value(out.unit, out=out.value)
+    out.value.flush()
+
+    result = units.open_memmap(path, "r")
+    assert result.unit == units.parse_unit("m")
+    np.testing.assert_array_equal(result.value, [0, 1e3, 2e3])
+
+
+def test_errors(tmp_path):
+    path = tmp_path / "plain.npy"
+    np.save(path, np.arange(3))
+    with pytest.raises(ValueError, match="no unit"):
+        units.load(path)
+
+    with pytest.raises(ValueError, match="unit and a shape"):
+        units.open_memmap(tmp_path / "new.npy", "w+")
+
+
+def test_dimension(tmp_path):
+    # Units with several dimension names store the first, in every process,
+    # and load with any of them.
+    path = tmp_path / "q.npy"
+    units.save(path, units.Quantity(np.arange(3.0), unit="J"))
+    data = path.read_bytes()
+    assert b"dimension: energy" in data
+
+    path.write_bytes(data.replace(b"dimension: energy", b"dimension: torque"))
+    assert units.load(path).unit == units.parse_unit("J")
+
+    path.write_bytes(data.replace(b"dimension: energy", b"dimension: length"))
+    with pytest.raises(ValueError, match="stored dimension 'length'"):
+        units.load(path)
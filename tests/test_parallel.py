@@ -0,0 +1,43 @@
+"""Test the multithreaded backend."""
+
+import numpy as np
+import pytest
+
+import units
+from units._quantity import array_namespace
+
+
+@pytest.fixture()
+def backend():
+    backend = units.parallel_backend
+    min_size, max_workers = backend.min_size, backend._max_workers
+    backend.enabled, backend.min_size, backend.max_workers = True, 10, 3
+    yield backend
+    backend.enabled, backend.min_size = False, min_size
+    backend.max_workers = max_workers
+
+
+def test_disabled():
+    assert units.parallel_backend.apply(np.cos, np.ones(1 << 21)) is None
+
+
+@pytest.mark.parametrize(
+    "value", [np.arange(100.0), np.arange(100.0).reshape(10, 10).T]
+)
+@pytest.mark.usefixtures("backend")
+def test_to_unit_value(value):
+    q = units.Quantity(value, unit="km")
+    np.testing.assert_array_equal(q.to_unit_value("m"), value * 1e3)
+
+    out = np.empty_like(value)
+    assert q.to_unit_value("m", out=out) is out
+    np.testing.assert_array_equal(out, value * 1e3)
+
+
+def test_elementwise(backend):
+    q = units.Quantity(np.linspace(0, 3, 100), unit="rad")
+    np.testing.assert_allclose(array_namespace.cos(q).value, np.cos(q.value))
+    np.testing.assert_allclose(array_namespace.sin(q).value, np.sin(q.value))
+
+    assert backend.apply(np.cos, np.ones(5)) is None  # below min_size
+    assert backend.apply(np.cos, [1.0] * 100) is None  # not an ndarray
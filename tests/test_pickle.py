@@ -0,0 +1,47 @@
+"""Test pickling."""
+
+import pickle
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+import units
+
+
+@pytest.mark.parametrize(
+    "unit", [u.km / u.s, u.Msun, u.dimensionless_unscaled, u.Unit(1 / 3 * u.m)]
+)
+def test_unit(unit):
+    x = units.Unit(unit)
+    assert pickle.loads(pickle.dumps(x)) is x
+
+
+def test_quantity_out_of_band():
+    q = units.Quantity(np.arange(1e5), unit="km")
+    buffers = []
+    data = pickle.dumps(q, protocol=5, buffer_callback=buffers.append)
+    assert len(data) < 1000  # the values aren't in the stream
+    assert len(buffers) == 1
+
+    result = pickle.loads(data, buffers=buffers)
+    assert result.unit is q.unit
+    assert np.shares_memory(result.value, q.value)
+
+
+def test_deferred_and_angle():
+    q = units.Quantity(np.arange(3.0), unit="km").to_unit("m")
+    result = pickle.loads(pickle.dumps(q, protocol=5))
+    np.testing.assert_array_equal(result.value, [0, 1e3, 2e3])
+
+    a = units.Longitude(np.array([1.0, 2.0]), unit="deg")
+    result = pickle.loads(pickle.dumps(a))
+    assert type(result) is units.Longitude
+    assert result.wrap_angle.unit is a.wrap_angle.unit
+
+
+def test_unitsystem():
+    assert pickle.loads(pickle.dumps(units.galactic)) == units.galactic
+    assert pickle.loads(pickle.dumps(units.dimensionless)) is units.dimensionless
+    system = units.unitsystem(units.Unit(u.m), units.Unit(u.s))
+    assert pickle.loads(pickle.dumps(system)) is system
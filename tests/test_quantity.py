@@ -0,0 +1,218 @@
+"""Test the Quantity class."""
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+import units
+
+
+def test_shared_interface():
+    q1 = units.Quantity(np.arange(3.0), unit="km")
+    q2 = units.Quantity(np.arange(2.0), unit="s")
+    assert q1.interface is q2.interface
+    assert "interface" not in vars(q1)
+
+
+def test_registered_interface_class():
+    from units._quantity.interface.builtin import LegacyNumPyQuantityInterface
+    from units._quantity.interface.funcs import get_interface
+
+    class Value(np.ndarray):
+        pass
+
+    # Registered functions return the interface class, which is shared.
+    get_interface.register(Value)(lambda _: LegacyNumPyQuantityInterface)
+    q = units.Quantity(np.ones(2).view(Value), unit="km")
+    assert q.interface is units.Quantity(np.ones(2), unit="km").interface
+
+
+def test_interface_dunders_deprecated():
+    from units._quantity.interface import AbstractQuantityInterface
+
+    class Value:
+        pass
+
+    with pytest.warns(DeprecationWarning, match="override add"):
+
+        class _Interface(AbstractQuantityInterface[Value], register=Value):
+            def __add__(self, other):
+                return NotImplemented
+
+
+def test_unsupported_value():
+    with pytest.raises(TypeError, match="Cannot get interface"):
+        units.Quantity(object(), unit="km")
+
+
+def test_arithmetic():
+    q = units.Quantity(np.arange(3.0), unit="km")
+    m = units.Quantity(np.ones(3), unit="m")
+
+    np.testing.assert_array_equal((q + m).value, [0.001, 1.001, 2.001])
+    np.testing.assert_array_equal((q - m).value, [-0.001, 0.999, 1.999])
+    assert (q * m).unit is units.Unit(u.km * u.m)
+    assert (q / m).unit is units.Unit(u.km / u.m)
+    assert (q**2).unit is units.Unit(u.km**2)
+
+
+def test_forwarding():
+    q = units.Quantity(np.ones((2, 3)), unit="km")
+    assert q.shape == (2, 3)
+    assert q._wrapped_ is q.value
+
+
+def test_forwarding_interface_methods():
+    dd = pytest.importorskip("dask.dataframe")
+    pd = pytest.importorskip("pandas")
+
+    q = units.Quantity(dd.from_pandas(pd.DataFrame({"a": [1.0]}), 1), unit="km")
+    # Only the interface's quantity methods are bound to the quantity.
+    assert q.to_dask_array().unit is q.unit
+    assert q.add.__self__ is q.value
+
+
+def test_angle_wrap_at():
+    a = units.Angle(np.array([400.0, -10.0]), unit="deg")
+    np.testing.assert_allclose(a.wrap_at().value, [40.0, 350.0])
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_lazy(chunksize):
+    a = units.Quantity(np.arange(5.0), unit="km")
+    b = units.Quantity(np.full(5, 500.0), unit="m")
+    c = units.Quantity(np.full(5, 2.0), unit="s")
+
+    expr = (a.lazy() + b) * 2 / c
+    assert expr.unit is units.Unit(u.km / u.s)
+
+    result = expr.compute(chunksize=chunksize)
+    np.testing.assert_allclose(result.value, (np.arange(5.0) + 0.5) * 2 / 2.0)
+    converted = expr.to_unit("m / s").compute()
+    np.testing.assert_allclose(converted.value, result.value * 1e3)
+
+
+@pytest.mark.parametrize("chunksize", [None, 2])
+def test_lazy_integers(chunksize):
+    # The ufuncs choose the dtypes, e.g. dividing integers gives floats, so
+    # integer temporaries are not reused for the results.
+    a = units.Quantity(np.arange(1, 6), unit="m")
+    b = units.Quantity(np.full(5, 2), unit="s")
+
+    result = (a.lazy() / b.lazy()).compute(chunksize=chunksize)
+    np.testing.assert_array_equal(result.value, (a / b).value)
+
+    result = (a.lazy() * b.lazy() / b.lazy()).compute(chunksize=chunksize)
+    assert result.value.dtype == np.float64
+    np.testing.assert_array_equal(result.value, np.arange(1, 6))
+    np.testing.assert_allclose(
+        ((a.lazy() * b.lazy()) ** 0.5).compute().value, np.sqrt(np.arange(2, 12, 2))
+    )
+
+
+def test_result_unit():
+    km = units.Unit(u.km)
+    units.result_unit_cache.clear()
+    assert units.result_unit("add", km, units.Unit(u.m)) is km
+    assert units.result_unit("add", km, units.Unit(u.m)) is km
+    assert units.result_unit_cache.cache_info().hits == 1
+    assert units.result_unit("cos", units.Unit(u.deg)) is units.Unit(u.one)
+    with pytest.raises(ValueError, match="not defined"):
+        units.result_unit("cos", km)
+
+
+@pytest.fixture()
+def _test_rules():
+    """Remove the ``test.*`` result unit rules registered by a test."""
+    from units._quantity.up import _RESULT_UNIT_RULES
+
+    yield
+    for op in [op for op in _RESULT_UNIT_RULES if op.startswith("test.")]:
+        del _RESULT_UNIT_RULES[op]
+    units.result_unit_cache.clear()
+
+
+@pytest.mark.usefixtures("_test_rules")
+def test_register_result_unit():
+    @units.register_result_unit("test.norm", None)
+    def _any(units_):
+        return units_[0]
+
+    @units.register_result_unit("test.norm", units.length)
+    def _length(units_):
+        return units_[0] ** 2
+
+    assert units.result_unit("test.norm", units.Unit(u.s)) is units.Unit(u.s)
+    assert units.result_unit("test.norm", units.Unit(u.m)) is units.Unit(u.m**2)
+
+
+@pytest.mark.usefixtures("_test_rules")
+def test_register_result_unit_precedence():
+    # The most specific rule is used, whatever the registration order.
+    m, s = units.Unit(u.m), units.Unit(u.s)
+    units.register_result_unit("test.product", None, None)(lambda x: x[0] * x[1])
+    units.register_result_unit("test.product", units.length, None)(lambda x: x[0])
+    units.register_result_unit("test.product", None, units.time)(lambda x: x[1])
+
+    assert units.result_unit("test.product", s, m) is units.Unit(u.s * u.m)
+    assert units.result_unit("test.product", m, m) is m
+    assert units.result_unit("test.product", s, s) is s
+    assert units.result_unit("test.product", m, s) is m  # a tie: the first
+
+
+def test_multiple_dispatch():
+    from numbers import Number
+
+    from units._utils import MultipleDispatch
+
+    @MultipleDispatch
+    def f(_a, _b):
+        return "default"
+
+    f.register(Number, Number)(lambda _a, _b: "number")
+    f.register(int, int)(lambda _a, _b: "int")
+
+    assert f(1, 2) == "int"
+    assert f(1.0, 2) == "number"
+    assert f("a", 2) == "default"
+
+
+def test_dask_conversions_fold():
+    da = pytest.importorskip("dask.array")
+
+    x = da.arange(6.0, chunks=3)
+    q = units.Quantity(x, unit="km")
+    for unit in ("m", "pc", "cm", "km"):
+        q = q.to_unit(unit)
+    result = q + units.Quantity(x, unit="m")
+
+    # One layer for ``x`` and one for the conversions and the addition.
+    assert len(result.value.dask.layers) == 2
+    np.testing.assert_allclose(result.value.compute(), np.arange(6.0) * 1.001)
+    assert result.unit is units.Unit(u.km)
+
+
+def test_columnar():
+    pd = pytest.importorskip("pandas")
+    dd = pytest.importorskip("dask.dataframe")
+
+    frame = pd.DataFrame({"x": [1.0, 2.0], "v": [1.0, 2.0], "id": [1, 2]})
+    for value in (frame, dd.from_pandas(frame, npartitions=2)):
+        cat = units.ColumnarQuantity(value, {"x": "pc", "v": "kpc / Myr"})
+        assert cat.to_unit({"x": "pc"}) is cat  # nothing to convert
+
+        converted = cat.to_unit(units.galactic)
+        assert converted.units == {"x": units.Unit(u.kpc), "v": units.Unit(u.km / u.s)}
+        result = converted.value
+        if hasattr(result, "compute"):
+            result = result.compute()
+        np.testing.assert_allclose(result["x"], [1e-3, 2e-3])
+        np.testing.assert_allclose(result["v"], [977.792221, 1955.584443])
+        np.testing.assert_array_equal(result["id"], [1, 2])
+
+        assert converted["x"].unit is units.Unit(u.kpc)
+        assert dict(converted[["x", "id"]].units) == {"x": units.Unit(u.kpc)}
+        assert converted[converted.value["id"] > 1].units == converted.units
+
+    with pytest.raises(ValueError, match="not in the frame"):
+        units.ColumnarQuantity(frame, {"y": "m"})
@@ -0,0 +1,64 @@
+"""Test shared-memory quantities."""
+
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import pytest
+
+import units
+
+
+def _convert(x, out):
+    x.to_unit_value(out.unit, out=out.value)
+    return len(x.value)
+
+
+def test_roundtrip():
+    q = units.Quantity(np.arange(4.0), unit="km")
+    with units.shared_quantity(q) as shared:
+        assert shared.owner
+        assert shared.unit == q.unit
+        np.testing.assert_array_equal(shared.value, q.value)
+
+        attached = pickle.loads(pickle.dumps(shared))  # noqa: S301  # our own pickle
+        assert len(pickle.dumps(shared)) < 1000
+        assert not attached.owner
+        attached.value[0] = 10  # the same memory
+        assert shared.value[0] == 10
+        attached.close()
+
+    with pytest.raises(ValueError, match="closed"):
+        shared.quantity  # noqa: B018
+
+
+def test_close_with_references():
+    shared = units.shared_quantity(np.arange(3.0), "m")
+    value = shared.value
+    with pytest.raises(BufferError, match="still referenced"):
+        shared.close()
+    del value
+    shared.close()
+    shared.unlink()
+
+    # Exiting the context frees the memory, even if it can't be closed.
+    with pytest.raises(BufferError), units.shared_quantity(np.ones(3), "m") as shared:
+        _value = shared.value  # still referenced when exiting
+    with pytest.raises(FileNotFoundError):
+        SharedMemory(name=shared.handle.name)
+
+
+def test_shared_map():
+    x = units.shared_quantity(np.arange(100.0), "km")
+    out = units.SharedQuantity.empty(x.value.shape, "m")
+    with x, out, ProcessPoolExecutor(2) as executor:
+        lengths = units.shared_map(_convert, x, out, executor=executor, chunks=3)
+        assert lengths == [33, 33, 34]
+        np.testing.assert_array_equal(out.value, np.arange(100.0) * 1e3)
+
+        with (
+            units.shared_quantity(np.ones(3), "m") as other,
+            pytest.raises(ValueError, match="different lengths"),
+        ):
+            units.shared_map(_convert, x, other)
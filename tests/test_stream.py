@@ -0,0 +1,99 @@
+"""Test streaming conversion."""
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import units
+
+
+def _chunks(n):
+    for i in range(n):
+        yield np.full(3, float(i))
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("pool", [False, True])
+def test_convert_stream(prefetch, pool):
+    with ThreadPoolExecutor(2) as executor:
+        stream = units.convert_stream(
+            _chunks(5),
+            "m",
+            from_unit="km",
+            prefetch=prefetch,
+            executor=executor if pool else None,
+        )
+        results = list(stream)
+
+    assert [q.unit for q in results] == [units.parse_unit("m")] * 5
+    for i, q in enumerate(results):
+        np.testing.assert_array_equal(q.value, np.full(3, 1e3 * i))
+
+
+def test_quantity_chunks():
+    chunks = [
+        units.Quantity(np.ones(2), unit="km"),
+        units.Quantity(np.ones(2), unit="pc").to_unit("km"),
+        units.Longitude(np.ones(2), unit="deg"),
+    ]
+    results = list(units.convert_stream(chunks[:2], "m"))
+    np.testing.assert_allclose(results[0].value, 1e3)
+    np.testing.assert_allclose(results[1].value, 3.0856775814913673e16)
+
+    (angle,) = units.convert_stream(chunks[2:], "rad")
+    assert type(angle) is units.Longitude
+
+    with pytest.raises(ValueError, match="from_unit"):
+        list(units.convert_stream([np.ones(2)], "m"))
+
+
+def test_backpressure():
+    read = []
+
+    def source():
+        for i in range(10):
+            read.append(i)
+            yield np.ones(1)
+
+    stream = units.convert_stream(source(), "m", from_unit="km", prefetch=2)
+    next(stream)
+    for _ in range(50):  # let the read-ahead thread fill its queue
+        if len(read) >= 4:
+            break
+        time.sleep(0.01)
+    assert len(read) <= 4  # the one consumed, 2 queued, 1 waiting to be
+    stream.close()
+
+
+def test_errors_propagate():
+    def source():
+        yield np.ones(1)
+        msg = "boom"
+        raise RuntimeError(msg)
+
+    stream = units.convert_stream(source(), "m", from_unit="km", prefetch=1)
+    next(stream)
+    with pytest.raises(RuntimeError, match="boom"):
+        next(stream)
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+@pytest.mark.parametrize("pool", [False, True])
+def test_aconvert_stream(prefetch, pool):
+    async def source():
+        for chunk in _chunks(4):
+            yield chunk
+
+    async def main(executor):
+        stream = units.aconvert_stream(
+            source(), "m", from_unit="km", prefetch=prefetch, executor=executor
+        )
+        return [q async for q in stream]
+
+    with ThreadPoolExecutor(2) as executor:
+        results = asyncio.run(main(executor if pool else None))
+    for i, q in enumerate(results):
+        np.testing.assert_array_equal(q.value, np.full(3, 1e3 * i))
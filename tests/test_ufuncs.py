@@ -0,0 +1,102 @@
+"""Test NumPy ufunc and function support."""
+
+import astropy.units as u
+import numpy as np
+import pytest
+
+import units
+from units._quantity.ufuncs import UFUNC_RULES
+
+
+@pytest.fixture()
+def q():
+    return units.Quantity(np.arange(4.0), unit="km")
+
+
+def test_all_ufuncs_have_rules():
+    ufuncs = {x for name in dir(np) if isinstance(x := getattr(np, name), np.ufunc)}
+    assert ufuncs <= UFUNC_RULES.keys()
+
+
+def test_call(q):
+    m = units.Quantity(np.ones(4), unit="m")
+    np.testing.assert_allclose(np.add(q, m).value, np.arange(4.0) + 1e-3)
+    np.testing.assert_array_equal(np.greater(q, m), [False, True, True, True])
+    assert np.sqrt(q).unit is units.Unit(u.km**0.5)
+    assert np.power(q, 3).unit is units.Unit(u.km**3)
+    assert np.multiply.outer(q, m).unit is units.Unit(u.km * u.m)
+    with pytest.raises(u.UnitConversionError):
+        np.add(q, units.Quantity(1.0, unit="s"))
+
+
+def test_call_angle():
+    a = units.Angle(np.array([0.0, 90.0]), unit="deg")
+    result = np.cos(a)
+    assert type(result) is units.Quantity
+    np.testing.assert_allclose(result.value, [1, 0], atol=1e-15)
+    assert type(a + a) is units.Angle
+
+
+def test_out_and_where(q):
+    out = units.Quantity(np.zeros(4), unit="km")
+    m = units.Quantity(np.ones(4), unit="m")
+    where = np.array([True, False, True, False])
+    assert np.add(q, m, out=out, where=where) is out
+    np.testing.assert_allclose(out.value, [1e-3, 0, 2.001, 0])
+
+
+def test_out_other_unit(q):
+    # The result is converted to the unit of ``out``.
+    out = units.Quantity(np.full(4, -1.0), unit="m")
+    where = np.array([True, True, False, True])
+    assert np.add(q, q, out=out, where=where) is out
+    assert out.unit is units.Unit(u.m)
+    np.testing.assert_allclose(out.value, [0, 2000, -1, 6000])
+
+    assert np.sum(q, out=units.Quantity(np.empty(()), unit="m")).value == 6000
+    with pytest.raises(u.UnitConversionError):
+        np.add(q, q, out=units.Quantity(np.empty(4), unit="s"))
+
+
+def test_reductions(q):
+    assert np.add.reduce(q).value == 6
+    assert np.add.reduce(q).unit is q.unit
+    np.testing.assert_array_equal(np.add.accumulate(q).value, [0, 1, 3, 6])
+    np.testing.assert_array_equal(np.add.reduceat(q, [0, 2]).value, [1, 5])
+    assert np.maximum.reduce(q, initial=units.Quantity(5000.0, unit="m")).value == 5
+    with pytest.raises(ValueError, match="changes the unit"):
+        np.multiply.reduce(q)
+
+
+def test_at(q):
+    np.add.at(q, [0, 1], units.Quantity(1.0, unit="m"))
+    np.testing.assert_allclose(q.value, [1e-3, 1.001, 2, 3])
+    deferred = units.Quantity(np.zeros(3), unit="km").to_unit("m")
+    np.add.at(deferred, [0], units.Quantity(1.0, unit="m"))
+    np.testing.assert_allclose(deferred.value, [1, 0, 0])
+    with pytest.raises(ValueError, match="change the unit"):
+        np.sin.at(units.Quantity(np.zeros(2), unit="rad"), [0])
+
+
+def test_functions(q):
+    assert np.sum(q).value == 6
+    np.testing.assert_array_equal(np.cumsum(q).value, [0, 1, 3, 6])
+    assert np.var(q).unit is units.Unit(u.km**2)
+    assert np.argmax(q) == 3
+    c = np.concatenate([q, units.Quantity(np.ones(1), unit="m")])
+    np.testing.assert_allclose(c.value, [0, 1, 2, 3, 1e-3])
+    with pytest.raises(TypeError, match="no implementation found"):
+        np.fft.fft(q)
+
+
+def test_average(q):
+    weights = units.Quantity(np.arange(1.0, 5.0), unit="s")
+    average = np.average(q, weights=weights)
+    assert average.unit is q.unit
+    assert average.value == pytest.approx(2)
+
+    average, total = np.average(q, weights=weights, returned=True)
+    assert average.unit is q.unit
+    assert total.unit is weights.unit
+    assert total.value == 10
+    assert np.average(q, 0, np.arange(1.0, 5.0)).value == pytest.approx(2)
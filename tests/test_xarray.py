@@ -0,0 +1,50 @@
+"""Test the xarray accessors."""
+
+import numpy as np
+import pytest
+
+import units
+
+xr = pytest.importorskip("xarray")
+da = pytest.importorskip("dask.array")
+
+import units.xarray  # noqa: E402  # registers the accessors
+
+
+def test_dataarray_to_unit():
+    x = xr.DataArray(da.arange(6.0, chunks=3), dims="i", attrs={"units": "km"})
+    assert x.qty.unit is units.parse_unit("km")
+    assert x.units == "km"  # the attribute, not shadowed by the accessor
+    assert x.qty.to_unit("km") is x  # no copy
+
+    y = x.qty.to_unit("m")
+    assert y.chunks == x.chunks  # still lazy, with the same chunks
+    assert y.attrs["units"] == "m"
+    np.testing.assert_allclose(y.values, np.arange(6.0) * 1e3)
+
+    with pytest.raises(ValueError, match="no 'units' attribute"):
+        xr.DataArray(np.ones(2)).qty.to_unit("m")
+
+
+def test_dataset_to_unit():
+    ds = xr.Dataset(
+        {
+            "x": ("i", da.ones(4, chunks=2), {"units": "pc"}),
+            "v": ("i", np.ones(4), {"units": "km / s"}),
+            "n": ("i", np.arange(4)),
+        }
+    )
+    result = ds.qty.to_unit(units.galactic)
+    assert result.qty.units == {
+        "x": units.parse_unit("kpc"),
+        "v": units.parse_unit("km / s"),
+    }
+    assert result["v"].data is ds["v"].data  # already in the right unit
+    assert result["x"].chunks == ds["x"].chunks
+    np.testing.assert_allclose(result["x"].values, 1e-3)
+    assert "units" not in result["n"].attrs
+
+
+def test_quantity_of_dataarray():
+    q = units.Quantity(xr.DataArray(np.arange(3.0)), unit="km")
+    np.testing.assert_allclose(q.to_unit_value("m"), [0, 1e3, 2e3])